@@ -0,0 +1,264 @@
+"""
+This file contains code to resolve fishing battles in the game "Fishing Tycoon" automatically.
+Instead of iterating over every turn, the number of turns, critical hits and whether the sea creature flees are sampled
+from the distributions produced by the turn by turn battle in main().
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import math
+import random
+
+
+# Creating constants used throughout this file
+
+
+CRITICAL_HIT_CHANCE: float = 0.3
+DIRECT_SIMULATION_TURNS: int = 1000  # Battles and samples of at most this many turns are simulated exactly
+# Largest absolute z score of a difference between resolve_battle() and fight_turn_by_turn() which is accepted as
+# chance. With a dozen z scores per verification, a correct implementation fails about once in a thousand seeds.
+MAX_Z_SCORE: float = 4.0
+
+
+# Creating necessary classes
+
+
+class BattleResult:
+    """
+    This class contains attributes of the outcome of a battle against a sea creature.
+    """
+
+    def __init__(self, caught, turns, critical_hits):
+        # type: (bool, int, int) -> None
+        self.caught: bool = caught
+        self.fled: bool = not caught
+        self.turns: int = turns
+        self.critical_hits: int = critical_hits
+
+    def __str__(self):
+        # type: () -> str
+        res: str = ""  # initial value
+        res += "Caught: " + str(self.caught) + "\n"
+        res += "Turns: " + str(self.turns) + "\n"
+        res += "Critical hits: " + str(self.critical_hits) + "\n"
+        return res
+
+
+# Creating static functions to be used throughout this file
+
+
+def sample_binomial(n, p, rng):
+    # type: (int, float, random.Random) -> int
+    if n <= DIRECT_SIMULATION_TURNS:
+        return sum(1 for i in range(n) if rng.random() <= p)
+
+    # Normal approximation, which is very accurate for this many trials
+    mean: float = n * p
+    standard_deviation: float = math.sqrt(n * p * (1 - p))
+    return min(n, max(0, int(round(rng.gauss(mean, standard_deviation)))))
+
+
+def sample_hypergeometric(population, successes, draws, rng):
+    # type: (int, int, int, random.Random) -> int
+    if draws <= 0 or successes <= 0:
+        return 0
+    if successes >= population:
+        return draws
+
+    if draws <= DIRECT_SIMULATION_TURNS:
+        res: int = 0  # initial value
+        remaining_population: int = population
+        remaining_successes: int = successes
+        for i in range(draws):
+            if rng.random() * remaining_population < remaining_successes:
+                res += 1
+                remaining_successes -= 1
+            remaining_population -= 1
+        return res
+
+    # Normal approximation, which is very accurate for this many draws
+    success_ratio: float = successes / population
+    mean: float = draws * success_ratio
+    variance: float = draws * success_ratio * (1 - success_ratio) * (population - draws) / (population - 1)
+    sample: int = int(round(rng.gauss(mean, math.sqrt(max(variance, 0.0)))))
+    return min(draws, successes, max(0, draws - (population - successes), sample))
+
+
+def sample_flee_turn(flee_chance, rng):
+    # type: (float, random.Random) -> float
+    """
+    Returns the first turn where the sea creature's flee roll succeeds, which follows a geometric distribution.
+    """
+    if flee_chance <= 0:
+        return math.inf
+    if flee_chance >= 1:
+        return 1
+    return 1 + math.floor(math.log(1 - rng.random()) / math.log(1 - flee_chance))
+
+
+def fight_turn_by_turn(attack_power, critical_damage, sea_creature, rng=random):
+    # type: (object, object, object, random.Random) -> BattleResult
+    """
+    Attacks the sea creature every turn until it is caught or flees, exactly like the battle in main().
+    critical_damage is None if the player does not use a fishing rod.
+    """
+    turns: int = 0  # initial value
+    critical_hits: int = 0  # initial value
+    sea_creature_flees: bool = False  # initial value
+    while sea_creature.curr_hp > 0 and not sea_creature_flees:
+        turns += 1
+        if critical_damage is not None:
+            is_crit: bool = rng.random() <= CRITICAL_HIT_CHANCE
+            critical_hits += int(is_crit)
+            sea_creature.curr_hp -= attack_power if not is_crit else attack_power * critical_damage
+        else:
+            sea_creature.curr_hp -= attack_power
+
+        sea_creature_flees = rng.random() <= sea_creature.flee_chance
+
+    return BattleResult(sea_creature.curr_hp <= 0, turns, critical_hits)
+
+
+def resolve_battle(attack_power, critical_damage, sea_creature, rng=random):
+    # type: (object, object, object, random.Random) -> BattleResult
+    """
+    Resolves a whole battle against the sea creature in one call, with the same distribution of outcomes as
+    fight_turn_by_turn(). critical_damage is None if the player does not use a fishing rod.
+    The sea creature's HP is reduced by the damage dealt during the battle.
+    """
+    hp_in_attacks: float = float(sea_creature.curr_hp / attack_power)
+    if hp_in_attacks <= 0:
+        return BattleResult(True, 0, 0)
+
+    max_turns: float = math.ceil(hp_in_attacks) if math.isfinite(hp_in_attacks) else math.inf
+    if max_turns <= DIRECT_SIMULATION_TURNS:
+        return fight_turn_by_turn(attack_power, critical_damage, sea_creature, rng)
+
+    # Every turn deals one attack of damage, plus (critical_damage - 1) attacks of damage for a critical hit. The
+    # sea creature can only be caught within min(flee turn, max_turns) turns, so it is caught exactly when the
+    # damage dealt in all of those turns is enough.
+    extra_critical_damage: float = float(critical_damage) - 1 if critical_damage is not None else 0.0
+    flee_turn: float = sample_flee_turn(sea_creature.flee_chance, rng)
+    if math.isinf(flee_turn) and math.isinf(max_turns):
+        raise ValueError("This sea creature can neither be caught nor flee.")
+
+    turns: int = int(min(flee_turn, max_turns))
+    critical_hits: int = sample_binomial(turns, CRITICAL_HIT_CHANCE, rng) if critical_damage is not None else 0
+    caught: bool = turns + critical_hits * extra_critical_damage >= hp_in_attacks
+    if caught:
+        # Finding the turn where the sea creature was caught by bisection. Given the number of critical hits in an
+        # interval of turns, their positions are uniformly random, so the number of critical hits in the first part
+        # of the interval follows a hypergeometric distribution.
+        low_turns: int = 0  # The sea creature is not caught after this many turns
+        low_critical_hits: int = 0
+        while turns - low_turns > 1:
+            middle_turns: int = (low_turns + turns) // 2
+            middle_critical_hits: int = low_critical_hits + sample_hypergeometric(
+                turns - low_turns, critical_hits - low_critical_hits, middle_turns - low_turns, rng)
+            if middle_turns + middle_critical_hits * extra_critical_damage >= hp_in_attacks:
+                turns, critical_hits = middle_turns, middle_critical_hits
+            else:
+                low_turns, low_critical_hits = middle_turns, middle_critical_hits
+
+    damage = attack_power * (turns - critical_hits)
+    if critical_hits > 0:
+        damage += attack_power * critical_damage * critical_hits
+    sea_creature.curr_hp -= damage
+    if caught and sea_creature.curr_hp > 0:
+        # Rounding errors in the float HP ratio must not turn a caught sea creature back into an uncaught one.
+        sea_creature.curr_hp *= 0
+    return BattleResult(caught, turns, critical_hits)
+
+
+def verify_against_turn_by_turn(attack_power, critical_damage, sea_creature, trials, rng):
+    # type: (object, object, object, int, random.Random) -> tuple
+    """
+    Compares catch rate, mean number of turns and mean number of critical hits of resolve_battle() and
+    fight_turn_by_turn() on the given battle. Returns the z scores of the three differences.
+    """
+    samples: list = []
+    for battle_function in (resolve_battle, fight_turn_by_turn):
+        results: list = []
+        for i in range(trials):
+            wild_sea_creature = sea_creature.clone()
+            results.append(battle_function(attack_power, critical_damage, wild_sea_creature, rng))
+        samples.append(results)
+
+    def mean_and_variance(values):
+        # type: (list) -> tuple
+        mean: float = sum(values) / len(values)
+        return mean, sum((value - mean) ** 2 for value in values) / max(len(values) - 1, 1)
+
+    z_scores: list = []
+    for attribute_name in ("caught", "turns", "critical_hits"):
+        (mean1, variance1), (mean2, variance2) = [mean_and_variance([float(getattr(result, attribute_name))
+                                                                     for result in results]) for results in samples]
+        standard_error: float = math.sqrt(variance1 / trials + variance2 / trials)
+        z_scores.append(0.0 if standard_error == 0 else (mean1 - mean2) / standard_error)
+
+    return tuple(z_scores)
+
+
+def create_verification_scenarios():
+    # type: () -> list
+    """
+    Returns the battles used to verify resolve_battle() against fight_turn_by_turn() as tuples of name, attack power,
+    critical damage and sea creature from the catalog. The attack powers are low enough for every battle to last more
+    than DIRECT_SIMULATION_TURNS turns, so that resolve_battle() samples the outcome instead of simulating every turn.
+    """
+    from numeric import num
+    from catalog import Catalog, get_catalog
+
+    catalog: Catalog = get_catalog()
+    sea_creatures: dict = {sea_creature.name: sea_creature for sea_creature in catalog.sea_creatures}
+    critical_damage = catalog.shop.get_fishing_rods_sold()[0].critical_damage  # Of Fishing Rod #1
+    return [
+        # Always caught, in a number of turns depending on the critical hits
+        ("Pegaklesk, Fishing Rod #1", num("8"), critical_damage, sea_creatures["Pegaklesk"]),
+        # Always caught after exactly 1429 turns
+        ("Pegaklesk, no fishing rod", num("7"), None, sea_creatures["Pegaklesk"]),
+        # Always flees, after a geometrically distributed number of turns
+        ("Sunup, no fishing rod", num("50"), None, sea_creatures["Sunup"]),
+        ("Siledraor, Fishing Rod #1", num("5000"), critical_damage, sea_creatures["Siledraor"])
+    ]
+
+
+def main(argv=None):
+    """
+    This main function compares automatically resolved battles with turn by turn battles and exits with an error if
+    any difference is larger than chance explains.
+    :param argv: list of command line arguments, defaults to sys.argv[1:]
+    :return: None
+    """
+
+    import argparse
+    import sys
+    from numeric import num, set_numeric_backend
+    from fishing_tycoon import SeaCreature
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Fishing Tycoon auto battle verification")
+    parser.add_argument("--trials", type=int, default=5000, help="number of battles per scenario")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--max-z", type=float, default=MAX_Z_SCORE,
+                        help="largest absolute z score accepted as chance")
+    args: argparse.Namespace = parser.parse_args(argv)
+    set_numeric_backend("float")  # Keeps the turn by turn battles fast enough to run many trials
+
+    rng: random.Random = random.Random(args.seed)
+    consistent: bool = True  # initial value
+    print("{:<32}{:>16}{:>16}{:>18}".format("Scenario", "Catch rate z", "Mean turns z", "Critical hits z"))
+    for name, attack_power, critical_damage, sea_creature in create_verification_scenarios():
+        z_scores: tuple = verify_against_turn_by_turn(attack_power, critical_damage, sea_creature, args.trials, rng)
+        print("{:<32}{:>16.2f}{:>16.2f}{:>18.2f}".format(name, *z_scores))
+        consistent = consistent and all(abs(z_score) <= args.max_z for z_score in z_scores)
+    print("|z| up to " + str(args.max_z) + " means the distributions are consistent.")
+
+    keoyhu = SeaCreature("Keoyhu", num("1e49"), num("2e48"), num("1e48"), num("1e48"), 0.45)
+    print("Keoyhu against 500 attack power:\n" + str(resolve_battle(num("500"), num("1.5"), keoyhu, rng)))
+    if not consistent:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
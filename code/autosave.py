@@ -0,0 +1,161 @@
+"""
+This file contains the autosave system of the game "Fishing Tycoon".
+Changes to the player are detected with the player's change count, and snapshots of the game are written from a
+background thread, so that the game never waits for the disk.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import os
+import threading
+from save_format import encode_game_data
+from fishing_tycoon import Game, load_game_data
+
+
+# Creating static functions to be used throughout this file
+
+
+def write_file_atomically(file_name, data):
+    # type: (str, bytes) -> None
+    """
+    Writes the data to a temporary file next to the given file and renames it, so that the file is never left
+    partially written, even if the game is killed while saving.
+    """
+    # The temporary file name is unique for every thread, so that concurrent saves never share a temporary file.
+    temporary_file_name: str = file_name + ".tmp-" + str(os.getpid()) + "-" + str(threading.get_ident())
+    mode: int = os.stat(file_name).st_mode & 0o777 if os.path.exists(file_name) else 0o666
+    try:
+        with os.fdopen(os.open(temporary_file_name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC |
+                               getattr(os, "O_BINARY", 0), mode), "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_file_name, file_name)
+    except BaseException:
+        if os.path.exists(temporary_file_name):
+            os.remove(temporary_file_name)
+        raise
+
+
+def get_checkpoint_file_name(file_name, index):
+    # type: (str, int) -> str
+    return file_name + "." + str(index)
+
+
+def rotate_checkpoints(file_name, checkpoints):
+    # type: (str, int) -> None
+    """
+    Keeps the given number of older versions of the file as file_name.1 (newest) to file_name.<checkpoints> (oldest).
+    """
+    if checkpoints <= 0 or not os.path.exists(file_name):
+        return
+
+    for index in range(checkpoints - 1, 0, -1):
+        if os.path.exists(get_checkpoint_file_name(file_name, index)):
+            os.replace(get_checkpoint_file_name(file_name, index), get_checkpoint_file_name(file_name, index + 1))
+
+    # The file is linked (or copied) instead of renamed, so that it exists at all times.
+    newest_checkpoint_file_name: str = get_checkpoint_file_name(file_name, 1)
+    if os.path.exists(newest_checkpoint_file_name):
+        os.remove(newest_checkpoint_file_name)
+    try:
+        os.link(file_name, newest_checkpoint_file_name)
+    except OSError:
+        import shutil
+        shutil.copy2(file_name, newest_checkpoint_file_name)
+
+
+def get_save_file_names(file_name, checkpoints):
+    # type: (str, int) -> list
+    """
+    Returns the names of the existing saved game data files, starting with the newest one.
+    """
+    file_names: list = [file_name] + [get_checkpoint_file_name(file_name, index)
+                                      for index in range(1, checkpoints + 1)]
+    return [name for name in file_names if os.path.exists(name)]
+
+
+def load_newest_game_data(file_names):
+    # type: (list) -> tuple
+    """
+    Loads the first of the given saved game data files which can be read, falling back to the next one (e.g. the
+    newest checkpoint) if a file cannot be read. Returns the game, or None if no file can be read, and a list of
+    (file name, error) pairs of the files which could not be read.
+    """
+    errors: list = []
+    for file_name in file_names:
+        try:
+            return load_game_data(file_name), errors
+        except (OSError, ValueError, EOFError) as error:
+            errors.append((file_name, error))
+    return None, errors
+
+
+# Creating necessary classes
+
+
+class Autosaver:
+    """
+    This class contains attributes of the autosave system of a game.
+    Code changing the game must hold the lock, which is only held by the autosaver while taking a snapshot of the game
+    in memory. Writing the snapshot to the disk happens without holding the lock.
+    """
+
+    def __init__(self, game, file_name, interval=60.0, checkpoints=3):
+        # type: (Game, str, float, int) -> None
+        self.game: Game = game
+        self.file_name: str = file_name
+        self.interval: float = interval
+        self.checkpoints: int = checkpoints
+        self.lock: threading.RLock = threading.RLock()
+        self.__saved_change_count: int or None = None  # initial value
+        self.__write_lock: threading.Lock = threading.Lock()
+        self.__stop_event: threading.Event = threading.Event()
+        self.__thread: threading.Thread or None = None  # initial value
+
+    def is_dirty(self):
+        # type: () -> bool
+        return self.game.player.change_count != self.__saved_change_count
+
+    def start(self):
+        # type: () -> None
+        if self.interval > 0 and self.__thread is None:
+            self.__thread = threading.Thread(target=self.__run, name="Autosaver", daemon=True)
+            self.__thread.start()
+
+    def __run(self):
+        # type: () -> None
+        # All changes made during an interval are saved together by the next snapshot.
+        while not self.__stop_event.wait(self.interval):
+            self.save()
+
+    def save(self, force=False):
+        # type: (bool) -> bool
+        """
+        Saves a snapshot of the game if the player changed since the last save (or if force is True).
+        Returns whether a snapshot was saved.
+        """
+        with self.__write_lock:
+            with self.lock:
+                if not force and not self.is_dirty():
+                    return False
+                change_count: int = self.game.player.change_count
+                data: bytes = encode_game_data(self.game)
+
+            rotate_checkpoints(self.file_name, self.checkpoints)
+            write_file_atomically(self.file_name, data)
+            self.__saved_change_count = change_count
+            return True
+
+    def stop(self, final_save=True):
+        # type: (bool) -> None
+        """
+        Stops the background thread and saves the game one last time.
+        """
+        self.__stop_event.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+        if final_save:
+            self.save(force=True)
@@ -0,0 +1,203 @@
+"""
+This file contains a headless Monte Carlo simulator used to balance the economy of the game "Fishing Tycoon".
+It estimates catch rate, number of turns and EXP and income gained per minute of fishing for every combination of
+fishing rod, body of water and player level, by simulating many battles at once with NumPy arrays.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import argparse
+import time
+import numpy as np
+from auto_battle import CRITICAL_HIT_CHANCE
+from fishing_tycoon import Player, FishingRod, BodyOfWater, BodyOfWaterIndex, Shop, SpawnTable, \
+    create_sea_creatures, create_bodies_of_water, create_shop, triangular_product
+
+
+# Creating necessary classes
+
+
+class BalanceScenario:
+    """
+    This class contains attributes of a combination of fishing rod, body of water and player level to simulate.
+    """
+
+    def __init__(self, fishing_rod, body_of_water, player_level):
+        # type: (FishingRod or None, BodyOfWater, int) -> None
+        self.fishing_rod: FishingRod or None = fishing_rod
+        self.body_of_water: BodyOfWater = body_of_water
+        self.player_level: int = player_level
+
+    def get_attack_power(self):
+        # type: () -> float
+        # Attack power of a player at this level (see Player.level_up()) with the fishing rod equipped
+        player_attack_power: float = float(Player("").attack_power) * \
+            float(triangular_product(2, self.player_level))
+        if self.fishing_rod is not None:
+            return player_attack_power + float(self.fishing_rod.attack_power)
+        return player_attack_power
+
+    def get_critical_damage(self):
+        # type: () -> float
+        return float(self.fishing_rod.critical_damage) if self.fishing_rod is not None else 1.0
+
+
+class BalanceSummary:
+    """
+    This class contains the simulated statistics of a balance scenario.
+    """
+
+    def __init__(self, scenario, encounters, catch_rate, mean_turns, exp_per_minute, income_per_minute):
+        # type: (BalanceScenario, int, float, float, float, float) -> None
+        self.scenario: BalanceScenario = scenario
+        self.encounters: int = encounters
+        self.catch_rate: float = catch_rate
+        self.mean_turns: float = mean_turns
+        self.exp_per_minute: float = exp_per_minute
+        self.income_per_minute: float = income_per_minute  # Coins per second of passive income gained per minute
+
+
+# Creating static functions to be used throughout this file
+
+
+def create_scenarios(bodies_of_water, shop, player_levels):
+    # type: (list, Shop, list) -> list
+    """
+    Returns every combination of fishing rod (including no fishing rod), body of water and player level where the
+    player is allowed to fish in the body of water.
+    """
+    res: list = []
+    body_of_water_index: BodyOfWaterIndex = BodyOfWaterIndex(bodies_of_water)
+    for player_level in player_levels:
+        for i in body_of_water_index.get_unlocked_indices(player_level):
+            body_of_water: BodyOfWater = bodies_of_water[i]
+            for fishing_rod in [None] + shop.get_fishing_rods_sold():
+                res.append(BalanceScenario(fishing_rod, body_of_water, player_level))
+    return res
+
+
+def simulate(scenarios, encounters_per_scenario, rng, seconds_per_turn=2.0, seconds_per_encounter=5.0,
+             max_turns=10000):
+    # type: (list, int, np.random.Generator, float, float, int) -> list
+    """
+    Simulates encounters_per_scenario battles for every scenario, where the player attacks every turn until the sea
+    creature is caught or flees, following the same rules as the battle in main(). All battles are simulated at
+    once, one turn at a time, on the battles that are still going on. Battles lasting longer than max_turns are
+    counted as failed catches.
+    """
+    # Flattening the sea creatures of every scenario into arrays
+    creature_offsets: list = []
+    creature_counts: list = []
+    max_hps: list = []
+    flee_chances: list = []
+    catch_exp_rewards: list = []
+    coins_per_seconds: list = []
+    spawn_probabilities: list = []
+    spawn_aliases: list = []
+    for scenario in scenarios:
+        sea_creatures: list = scenario.body_of_water.get_potential_sea_creatures()
+        spawn_table: SpawnTable = scenario.body_of_water.get_spawn_table()
+        spawn_probabilities += spawn_table.probabilities
+        spawn_aliases += [len(max_hps) + alias for alias in spawn_table.aliases]
+        creature_offsets.append(len(max_hps))
+        creature_counts.append(len(sea_creatures))
+        for sea_creature in sea_creatures:
+            max_hps.append(float(sea_creature.max_hp))
+            flee_chances.append(float(sea_creature.flee_chance))
+            catch_exp_rewards.append(float(sea_creature.catch_exp_reward))
+            coins_per_seconds.append(float(sea_creature.coins_per_second))
+
+    # Spawning a random sea creature of the scenario's body of water for every encounter
+    scenario_indices: np.ndarray = np.repeat(np.arange(len(scenarios)), encounters_per_scenario)
+    creature_indices: np.ndarray = np.asarray(creature_offsets)[scenario_indices] + \
+        (rng.random(len(scenario_indices)) * np.asarray(creature_counts)[scenario_indices]).astype(np.int64)
+    # Like SpawnTable.sample(), keeping the sea creature drawn with its probability and taking its alias otherwise
+    creature_indices = np.where(rng.random(len(scenario_indices)) < np.asarray(spawn_probabilities)[creature_indices],
+                                creature_indices, np.asarray(spawn_aliases)[creature_indices])
+    attack_powers: np.ndarray = np.asarray([scenario.get_attack_power() for scenario in scenarios])
+    critical_damages: np.ndarray = np.asarray([scenario.get_critical_damage() for scenario in scenarios])
+
+    hps: np.ndarray = np.asarray(max_hps)[creature_indices]
+    turns: np.ndarray = np.zeros(len(scenario_indices), dtype=np.int64)
+    caught: np.ndarray = np.zeros(len(scenario_indices), dtype=bool)
+
+    # Simulating one turn of every battle which is still going on until all battles are over
+    active: np.ndarray = np.arange(len(scenario_indices))
+    for turn in range(1, max_turns + 1):
+        if len(active) == 0:
+            break
+
+        active_scenarios: np.ndarray = scenario_indices[active]
+        is_crit: np.ndarray = rng.random(len(active)) <= CRITICAL_HIT_CHANCE
+        damage: np.ndarray = attack_powers[active_scenarios] * np.where(is_crit, critical_damages[active_scenarios],
+                                                                         1.0)
+        hps[active] -= damage
+        turns[active] = turn
+        flees: np.ndarray = rng.random(len(active)) <= np.asarray(flee_chances)[creature_indices[active]]
+        caught_now: np.ndarray = hps[active] <= 0
+        caught[active[caught_now]] = True
+        active = active[~caught_now & ~flees]
+
+    # Summarising the battles of every scenario
+    minutes: np.ndarray = np.bincount(scenario_indices, weights=turns * seconds_per_turn + seconds_per_encounter,
+                                      minlength=len(scenarios)) / 60
+    catches: np.ndarray = np.bincount(scenario_indices, weights=caught, minlength=len(scenarios))
+    total_turns: np.ndarray = np.bincount(scenario_indices, weights=turns, minlength=len(scenarios))
+    exp_gained: np.ndarray = np.bincount(scenario_indices, weights=np.where(
+        caught, np.asarray(catch_exp_rewards)[creature_indices], 0.0), minlength=len(scenarios))
+    income_gained: np.ndarray = np.bincount(scenario_indices, weights=np.where(
+        caught, np.asarray(coins_per_seconds)[creature_indices], 0.0), minlength=len(scenarios))
+
+    return [BalanceSummary(scenario, encounters_per_scenario, catches[i] / encounters_per_scenario,
+                           total_turns[i] / encounters_per_scenario, exp_gained[i] / minutes[i],
+                           income_gained[i] / minutes[i]) for i, scenario in enumerate(scenarios)]
+
+
+def format_summaries(summaries):
+    # type: (list) -> str
+    res: str = ""  # initial value
+    res += "{:<18}{:<18}{:>6}{:>12}{:>12}{:>14}{:>18}\n".format(
+        "Fishing Rod", "Body of Water", "Level", "Catch Rate", "Mean Turns", "EXP/min", "Coins/s per min")
+    for summary in summaries:
+        scenario: BalanceScenario = summary.scenario
+        res += "{:<18}{:<18}{:>6}{:>11.1%}{:>12.2f}{:>14.3e}{:>18.3e}\n".format(
+            scenario.fishing_rod.name if scenario.fishing_rod is not None else "None",
+            scenario.body_of_water.name, scenario.player_level, summary.catch_rate, summary.mean_turns,
+            summary.exp_per_minute, summary.income_per_minute)
+    return res
+
+
+def main(argv=None):
+    """
+    This main function is used to run the balance simulator.
+    :param argv: list of command line arguments, defaults to sys.argv[1:]
+    :return: None
+    """
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Fishing Tycoon balance simulator")
+    parser.add_argument("--encounters", type=int, default=20000, help="number of encounters per scenario")
+    parser.add_argument("--levels", type=str, default="1,5,10", help="comma separated list of player levels")
+    parser.add_argument("--seconds-per-turn", type=float, default=2.0,
+                        help="number of seconds the player needs for one turn of a battle")
+    parser.add_argument("--seconds-per-encounter", type=float, default=5.0,
+                        help="number of seconds the player needs to find a sea creature")
+    parser.add_argument("--seed", type=int, default=None, help="random seed")
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    sea_creatures: list = create_sea_creatures()
+    bodies_of_water: list = create_bodies_of_water(sea_creatures)
+    shop: Shop = create_shop()
+    scenarios: list = create_scenarios(bodies_of_water, shop, [int(level) for level in args.levels.split(",")])
+
+    start: float = time.perf_counter()
+    summaries: list = simulate(scenarios, args.encounters, np.random.default_rng(args.seed), args.seconds_per_turn,
+                               args.seconds_per_encounter)
+    elapsed: float = time.perf_counter() - start
+    print(format_summaries(summaries))
+    print("Simulated " + str(len(scenarios) * args.encounters) + " encounters in " + str(round(elapsed, 2)) +
+          " seconds.")
+
+
+if __name__ == '__main__':
+    main()
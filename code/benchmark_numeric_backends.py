@@ -0,0 +1,83 @@
+"""
+This file contains a benchmark comparing the numeric backends of the game "Fishing Tycoon".
+It measures how many combat turns and player level ups can be processed per second with each numeric backend.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import argparse
+import random
+import time
+from numeric import NUMERIC_BACKENDS, num, set_numeric_backend
+from fishing_tycoon import Player, FishingRod, SeaCreature
+
+
+# Creating static functions to be used in this benchmark
+
+
+def benchmark_combat_turns(turns):
+    # type: (int) -> float
+    """
+    Returns the number of combat turns per second, using the same damage and flee rules as the fishing loop in main().
+    """
+    player: Player = Player("Benchmark")
+    fishing_rod: FishingRod = FishingRod("Fishing Rod #1", num("1e3"), num("1e5"))
+    player.add_fishing_rod(fishing_rod)
+    wild_sea_creature: SeaCreature = SeaCreature("Keoyhu", num("1e49"), num("2e48"), num("1e48"), num("1e48"), 0.45)
+    rng: random.Random = random.Random(0)
+    start: float = time.perf_counter()
+    for i in range(turns):
+        is_crit: bool = rng.random() <= 0.3
+        damage = player.attack_power if not is_crit else player.attack_power * player.fishing_rod.critical_damage
+        wild_sea_creature.curr_hp -= damage
+        sea_creature_flees: bool = rng.random() <= wild_sea_creature.flee_chance
+        if wild_sea_creature.curr_hp <= 0 or sea_creature_flees:
+            wild_sea_creature.curr_hp = wild_sea_creature.max_hp
+
+    return turns / (time.perf_counter() - start)
+
+
+def benchmark_level_ups(repetitions):
+    # type: (int) -> float
+    """
+    Returns the number of player level ups per second. Each repetition levels a player from level 1 to level 19,
+    which stays within the range supported by the float backend.
+    """
+    player: Player = Player("Benchmark")
+    levels_gained: int = 0  # initial value
+    start: float = time.perf_counter()
+    for i in range(repetitions):
+        player.level = 1
+        player.attack_power = num("500")
+        player.required_exp = num("1e6")
+        player.exp = num("1e200")
+        player.level_up()
+        levels_gained += player.level - 1
+
+    return levels_gained / (time.perf_counter() - start)
+
+
+def main(argv=None):
+    """
+    This main function is used to run the benchmark.
+    :param argv: list of command line arguments, defaults to sys.argv[1:]
+    :return: None
+    """
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Fishing Tycoon numeric backend benchmark")
+    parser.add_argument("--turns", type=int, default=200000, help="number of combat turns per backend")
+    parser.add_argument("--level-up-repetitions", type=int, default=5000,
+                        help="number of times a player is levelled from level 1 to level 19 per backend")
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    print("{:<12}{:>22}{:>22}".format("Backend", "Combat turns/s", "Level ups/s"))
+    for backend_name in sorted(NUMERIC_BACKENDS):
+        set_numeric_backend(backend_name)
+        combat_turns_per_second: float = benchmark_combat_turns(args.turns)
+        level_ups_per_second: float = benchmark_level_ups(args.level_up_repetitions)
+        print("{:<12}{:>22,.0f}{:>22,.0f}".format(backend_name, combat_turns_per_second, level_ups_per_second))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,254 @@
+"""
+This file contains the benchmark suite of the game "Fishing Tycoon".
+It builds synthetic games with aquariums of different sizes, many fishing rods and a high player level, times the
+operations the game performs most often and writes the results as JSON. The results can be compared against a
+baseline JSON file written by an earlier run to catch performance regressions.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from game_engine import GameEngine
+from numeric import NUMERIC_BACKENDS, get_numeric_backend, set_numeric_backend
+from save_format import create_benchmark_game
+from fishing_tycoon import Game, Player, SeaCreature, load_game_data, save_game_data, write_lines
+
+
+# Creating constants used throughout this file
+
+
+BENCHMARK_NAMES: list = ["gain_exp_after_time", "gain_coins_after_time", "level_up", "catch_sea_creature",
+                         "player_str", "player_stats_summary", "game_clone", "save_game_data", "load_game_data",
+                         "fishing_encounter"]
+
+
+# Creating static functions to be used throughout this file
+
+
+def create_synthetic_game(aquarium_size, fishing_rods, player_level):
+    # type: (int, int, int) -> Game
+    """
+    Returns a game whose player owns the given number of fishing rods and sea creatures and has reached the given
+    level. The player is levelled up one level at a time, so that EXP, attack power and required EXP are exactly
+    what the game itself would produce.
+    """
+    game: Game = create_benchmark_game(aquarium_size, fishing_rods)
+    player: Player = game.player
+    while player.level < player_level:
+        player.exp = player.required_exp
+        player.level_up()
+    player.exp *= 0
+    return game
+
+
+def time_operation(operation, min_time, max_calls, prepare=None):
+    # type: (callable, float, int, callable or None) -> dict
+    """
+    Calls the operation until min_time seconds have passed (at least 3 times unless a single call takes longer than
+    min_time, and at most max_calls times) and returns statistics of the seconds taken per call. prepare is called
+    before every call without being timed, so that every call starts from the same state no matter how many calls
+    are made.
+    """
+    durations: list = []
+    total: float = 0.0  # initial value
+    while len(durations) < max_calls and (total < min_time or len(durations) < 3):
+        if prepare is not None:
+            prepare()
+        start: float = time.perf_counter()
+        operation()
+        duration: float = time.perf_counter() - start
+        durations.append(duration)
+        total += duration
+        if len(durations) == 1 and duration > min_time:
+            break
+
+    return {"calls": len(durations), "median_seconds": statistics.median(durations), "min_seconds": min(durations)}
+
+
+def create_operation(benchmark_name, game, directory):
+    # type: (str, Game, str) -> tuple
+    """
+    Returns the operation timed by the given benchmark on the given game, which must not be used by other benchmarks,
+    and the function preparing every call of it. Operations which change the game are undone by the function
+    preparing the next call: the economy values of the player are restored and the sea creatures caught are removed
+    from the aquarium again.
+    """
+    player: Player = game.player
+    file_name: str = os.path.join(directory, "benchmark save")
+    sea_creature: SeaCreature = game.get_bodies_of_water()[0].get_potential_sea_creatures()[0]
+    level, exp, required_exp, attack_power, coins = \
+        player.level, player.exp, player.required_exp, player.attack_power, player.coins
+    caught_sea_creatures: list = []  # Sea creatures added to the aquarium by the last call
+    engine: GameEngine = GameEngine(game, random.Random(0))
+
+    def restore():
+        # type: () -> None
+        player.level, player.exp, player.required_exp, player.attack_power, player.coins = \
+            level, exp, required_exp, attack_power, coins
+        while len(caught_sea_creatures) > 0:
+            player.aquarium.remove_sea_creature(caught_sea_creatures.pop())
+
+    def prepare_level_up():
+        # type: () -> None
+        restore()
+        player.exp = required_exp
+
+    def catch_sea_creature():
+        # type: () -> None
+        wild_sea_creature: SeaCreature = sea_creature.clone()
+        wild_sea_creature.curr_hp *= 0
+        player.catch_sea_creature(wild_sea_creature)
+        caught_sea_creatures.append(wild_sea_creature)
+
+    def fishing_encounter():
+        # type: () -> None
+        # The same turns as the combat loop in main(): attacking until the sea creature is caught or flees
+        engine.execute("GO FISHING 0")
+        wild_sea_creature: SeaCreature = engine.wild_sea_creature
+        aquarium_size: int = len(player.aquarium)
+        while engine.wild_sea_creature is not None:
+            engine.execute("ATTACK")
+        if len(player.aquarium) > aquarium_size:
+            caught_sea_creatures.append(wild_sea_creature)
+
+    operations: dict = {
+        "gain_exp_after_time": (lambda: player.gain_exp_after_time(3600), restore),
+        "gain_coins_after_time": (lambda: player.gain_coins_after_time(3600), restore),
+        "level_up": (player.level_up, prepare_level_up),
+        "catch_sea_creature": (catch_sea_creature, restore),
+        "player_str": (lambda: str(player), None),
+        "player_stats_summary": (lambda: write_lines(player.iter_lines(summarise_aquarium=True), io.StringIO()),
+                                 None),
+        "game_clone": (game.clone, None),
+        "save_game_data": (lambda: save_game_data(game, file_name), None),
+        "load_game_data": (lambda: load_game_data(file_name), None),
+        "fishing_encounter": (fishing_encounter, restore)
+    }
+    if benchmark_name == "load_game_data":
+        save_game_data(game, file_name)
+    return operations[benchmark_name]
+
+
+def run_benchmarks(benchmark_names, aquarium_sizes, fishing_rods, player_level, min_time, max_calls):
+    # type: (list, list, int, int, float, int) -> dict
+    results: list = []
+    with tempfile.TemporaryDirectory() as directory:
+        for aquarium_size in aquarium_sizes:
+            for benchmark_name in benchmark_names:
+                # Every benchmark gets a game of its own, so that no benchmark is timed on a game changed by another
+                game: Game = create_synthetic_game(aquarium_size, fishing_rods, player_level)
+                operation, prepare = create_operation(benchmark_name, game, directory)
+                result: dict = {"benchmark": benchmark_name, "aquarium_size": aquarium_size}
+                result.update(time_operation(operation, min_time, max_calls, prepare))
+                results.append(result)
+                sys.stderr.write("{:<24}{:>10}{:>16.3f} us\n".format(
+                    benchmark_name, aquarium_size, result["median_seconds"] * 1e6))
+
+    return {
+        "metadata": {
+            "time": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numeric_backend": get_numeric_backend().name,
+            "fishing_rods": fishing_rods,
+            "player_level": player_level
+        },
+        "results": results
+    }
+
+
+def compare_with_baseline(report, baseline, threshold):
+    # type: (dict, dict, float) -> list
+    """
+    Returns a comparison row for every benchmark in both the report and the baseline. A benchmark regressed if its
+    median time grew by more than the threshold (e.g. 0.25 for 25%).
+    """
+    baseline_results: dict = {(result["benchmark"], result["aquarium_size"]): result
+                              for result in baseline["results"]}
+    res: list = []
+    for result in report["results"]:
+        baseline_result: dict or None = baseline_results.get((result["benchmark"], result["aquarium_size"]))
+        if baseline_result is None:
+            continue
+        ratio: float = result["median_seconds"] / baseline_result["median_seconds"] \
+            if baseline_result["median_seconds"] > 0 else 1.0
+        res.append({"benchmark": result["benchmark"], "aquarium_size": result["aquarium_size"],
+                    "baseline_seconds": baseline_result["median_seconds"], "seconds": result["median_seconds"],
+                    "ratio": ratio, "regressed": ratio > 1 + threshold})
+    return res
+
+
+def format_comparison(comparison):
+    # type: (list) -> str
+    res: str = ""  # initial value
+    res += "{:<24}{:>14}{:>16}{:>16}{:>10}\n".format("Benchmark", "Aquarium Size", "Baseline (us)", "Current (us)",
+                                                   "Ratio")
+    for row in comparison:
+        res += "{:<24}{:>14}{:>16.3f}{:>16.3f}{:>9.2f}x{}\n".format(
+            row["benchmark"], row["aquarium_size"], row["baseline_seconds"] * 1e6, row["seconds"] * 1e6,
+            row["ratio"], "  REGRESSION" if row["regressed"] else "")
+    return res
+
+
+def main(argv=None):
+    """
+    This main function is used to run the benchmark suite.
+    :param argv: list of command line arguments, defaults to sys.argv[1:]
+    :return: None
+    """
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Fishing Tycoon benchmark suite")
+    parser.add_argument("--aquarium-sizes", type=str, default="1000,10000,100000,1000000",
+                        help="comma separated list of aquarium sizes")
+    parser.add_argument("--fishing-rods", type=int, default=1000, help="number of fishing rods owned by the player")
+    parser.add_argument("--player-level", type=int, default=20,
+                        help="level of the player (the float backend supports levels up to about 20)")
+    parser.add_argument("--benchmarks", type=str, default=",".join(BENCHMARK_NAMES),
+                        help="comma separated list of benchmarks out of " + ", ".join(BENCHMARK_NAMES))
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum number of seconds per benchmark")
+    parser.add_argument("--max-calls", type=int, default=100000, help="maximum number of calls per benchmark")
+    parser.add_argument("--numeric-backend", choices=sorted(NUMERIC_BACKENDS), default="mpmath",
+                        help="numeric backend used for economy values")
+    parser.add_argument("--output", type=str, default=None, help="file to write the JSON results to")
+    parser.add_argument("--baseline", type=str, default=None,
+                        help="JSON results of an earlier run to compare the results with")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="relative slowdown compared with the baseline which counts as a regression")
+    args: argparse.Namespace = parser.parse_args(argv)
+    set_numeric_backend(args.numeric_backend)
+
+    benchmark_names: list = args.benchmarks.split(",")
+    for benchmark_name in benchmark_names:
+        if benchmark_name not in BENCHMARK_NAMES:
+            parser.error("unknown benchmark '" + benchmark_name + "'")
+
+    report: dict = run_benchmarks(benchmark_names, [int(float(size)) for size in args.aquarium_sizes.split(",")],
+                                  args.fishing_rods, args.player_level, args.min_time, args.max_calls)
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline is not None:
+        with open(args.baseline, "r") as file:
+            baseline: dict = json.load(file)
+        comparison: list = compare_with_baseline(report, baseline, args.threshold)
+        sys.stderr.write(format_comparison(comparison))
+        if any(row["regressed"] for row in comparison):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+This file contains the catalog of the game "Fishing Tycoon", which is the list of sea creatures, bodies of water and
+fishing rods shared by every game.
+The catalog is stored as plain data, and its objects are only created once per numeric backend and then shared by
+every game, so they are neither rebuilt on every start nor saved with every game.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+from numeric import num, get_numeric_backend
+from fishing_tycoon import SeaCreature, BodyOfWater, FishingRod, Shop
+
+
+# Creating constants used throughout this file
+
+
+# Name, max HP, catch EXP reward, EXP per second, coins per second and flee chance of every sea creature
+SEA_CREATURES: tuple = (
+    ("Pegaklesk", "1e4", "2e3", "1e3", "1e3", 0),
+    ("Sunup", "1e5", "2e4", "1e4", "1e4", 0.05),
+    ("Siledraor", "1e7", "2e6", "1e6", "1e6", 0.1),
+    ("Rutind", "1e10", "2e9", "1e9", "1e9", 0.15),
+    ("Sirto", "1e14", "2e13", "1e13", "1e13", 0.2),
+    ("Thotorog", "1e19", "2e18", "1e18", "1e18", 0.25),
+    ("Erok", "1e25", "2e24", "1e24", "1e24", 0.3),
+    ("Aket", "1e32", "2e31", "1e31", "1e31", 0.35),
+    ("Tunaba", "1e40", "2e39", "1e39", "1e39", 0.4),
+    ("Keoyhu", "1e49", "2e48", "1e48", "1e48", 0.45)
+)
+
+# Name, minimum player level, the range of sea creatures (start and end index) and their spawn weights (None for equal
+# chances) of every body of water
+BODIES_OF_WATER: tuple = (
+    ("Hampswell Gulf", 1, 0, 5, None),
+    ("Beauford Waters", 5, 5, 10, None)
+)
+
+SHOP_NAME: str = "Fishing Rod Shop"
+
+# Name, attack power and coin cost of every fishing rod sold in the shop
+FISHING_RODS: tuple = (
+    ("Fishing Rod #1", "1e3", "1e5"),
+    ("Fishing Rod #2", "1e5", "1e8"),
+    ("Fishing Rod #3", "1e8", "1e12"),
+    ("Fishing Rod #4", "1e12", "1e17"),
+    ("Fishing Rod #5", "1e17", "1e23"),
+    ("Fishing Rod #6", "1e23", "1e30"),
+    ("Fishing Rod #7", "1e30", "1e38"),
+    ("Fishing Rod #8", "1e38", "1e47"),
+    ("Fishing Rod #9", "1e47", "1e57"),
+    ("Fishing Rod #10", "1e57", "1e68")
+)
+
+
+# Creating necessary classes
+
+
+class Catalog:
+    """
+    This class contains attributes of the catalog shared by every game. Its objects must not be modified.
+    """
+
+    def __init__(self, sea_creatures, bodies_of_water, shop):
+        # type: (list, list, Shop) -> None
+        self.sea_creatures: list = sea_creatures
+        self.bodies_of_water: list = bodies_of_water
+        self.shop: Shop = shop
+
+
+# Creating static functions to be used throughout this file
+
+
+catalogs: dict = {}  # The shared catalog for each numeric backend
+
+
+def create_sea_creatures():
+    # type: () -> list
+    return [SeaCreature(name, num(max_hp), num(catch_exp_reward), num(exp_per_second), num(coins_per_second),
+                        flee_chance)
+            for name, max_hp, catch_exp_reward, exp_per_second, coins_per_second, flee_chance in SEA_CREATURES]
+
+
+def create_bodies_of_water(sea_creatures):
+    # type: (list) -> list
+    return [BodyOfWater(name, minimum_player_level, sea_creatures[start:end],
+                        list(spawn_weights) if spawn_weights is not None else None)
+            for name, minimum_player_level, start, end, spawn_weights in BODIES_OF_WATER]
+
+
+def create_shop():
+    # type: () -> Shop
+    return Shop(SHOP_NAME, [FishingRod(name, num(attack_power), num(coin_cost))
+                            for name, attack_power, coin_cost in FISHING_RODS])
+
+
+def get_catalog():
+    # type: () -> Catalog
+    """
+    Returns the shared catalog of the active numeric backend, creating it the first time it is needed.
+    """
+    backend_name: str = get_numeric_backend().name
+    if backend_name not in catalogs:
+        sea_creatures: list = create_sea_creatures()
+        catalogs[backend_name] = Catalog(sea_creatures, create_bodies_of_water(sea_creatures), create_shop())
+    return catalogs[backend_name]
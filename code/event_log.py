@@ -0,0 +1,279 @@
+"""
+This file contains the event log of the game "Fishing Tycoon" and the replay engine which rebuilds games from it.
+An event log is an append-only file with one JSON object per line. It starts with a snapshot of the game (its saved
+game data, which includes the state of the game's random number generator) followed by every command applied to the
+game, every random number drawn and the passive income granted by the clock. Since everything random in the game is
+drawn from the game's own random number generator, replaying the commands on the snapshot rebuilds the game exactly,
+and the random numbers drawn during the replay are compared with the recorded ones to detect differences.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import base64
+import json
+import os
+import sys
+import threading
+from datetime import datetime
+from game_engine import GameEngine
+from numeric import NUMERIC_BACKENDS, get_numeric_backend, set_numeric_backend
+from save_format import decode_game_data, encode_game_data
+from fishing_tycoon import Game
+
+
+# Creating necessary classes
+
+
+class EventLog:
+    """
+    This class contains attributes of the event log of a game.
+    Events are written to the file if there is one, and kept in the list of events otherwise. The file is flushed
+    whenever a command is recorded, so that at most the events of the last command are lost if the game crashes.
+    """
+
+    def __init__(self, file=None):
+        # type: (object or None) -> None
+        self.events: list = []  # initial value
+        self.__file: object or None = file
+        self.__lock: threading.Lock = threading.Lock()
+
+    def record(self, event):
+        # type: (dict) -> None
+        with self.__lock:
+            if self.__file is None:
+                self.events.append(event)
+            else:
+                self.__file.write(json.dumps(event, separators=(",", ":")) + "\n")
+                if event["type"] == "command":
+                    self.__file.flush()
+
+    def record_snapshot(self, game):
+        # type: (Game) -> None
+        self.record({"type": "snapshot", "numeric_backend": get_numeric_backend().name,
+                     "data": base64.b64encode(encode_game_data(game)).decode("ascii")})
+
+    def record_command(self, command_line):
+        # type: (str) -> None
+        self.record({"type": "command", "command": command_line})
+
+    def record_draw(self, value, bits=None):
+        # type: (float or int, int or None) -> None
+        # Floats are drawn by random() and integers by getrandbits(bits).
+        self.record({"type": "draw", "value": value} if bits is None else
+                    {"type": "draw", "bits": bits, "value": value})
+
+    def record_income(self, seconds, last_played_time):
+        # type: (int, datetime) -> None
+        self.record({"type": "income", "seconds": seconds, "time": last_played_time.timestamp()})
+
+    def close(self):
+        # type: () -> None
+        with self.__lock:
+            if self.__file is not None:
+                self.__file.close()
+                self.__file = None
+
+
+class ReplayResult:
+    """
+    This class contains attributes of the outcome of replaying an event log.
+    """
+
+    def __init__(self, game, commands, draws, error=None):
+        # type: (Game or None, int, int, str or None) -> None
+        self.game: Game or None = game
+        self.commands: int = commands
+        self.draws: int = draws
+        self.error: str or None = error  # Description of the first difference found by the replay
+
+
+# Creating static functions to be used throughout this file
+
+
+def open_event_log(file_name, game):
+    # type: (str, Game) -> EventLog
+    """
+    Starts recording the events of the game at the end of the given file, beginning with a snapshot of the game.
+    """
+    event_log: EventLog = EventLog(open(file_name, "a", encoding="utf-8"))
+    event_log.record_snapshot(game)
+    game.set_event_log(event_log)
+    return event_log
+
+
+def read_events(file_name):
+    # type: (str) -> iter
+    with open(file_name, "r", encoding="utf-8") as file:
+        for line in file:
+            if line.strip() != "":
+                yield json.loads(line)
+
+
+def compare_draws(recorded_draws, replayed_draws, first_draw):
+    # type: (list, list, int) -> str or None
+    """
+    Returns a description of the first difference between the random numbers drawn while recording and while
+    replaying, which are numbered from first_draw, or None if they are the same.
+    """
+    for index, (recorded_draw, replayed_draw) in enumerate(zip(recorded_draws, replayed_draws)):
+        if recorded_draw != replayed_draw:
+            return "Random number " + str(first_draw + index) + " was " + str(recorded_draw.get("value")) + \
+                " when recorded but " + str(replayed_draw.get("value")) + " when replayed."
+    if len(recorded_draws) != len(replayed_draws):
+        return str(len(recorded_draws)) + " random numbers were drawn after random number " + str(first_draw) + \
+            " when recorded but " + str(len(replayed_draws)) + " when replayed."
+    return None
+
+
+def replay_events(events, verify=True):
+    # type: (iter, bool) -> ReplayResult
+    """
+    Rebuilds a game by applying the recorded commands and passive income to the snapshot at the start of the events,
+    without asking for input or writing to the screen. A later snapshot (e.g. from the next time the game was played)
+    replaces the game rebuilt so far. If verify is True, the random numbers drawn are compared with the recorded ones
+    at every snapshot and at the end, and the replay stops at the first difference.
+    The numeric backend is switched to the one the snapshot was recorded with.
+    """
+    game: Game or None = None  # initial value
+    engine: GameEngine or None = None  # initial value
+    replay_log: EventLog or None = None  # initial value
+    recorded_draws: list = []
+    commands: int = 0  # initial value
+    draws: int = 0  # initial value
+
+    def check_draws():
+        # type: () -> str or None
+        if replay_log is None:
+            return None
+        replayed_draws: list = [event for event in replay_log.events if event["type"] == "draw"]
+        return compare_draws(recorded_draws, replayed_draws, draws - len(recorded_draws))
+
+    for event in events:
+        event_type: str = event["type"]
+        if event_type == "draw":
+            draws += 1
+            if verify:
+                recorded_draws.append(event)
+        elif event_type == "command":
+            if engine is None:
+                return ReplayResult(None, commands, draws, "The event log does not start with a snapshot.")
+            commands += 1
+            engine.execute(event["command"])
+        elif event_type == "income":
+            if game is None:
+                return ReplayResult(None, commands, draws, "The event log does not start with a snapshot.")
+            game.credit_passive_income(event["seconds"], datetime.fromtimestamp(event["time"]))
+        elif event_type == "snapshot":
+            error: str or None = check_draws()
+            if error is not None:
+                return ReplayResult(game, commands, draws, error)
+            if event["numeric_backend"] != get_numeric_backend().name:
+                set_numeric_backend(event["numeric_backend"])
+            game = decode_game_data(base64.b64decode(event["data"]))
+            engine = GameEngine(game)
+            recorded_draws = []
+            if verify:
+                replay_log = EventLog()
+                game.rng.event_log = replay_log  # Only the random numbers drawn are compared.
+        else:
+            return ReplayResult(game, commands, draws, "Unknown event type '" + str(event_type) + "'.")
+
+    return ReplayResult(game, commands, draws, check_draws())
+
+
+def replay_file(file_name, output_directory=None, verify=True):
+    # type: (str, str or None, bool) -> dict
+    """
+    Replays the event log in the given file and returns a summary of the rebuilt game. The rebuilt game is saved to
+    output_directory (named after the event log) if it is given and the replay succeeded.
+    """
+    try:
+        result: ReplayResult = replay_events(read_events(file_name), verify)
+    except (OSError, ValueError, KeyError, EOFError) as error:
+        result = ReplayResult(None, 0, 0, "The event log could not be read: " + str(error))
+
+    summary: dict = {"file_name": file_name, "commands": result.commands, "draws": result.draws,
+                     "error": result.error}
+    if result.game is not None:
+        summary["name"] = result.game.player.name
+        summary["level"] = result.game.player.level
+        summary["coins"] = str(result.game.player.coins)
+        if output_directory is not None and result.error is None:
+            from autosave import write_file_atomically
+            write_file_atomically(os.path.join(output_directory, os.path.splitext(os.path.basename(file_name))[0] +
+                                               ".save"), encode_game_data(result.game))
+    return summary
+
+
+def replay_file_job(job):
+    # type: (tuple) -> dict
+    # Worker processes can only call functions defined at module level.
+    return replay_file(*job)
+
+
+def main(argv=None):
+    """
+    This main function replays event logs, e.g. to check that recorded sessions still play out the same way or to
+    rebuild saved game data from them.
+    :param argv: list of command line arguments, defaults to sys.argv[1:]
+    :return: None
+    """
+
+    import argparse
+    import multiprocessing
+    import time
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Fishing Tycoon event log replay")
+    parser.add_argument("event_logs", nargs="+", help="event log files to replay")
+    parser.add_argument("--output-directory", type=str, default=None,
+                        help="directory to save the rebuilt games to")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of worker processes replaying event logs at the same time, 0 for one per CPU")
+    parser.add_argument("--no-verify", action="store_true",
+                        help="do not compare the random numbers drawn with the recorded ones")
+    parser.add_argument("--numeric-backend", choices=sorted(NUMERIC_BACKENDS), default="mpmath",
+                        help="numeric backend used until the first snapshot is replayed")
+    args: argparse.Namespace = parser.parse_args(argv)
+    set_numeric_backend(args.numeric_backend)
+    if args.output_directory is not None:
+        os.makedirs(args.output_directory, exist_ok=True)
+
+    jobs: list = [(file_name, args.output_directory, not args.no_verify) for file_name in args.event_logs]
+    start: float = time.perf_counter()
+    if args.workers == 1:
+        summaries: iter = (replay_file(*job) for job in jobs)
+        pool: object or None = None  # initial value
+    else:
+        pool = multiprocessing.Pool(args.workers or None, initializer=set_numeric_backend,
+                                    initargs=(args.numeric_backend,))
+        summaries = pool.imap(replay_file_job, jobs)
+
+    commands: int = 0  # initial value
+    failures: int = 0  # initial value
+    try:
+        for summary in summaries:
+            commands += summary["commands"]
+            if summary["error"] is not None:
+                failures += 1
+                print(summary["file_name"] + ": FAILED after " + str(summary["commands"]) + " commands. " +
+                      summary["error"])
+            else:
+                print(summary["file_name"] + ": OK, " + str(summary["commands"]) + " commands, " +
+                      str(summary["draws"]) + " random numbers, level " + str(summary["level"]) + ", " +
+                      summary["coins"] + " coins.")
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    elapsed: float = time.perf_counter() - start
+
+    sys.stderr.write("Replayed " + str(len(jobs)) + " event logs (" + str(commands) + " commands) in " +
+                     str(round(elapsed, 3)) + " seconds (" + str(round(commands / elapsed if elapsed > 0 else 0)) +
+                     " commands per second).\n")
+    if failures > 0:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
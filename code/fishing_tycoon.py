@@ -4,17 +4,40 @@ Author: DtjiSoftwareDeveloper
 """
 
 # Importing necessary libraries
+# Libraries which are only needed by some actions (e.g. uuid for new players or argparse for main()) are imported
+# where they are used, so that the game starts quickly.
+
+import time
+import_start_time: float = time.perf_counter()  # Used by --startup-profile
 
 import sys
-import uuid
-import pickle
-import copy
 import random
-from datetime import datetime
-import os
-from mpmath import *
+import math
+from bisect import bisect_right
+from collections.abc import Sequence
+from functools import lru_cache
+from datetime import datetime, timedelta
+from numeric import Number, NUMERIC_BACKENDS, num, check_finite, convert_number, get_numeric_backend, \
+    set_numeric_backend_in_background
+
+import_end_time: float = time.perf_counter()
+
+if __name__ == '__main__':
+    # Making sure that other files importing this file while the game runs share the classes defined here.
+    sys.modules.setdefault("fishing_tycoon", sys.modules["__main__"])
+
+# Shared sea creature species templates, keyed by the stats of the species
+species_templates: dict = {}
 
-mp.pretty = True
+# Whether the terminal supports ANSI escape codes, None until the screen is cleared for the first time
+ansi_escape_codes_enabled: bool or None = None
+
+# Number of 32 bit words the random number generator of a game draws before reseeding itself (see GameRandom)
+GAME_RANDOM_RESEED_WORDS: int = 1 << 16
+
+# Number of decimal digits below the largest term after which the terms of a fishing rod upgrade cost are too small
+# to change the total with any numeric backend (see get_fishing_rod_upgrade_factors)
+FISHING_ROD_UPGRADE_COST_DIGITS: int = 40
 
 
 # Creating static functions to be used throughout the game
@@ -22,7 +45,7 @@ mp.pretty = True
 
 def is_number(string: str) -> bool:
     try:
-        mpf(string)
+        num(string)
         return True
     except ValueError:
         return False
@@ -32,26 +55,178 @@ def triangular(n: int) -> int:
     return int(n * (n - 1) / 2)
 
 
-def mpf_sum_of_list(a_list: list) -> mpf:
-    return mpf(str(sum(mpf(str(elem)) for elem in a_list if is_number(str(elem)))))
+def triangular_product(first: int, last: int) -> int:
+    """
+    Returns the product of triangular(n) for every n from first to last (inclusive) in closed form, using
+    n * (n - 1) / 2 = (n! / (n - 1)!) * ((n - 1)! / (n - 2)!) / 2.
+    """
+    if last < first:
+        return 1
+    if first <= 1:
+        return 0  # triangular(0) and triangular(1) are both zero
+    return (math.factorial(last) // math.factorial(first - 1)) * \
+        (math.factorial(last - 1) // math.factorial(first - 2)) >> (last - first + 1)
+
+
+@lru_cache(maxsize=4096)
+def get_fishing_rod_upgrade_factors(backend_name, level, levels):
+    # type: (str, int, int) -> tuple
+    """
+    Returns the factors of upgrading a fishing rod at the given level by the given number of levels, which are the
+    same for every fishing rod, so they are memoized per numeric backend: the factor its attack power and level up
+    coin cost are multiplied by, the amount its critical damage increases by, and the total coin cost of the upgrades
+    divided by its current level up coin cost.
+    Levelling up from level L to level L + 1 multiplies by 10 ** (L + 1), so upgrading by k levels multiplies by
+    10 ** S(k), where S(k) = k * L + triangular(k + 1), and costs 10 ** S(0) + 10 ** S(1) + ... + 10 ** S(k - 1) times
+    the current level up coin cost. Every term is at least 100 times larger than the one before, so only the last
+    terms add to the total.
+    """
+    backend = get_numeric_backend()
+    exponent: int = levels * level + triangular(levels + 1)
+    last_cost_exponent: int = (levels - 1) * level + triangular(levels)
+    cost_factor: Number = num("0")  # initial value
+    for i in range(levels - 1, -1, -1):
+        cost_exponent: int = i * level + triangular(i + 1)
+        if last_cost_exponent - cost_exponent > FISHING_ROD_UPGRADE_COST_DIGITS:
+            break
+        cost_factor += backend.power_of_ten(cost_exponent)
+    return backend.power_of_ten(exponent), num("0.1") * exponent, cost_factor
+
+
+def mpf_sum_of_list(a_list: list) -> Number:
+    return num(str(sum(num(str(elem)) for elem in a_list if is_number(str(elem)))))
+
+
+def convert_numeric_attributes(obj, attribute_names):
+    # type: (object, tuple) -> None
+    """
+    Converts the given numeric attributes of an object loaded from saved game data into numbers of the currently
+    selected numeric backend.
+    """
+    for attribute_name in attribute_names:
+        if hasattr(obj, attribute_name):
+            setattr(obj, attribute_name, convert_number(getattr(obj, attribute_name)))
+
+
+def get_species_template(sea_creature):
+    # type: (SeaCreature) -> SeaCreature
+    """
+    Returns the shared template of the species the given sea creature belongs to. Templates are immutable and
+    shared by every aquarium, so an aquarium only needs to store how many sea creatures of each species it has.
+    """
+    key: tuple = (sea_creature.name, sea_creature.max_hp, sea_creature.catch_exp_reward,
+                  sea_creature.exp_per_second, sea_creature.coins_per_second, sea_creature.flee_chance)
+    template: SeaCreature or None = species_templates.get(key)
+    if template is None:
+        template = SeaCreature(sea_creature.name, sea_creature.max_hp, sea_creature.catch_exp_reward,
+                               sea_creature.exp_per_second, sea_creature.coins_per_second, sea_creature.flee_chance)
+        species_templates[key] = template
+    return template
+
+
+def copy_attributes(obj):
+    # type: (object) -> object
+    """
+    Returns a new object of the same class sharing every attribute value with the given object. Numbers and strings
+    are immutable, so they are safely shared, while attributes which are changed in place must be copied by the caller
+    (or copied when they are first changed). Objects of classes with __slots__ are copied slot by slot.
+    """
+    res: object = obj.__class__.__new__(obj.__class__)
+    if hasattr(obj, "__dict__"):
+        res.__dict__.update(obj.__dict__)
+    else:
+        for name in obj.__slots__:
+            setattr(res, name, getattr(obj, name))
+    return res
 
 
 def load_game_data(file_name):
     # type: (str) -> Game
-    return pickle.load(open(file_name, "rb"))
+    import save_format  # Imported here because the save format needs the classes in this file
+    with open(file_name, "rb") as file:
+        data: bytes = file.read()
+
+    if save_format.is_save_format(data):
+        return save_format.decode_game_data(data)
+
+    # Saved game data from older versions of the game is a pickle of the whole game.
+    return save_format.load_pickled_game_data(data)
 
 
 def save_game_data(game_data, file_name):
     # type: (Game, str) -> None
-    pickle.dump(game_data, open(file_name, "wb"))
+    import save_format  # Imported here because the save format needs the classes in this file
+    from autosave import write_file_atomically
+    write_file_atomically(file_name, save_format.encode_game_data(game_data))
+
+
+def enable_ansi_escape_codes():
+    # type: () -> bool
+    """
+    Enables ANSI escape codes in the Windows console, which does not interpret them by default.
+    Returns whether the console supports them.
+    """
+    if not sys.platform.startswith('win'):
+        return True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # Standard output
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except (AttributeError, OSError):
+        return False
 
 
 def clear():
     # type: () -> None
-    if sys.platform.startswith('win'):
-        os.system('cls')  # For Windows System
-    else:
-        os.system('clear')  # For Linux System
+    # Clearing the screen with ANSI escape codes instead of running 'cls' or 'clear' in a new shell. Nothing is
+    # written when the output is not a terminal, e.g. when it is piped into a file.
+    global ansi_escape_codes_enabled
+    if not sys.stdout.isatty():
+        return
+    if ansi_escape_codes_enabled is None:
+        ansi_escape_codes_enabled = enable_ansi_escape_codes()
+    if ansi_escape_codes_enabled:
+        sys.stdout.write("\033[H\033[2J\033[3J")  # Moves the cursor home, then clears the screen and scrollback
+        sys.stdout.flush()
+
+
+def write_lines(lines, stream=None, page_size=0):
+    # type: (iter, object, int) -> None
+    """
+    Writes the lines to the stream (the standard output by default) as they are generated. If page_size is positive,
+    the player is asked whether to continue after every page_size lines.
+    """
+    if stream is None:
+        stream = sys.stdout
+    if page_size <= 0:
+        stream.writelines(lines)
+        return
+
+    lines_on_page: int = 0  # initial value
+    for line in lines:
+        if lines_on_page >= page_size:
+            stream.flush()
+            if input("Press ENTER to see more or enter 'Q' to stop: ").upper() == "Q":
+                return
+            lines_on_page = 0
+        stream.write(line)
+        lines_on_page += line.count("\n")
+
+
+def input_index(prompt):
+    # type: (str) -> int
+    """
+    Asks for an index and returns it, or -1 if the input is not a whole number, so that invalid input is treated
+    like an index which is out of range.
+    """
+    try:
+        return int(input(prompt))
+    except ValueError:
+        return -1
 
 
 # Creating necessary classes
@@ -64,74 +239,181 @@ class Player:
 
     def __init__(self, name):
         # type: (str) -> None
+        import uuid
         self.player_id: str = str(uuid.uuid1())  # Generates random player ID
         self.name: str = name
         self.level: int = 1
-        self.attack_power: mpf = mpf("500")
+        self.attack_power: Number = num("500")
         self.fishing_rod: FishingRod or None = None
-        self.__fishing_rods_owned: list = []  # initial value
+        self.__fishing_rods_owned: FishingRodInventory = FishingRodInventory()
+        # After cloning, the fishing rods owned are shared with the clone until they are changed. Fishing rods which
+        # were copied since then are kept in __private_fishing_rods.
+        self.__private_fishing_rods: set or None = None  # initial value
         self.aquarium: Aquarium = Aquarium()
-        self.exp: mpf = mpf("0")
-        self.required_exp: mpf = mpf("1e6")
-        self.coins: mpf = mpf("0")
+        self.exp: Number = num("0")
+        self.required_exp: Number = num("1e6")
+        self.coins: Number = num("0")
+        self.change_count: int = 0  # Number of times the state of this player has changed
+
+    def __getstate__(self):
+        # type: () -> dict
+        state: dict = dict(self.__dict__)
+        state.pop("_Player__private_fishing_rods", None)
+        return state
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        self.__dict__.update(state)
+        if "change_count" not in state:
+            self.change_count = 0
+        if isinstance(self.__fishing_rods_owned, list):
+            # Saved game data from older versions stores the fishing rods owned in a list, so they are moved into an
+            # inventory here, and the equipped fishing rod is taken out of its stack.
+            fishing_rods_owned: list = self.__fishing_rods_owned
+            self.__fishing_rods_owned = FishingRodInventory()
+            for fishing_rod in fishing_rods_owned:
+                owned_fishing_rod: FishingRod = self.__fishing_rods_owned.add(fishing_rod)
+                if fishing_rod is self.fishing_rod:
+                    self.fishing_rod = owned_fishing_rod
+            self.fishing_rod = self.__fishing_rods_owned.take(self.fishing_rod)
+        self.__private_fishing_rods = None
+        convert_numeric_attributes(self, ("attack_power", "exp", "required_exp", "coins"))
+
+    def mark_changed(self):
+        # type: () -> None
+        """
+        Records that the state of this player changed, so that it is saved by the next autosave.
+        """
+        self.change_count += 1
 
     def __str__(self):
         # type: () -> str
-        res: str = ""  # initial value
-        res += "Player ID: " + str(self.player_id) + "\n"
-        res += "Name: " + str(self.name) + "\n"
-        res += "Level: " + str(self.level) + "\n"
-        res += "EXP: " + str(self.exp) + "\n"
-        res += "Required EXP to reach next level: " + str(self.required_exp) + "\n"
-        res += "Coins: " + str(self.coins) + "\n"
-        res += "Attack Power: " + str(self.attack_power) + "\n"
-        res += "Fishing Rod used:\n" + str(self.fishing_rod) + "\n"
-        res += "Below is a list of fishing rods owned by this player.\n"
-        for rod in self.__fishing_rods_owned:
-            res += str(rod) + "\n"
-
-        res += "Below is a list of sea creatures in this player's aquarium:\n"
-        for sea_creature in self.aquarium.get_sea_creatures():
-            res += str(sea_creature) + "\n"
+        return "".join(self.iter_lines())
 
-        return res
+    def get_header_lines(self):
+        # type: () -> list
+        """
+        Returns the first lines of the stats of this player, which contain every value changed by passive income.
+        """
+        return ["Player ID: " + str(self.player_id) + "\n",
+                "Name: " + str(self.name) + "\n",
+                "Level: " + str(self.level) + "\n",
+                "EXP: " + str(self.exp) + "\n",
+                "Required EXP to reach next level: " + str(self.required_exp) + "\n",
+                "Coins: " + str(self.coins) + "\n",
+                "Attack Power: " + str(self.attack_power) + "\n"]
+
+    def iter_lines(self, summarise_aquarium=False, header_lines=None):
+        # type: (bool, list or None) -> iter
+        """
+        Yields the stats of this player as strings ending with a new line, one entry at a time, so that the stats can
+        be written out without building them in memory. If summarise_aquarium is True, the aquarium is summarised per
+        species instead of listing every sea creature. header_lines are the lines returned by get_header_lines(), e.g.
+        while holding a lock, which are returned now if None.
+        """
+        yield from header_lines if header_lines is not None else self.get_header_lines()
+        yield "Fishing Rod used:\n" + str(self.fishing_rod) + "\n"
+        yield "Below is a list of fishing rods owned by this player.\n"
+        yield from self.__fishing_rods_owned.iter_lines()
+
+        if summarise_aquarium:
+            yield "Below is a summary of the sea creatures in this player's aquarium:\n"
+            yield from self.aquarium.iter_summary_lines()
+        else:
+            yield "Below is a list of sea creatures in this player's aquarium:\n"
+            yield from self.aquarium.iter_lines()
 
-    def level_up_fishing_rod(self):
-        # type: () -> bool
-        if isinstance(self.fishing_rod, FishingRod):
-            if self.coins >= self.fishing_rod.level_up_coin_cost:
-                self.coins -= self.fishing_rod.level_up_coin_cost
-                self.fishing_rod.level_up()
+    def __unshare_fishing_rod(self):
+        # type: () -> None
+        """
+        Makes sure that the equipped fishing rod can be changed without changing any other fishing rod before it is
+        changed: it is taken out of its stack, and replaced with a copy if it may be shared with a clone.
+        """
+        self.fishing_rod = self.__fishing_rods_owned.take(self.fishing_rod)
+        if self.__private_fishing_rods is None or self.fishing_rod in self.__private_fishing_rods:
+            return
+
+        fishing_rod: FishingRod = self.fishing_rod.clone()
+        self.__fishing_rods_owned.replace(self.fishing_rod, fishing_rod)
+        self.fishing_rod = fishing_rod
+        self.__private_fishing_rods.add(fishing_rod)
+
+    def level_up_fishing_rod(self, levels=1):
+        # type: (int) -> bool
+        """
+        Levels up the equipped fishing rod by the given number of levels if the player has enough coins for all of
+        them.
+        """
+        if isinstance(self.fishing_rod, FishingRod) and levels > 0:
+            if self.fishing_rod.can_afford_upgrade(self.coins, levels):
+                coin_cost: Number = self.fishing_rod.get_upgrade_coin_cost(levels)
+                # The attack power of the equipped fishing rod is included in the player's attack power. It is
+                # calculated and checked first, so that nothing is changed if it is out of the range of the numeric
+                # backend.
+                attack_power: Number = check_finite(
+                    self.attack_power + self.fishing_rod.get_level_up(levels)[0] - self.fishing_rod.attack_power)
+                self.coins -= coin_cost
+                self.__unshare_fishing_rod()
+                self.fishing_rod.level_up(levels)
+                self.attack_power = attack_power
+                self.mark_changed()
                 return True
             return False
         return False
 
+    def get_affordable_fishing_rod_levels(self):
+        # type: () -> int
+        if isinstance(self.fishing_rod, FishingRod):
+            return self.fishing_rod.get_affordable_levels(self.coins)
+        return 0
+
+    def __gain(self, exp_gained, coins_gained):
+        # type: (Number, Number) -> None
+        """
+        Adds the given EXP and coins and levels up. Every new value is calculated and checked before any of them is
+        changed, so if one is out of the range of the numeric backend, OverflowError is raised and the player is left
+        unchanged.
+        """
+        exp: Number = check_finite(self.exp + exp_gained)
+        coins: Number = check_finite(self.coins + coins_gained)
+        levels_gained, required_exp, attack_power = self.get_level_up(exp)
+        self.exp = exp
+        self.coins = coins
+        self.level += levels_gained
+        self.required_exp = required_exp
+        self.attack_power = attack_power
+        if exp_gained != 0 or coins_gained != 0:
+            self.mark_changed()
+
     def gain_exp_after_time(self, seconds):
         # type: (int) -> None
-        total_exp_gained: mpf = \
-            mpf_sum_of_list([sea_creature.exp_per_second for sea_creature in self.aquarium.get_sea_creatures()]) \
-            * seconds
-        self.exp += total_exp_gained
-        self.level_up()
+        self.__gain(self.aquarium.exp_per_second * seconds, 0)
 
     def gain_coins_after_time(self, seconds):
         # type: (int) -> None
-        total_coins_gained: mpf = \
-            mpf_sum_of_list([sea_creature.coins_per_second for sea_creature in self.aquarium.get_sea_creatures()]) \
-            * seconds
-        self.coins += total_coins_gained
+        self.__gain(0, self.aquarium.coins_per_second * seconds)
+
+    def gain_income_after_time(self, seconds):
+        # type: (int) -> None
+        """
+        Grants the EXP and coins the aquarium generates in the given number of seconds, either both or neither of them.
+        """
+        self.__gain(self.aquarium.exp_per_second * seconds, self.aquarium.coins_per_second * seconds)
 
     def catch_sea_creature(self, sea_creature):
         # type: (SeaCreature) -> bool
         if sea_creature.curr_hp <= 0:
+            # Gaining the EXP first, so that the sea creature is not added if the EXP is out of range
+            self.__gain(sea_creature.catch_exp_reward, 0)
             self.aquarium.add_sea_creature(sea_creature)
-            self.exp += sea_creature.catch_exp_reward
-            self.level_up()
+            self.mark_changed()
             return True
         return False
 
     def add_fishing_rod(self, fishing_rod):
         # type: (FishingRod) -> None
+        # An owned fishing rod is taken out of its stack, so that upgrading it does not upgrade the whole stack.
+        fishing_rod = self.__fishing_rods_owned.take(fishing_rod)
         if self.fishing_rod is not None:
             curr_fishing_rod: FishingRod = self.fishing_rod
             self.attack_power += fishing_rod.attack_power - curr_fishing_rod.attack_power
@@ -139,6 +421,7 @@ class Player:
         else:
             self.attack_power += fishing_rod.attack_power
             self.fishing_rod = fishing_rod
+        self.mark_changed()
 
     def remove_fishing_rod(self):
         # type: () -> bool
@@ -146,6 +429,7 @@ class Player:
             curr_fishing_rod: FishingRod = self.fishing_rod
             self.attack_power -= curr_fishing_rod.attack_power
             self.fishing_rod = None
+            self.mark_changed()
             return True
         else:
             return False
@@ -154,56 +438,244 @@ class Player:
         # type: (FishingRod) -> bool
         if self.coins >= fishing_rod.coin_cost:
             self.coins -= fishing_rod.coin_cost
-            self.__fishing_rods_owned.append(fishing_rod)
+            # The shop's fishing rods are shared by every game, so the player gets a copy which can be upgraded.
+            self.__fishing_rods_owned.add(fishing_rod.clone())
+            self.mark_changed()
             return True
         return False
 
     def sell_fishing_rod(self, fishing_rod):
         # type: (FishingRod) -> bool
-        if fishing_rod in self.__fishing_rods_owned:
-            self.__fishing_rods_owned.remove(fishing_rod)
+        if self.__fishing_rods_owned.remove(fishing_rod):
             self.coins += fishing_rod.coin_cost
+            self.mark_changed()
             return True
         return False
 
     def get_fishing_rods_owned(self):
-        # type: () -> list
+        # type: () -> FishingRodInventory
         return self.__fishing_rods_owned
 
     def level_up(self):
         # type: () -> None
-        while self.exp >= self.required_exp:
-            self.level += 1
-            self.required_exp *= mpf("10") ** self.level
-            self.attack_power *= triangular(self.level)
+        levels_gained, self.required_exp, self.attack_power = self.get_level_up(self.exp)
+        self.level += levels_gained
+
+    def get_level_up(self, exp):
+        # type: (Number) -> tuple
+        """
+        Returns the number of levels gained with the given EXP and the required EXP and attack power after gaining
+        them, without changing the player. Raises OverflowError if either value is out of the range of the numeric
+        backend.
+        """
+        if exp < self.required_exp:
+            return 0, self.required_exp, self.attack_power
+
+        # Levelling up from level L to level L + k multiplies the required EXP by 10 ** S(k), where
+        # S(k) = (L + 1) + (L + 2) + ... + (L + k) = k * L + k * (k + 1) / 2. The player gains k levels where k - 1
+        # is the largest m such that exp >= required_exp * 10 ** S(m), which is estimated with the quadratic formula
+        # and then corrected with exact comparisons.
+        backend = get_numeric_backend()
+        exponent_difference: float = backend.log10(check_finite(exp)) - backend.log10(self.required_exp)
+        b: float = 2 * self.level + 1
+        m: int = max(0, math.floor((-b + math.sqrt(b * b + 8 * max(exponent_difference, 0.0))) / 2))
+        while m > 0 and exp < self.required_exp * backend.power_of_ten(m * self.level + triangular(m + 1)):
+            m -= 1
+        while exp >= self.required_exp * backend.power_of_ten((m + 1) * self.level + triangular(m + 2)):
+            m += 1
+
+        levels_gained: int = m + 1
+        required_exp: Number = check_finite(
+            self.required_exp * backend.power_of_ten(levels_gained * self.level + triangular(levels_gained + 1)))
+        attack_power: Number = check_finite(
+            self.attack_power * triangular_product(self.level + 1, self.level + levels_gained))
+        return levels_gained, required_exp, attack_power
 
     def clone(self):
         # type: () -> Player
-        return copy.deepcopy(self)
+        """
+        Returns a copy of this player which shares the fishing rods and the aquarium with this player until either of
+        them changes them, so that cloning takes the same time no matter how many fishing rods and sea creatures the
+        player has.
+        """
+        self.__private_fishing_rods = set()
+        new_player: Player = copy_attributes(self)
+        new_player.__fishing_rods_owned = self.__fishing_rods_owned.clone()
+        new_player.__private_fishing_rods = set()
+        new_player.aquarium = self.aquarium.clone()
+        return new_player
 
 
 class Aquarium:
     """
     This class contains attributes of player's aquarium.
+    Sea creatures are stored as a count per species, where each species is a shared sea creature template.
     """
 
     def __init__(self, sea_creatures=None):
         # type: (list) -> None
         if sea_creatures is None:
             sea_creatures = []
-        self.__sea_creatures: list = sea_creatures  # initial value
+        self.__species_counts: dict = {}  # initial value
+        self.__species_counts_shared: bool = False  # Whether the species counts are shared with a clone
+        self.__size: int = 0
+        self.__exp_per_second: Number = num("0")
+        self.__coins_per_second: Number = num("0")
+        for sea_creature in sea_creatures:
+            self.add_sea_creature(sea_creature)
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        sea_creatures: list or None = state.pop("_Aquarium__sea_creatures", None)
+        self.__dict__.update(state)
+        if sea_creatures is not None:
+            # Saved game data from older versions stores every caught sea creature in a list, so it is
+            # converted into species counts here.
+            self.__species_counts = {}
+            for sea_creature in sea_creatures:
+                template: SeaCreature = get_species_template(sea_creature)
+                self.__species_counts[template] = self.__species_counts.get(template, 0) + 1
+        else:
+            # Making sure that loaded aquariums share the same species templates.
+            species_counts: dict = {}
+            for template, count in self.__species_counts.items():
+                template = get_species_template(template)
+                species_counts[template] = species_counts.get(template, 0) + count
+            self.__species_counts = species_counts
+
+        self.__species_counts_shared = False
+        self.__size = sum(self.__species_counts.values())
+        self.__update_income_totals()
+
+    def __update_income_totals(self):
+        # type: () -> None
+        self.__exp_per_second = mpf_sum_of_list([template.exp_per_second * count for template, count in
+                                                 self.__species_counts.items()])
+        self.__coins_per_second = mpf_sum_of_list([template.coins_per_second * count for template, count in
+                                                   self.__species_counts.items()])
+
+    def __len__(self):
+        # type: () -> int
+        return self.__size
+
+    @property
+    def exp_per_second(self):
+        # type: () -> Number
+        return self.__exp_per_second
+
+    @property
+    def coins_per_second(self):
+        # type: () -> Number
+        return self.__coins_per_second
+
+    def get_species_counts(self):
+        # type: () -> dict
+        return dict(self.__species_counts)
 
     def get_sea_creatures(self):
-        # type: () -> list
-        return self.__sea_creatures
+        # type: () -> AquariumView
+        return AquariumView(self.__species_counts, self.__size)
+
+    def iter_lines(self):
+        # type: () -> iter
+        """
+        Yields the description of every sea creature in this aquarium. Every species is only converted to a string
+        once, since all sea creatures of a species share the same template.
+        """
+        for template, count in list(self.__species_counts.items()):
+            text: str = str(template) + "\n"
+            for i in range(count):
+                yield text
+
+    def iter_summary_lines(self):
+        # type: () -> iter
+        """
+        Yields one line per species with the number of sea creatures of that species and the income they generate,
+        followed by the totals of this aquarium.
+        """
+        for template, count in list(self.__species_counts.items()):
+            yield str(template.name) + ": " + str(count) + " (EXP per second: " + \
+                str(template.exp_per_second * count) + ", Coins per second: " + \
+                str(template.coins_per_second * count) + ")\n"
+        yield "Total: " + str(self.__size) + " (EXP per second: " + str(self.__exp_per_second) + \
+            ", Coins per second: " + str(self.__coins_per_second) + ")\n"
+
+    def __unshare_species_counts(self):
+        # type: () -> None
+        if self.__species_counts_shared:
+            self.__species_counts = dict(self.__species_counts)
+            self.__species_counts_shared = False
+
+    def add_sea_creature(self, sea_creature, count=1):
+        # type: (SeaCreature, int) -> None
+        template: SeaCreature = get_species_template(sea_creature)
+        self.__unshare_species_counts()
+        self.__species_counts[template] = self.__species_counts.get(template, 0) + count
+        self.__size += count
+        self.__exp_per_second += template.exp_per_second * count
+        self.__coins_per_second += template.coins_per_second * count
+
+    def remove_sea_creature(self, sea_creature):
+        # type: (SeaCreature) -> bool
+        template: SeaCreature = get_species_template(sea_creature)
+        if self.__species_counts.get(template, 0) > 0:
+            self.__unshare_species_counts()
+            self.__species_counts[template] -= 1
+            if self.__species_counts[template] == 0:
+                del self.__species_counts[template]
+
+            self.__size -= 1
+            self.__exp_per_second -= template.exp_per_second
+            self.__coins_per_second -= template.coins_per_second
+            return True
+        return False
 
-    def add_sea_creature(self, sea_creature):
-        # type: (SeaCreature) -> None
-        self.__sea_creatures.append(sea_creature)
+    def __deepcopy__(self, memo):
+        # type: (dict) -> Aquarium
+        return self.clone()
 
     def clone(self):
         # type: () -> Aquarium
-        return copy.deepcopy(self)
+        # Species templates are immutable and shared, and the counts are shared until either aquarium changes.
+        self.__species_counts_shared = True
+        return copy_attributes(self)
+
+
+class AquariumView(Sequence):
+    """
+    This class contains a read-only view of the sea creatures in an aquarium, generated lazily from species counts.
+    """
+
+    def __init__(self, species_counts, size):
+        # type: (dict, int) -> None
+        self.__species_counts: dict = species_counts
+        self.__size: int = size
+
+    def __len__(self):
+        # type: () -> int
+        return self.__size
+
+    def __iter__(self):
+        for template, count in list(self.__species_counts.items()):
+            for i in range(count):
+                yield template
+
+    def __getitem__(self, index):
+        # type: (int) -> SeaCreature
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.__size))]
+
+        if index < 0:
+            index += self.__size
+        if index < 0 or index >= self.__size:
+            raise IndexError("Aquarium index out of range")
+
+        for template, count in self.__species_counts.items():
+            if index < count:
+                return template
+            index -= count
+
+        raise IndexError("Aquarium index out of range")
 
 
 class SeaCreature:
@@ -212,15 +684,21 @@ class SeaCreature:
     """
 
     def __init__(self, name, max_hp, catch_exp_reward, exp_per_second, coins_per_second, flee_chance):
-        # type: (str, mpf, mpf, mpf, mpf, float) -> None
+        # type: (str, Number, Number, Number, Number, float) -> None
         self.name: str = name
-        self.curr_hp: mpf = max_hp
-        self.max_hp: mpf = max_hp
-        self.catch_exp_reward: mpf = catch_exp_reward
-        self.exp_per_second: mpf = exp_per_second
-        self.coins_per_second: mpf = coins_per_second
+        self.curr_hp: Number = max_hp
+        self.max_hp: Number = max_hp
+        self.catch_exp_reward: Number = catch_exp_reward
+        self.exp_per_second: Number = exp_per_second
+        self.coins_per_second: Number = coins_per_second
         self.flee_chance: float = flee_chance
 
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        self.__dict__.update(state)
+        convert_numeric_attributes(self, ("curr_hp", "max_hp", "catch_exp_reward", "exp_per_second",
+                                          "coins_per_second"))
+
     def __str__(self):
         # type: () -> str
         res: str = ""  # initial value
@@ -234,29 +712,107 @@ class SeaCreature:
 
     def clone(self):
         # type: () -> SeaCreature
-        return copy.deepcopy(self)
+        return copy_attributes(self)
 
 
 class FishingRod:
     """
     This class contains attributes of a fishing rod.
+    Fishing rods only have the attributes in __slots__, so that players owning thousands of them use little memory.
     """
 
+    __slots__ = ("fishing_rod_id", "name", "level", "attack_power", "critical_damage", "coin_cost",
+                 "level_up_coin_cost")
+
     def __init__(self, name, attack_power, coin_cost):
-        # type: (str, mpf, mpf) -> None
+        # type: (str, Number, Number) -> None
+        self.fishing_rod_id: int or None = None  # Set when the fishing rod is added to a FishingRodInventory
         self.name: str = name
         self.level: int = 1
-        self.attack_power: mpf = attack_power
-        self.critical_damage: mpf = mpf("1.5")
-        self.coin_cost: mpf = coin_cost
-        self.level_up_coin_cost: mpf = coin_cost
+        self.attack_power: Number = attack_power
+        self.critical_damage: Number = num("1.5")
+        self.coin_cost: Number = coin_cost
+        self.level_up_coin_cost: Number = coin_cost
+
+    def __getstate__(self):
+        # type: () -> dict
+        return {name: getattr(self, name) for name in FishingRod.__slots__}
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        # Fishing rods pickled by older versions of the game have no ID.
+        self.fishing_rod_id = None
+        for name, value in state.items():
+            setattr(self, name, value)
+        convert_numeric_attributes(self, ("attack_power", "critical_damage", "coin_cost", "level_up_coin_cost"))
+
+    def get_stack_key(self):
+        # type: () -> tuple or None
+        """
+        Returns the key under which identical fishing rods are stacked in a FishingRodInventory, or None if this
+        fishing rod was upgraded, since upgraded fishing rods are never stacked.
+        """
+        if self.level != 1:
+            return None
+        return self.name, self.attack_power, self.critical_damage, self.coin_cost, self.level_up_coin_cost
+
+    def level_up(self, levels=1):
+        # type: (int) -> None
+        self.attack_power, self.critical_damage, self.level_up_coin_cost = self.get_level_up(levels)
+        self.level += levels
+
+    def get_level_up(self, levels=1):
+        # type: (int) -> tuple
+        """
+        Returns the attack power, critical damage and level up coin cost of this fishing rod after levelling it up by
+        the given number of levels, without changing it. Raises OverflowError if a value is out of the range of the
+        numeric backend.
+        """
+        factor, critical_damage_increase, cost_factor = \
+            get_fishing_rod_upgrade_factors(get_numeric_backend().name, self.level, levels)
+        return check_finite(self.attack_power * factor), self.critical_damage + critical_damage_increase, \
+            check_finite(self.level_up_coin_cost * factor)
+
+    def get_upgrade_coin_cost(self, levels=1):
+        # type: (int) -> Number
+        """
+        Returns the number of coins needed to level up this fishing rod by the given number of levels. Raises
+        OverflowError if the upgrade is out of the range of the numeric backend.
+        """
+        return self.level_up_coin_cost * \
+            get_fishing_rod_upgrade_factors(get_numeric_backend().name, self.level, levels)[2]
+
+    def can_afford_upgrade(self, coins, levels=1):
+        # type: (Number, int) -> bool
+        """
+        Returns whether the given coins pay for levelling up this fishing rod by the given number of levels. Upgrades
+        out of the range of the numeric backend (e.g. of native floats) can never be afforded.
+        """
+        try:
+            return coins >= self.get_upgrade_coin_cost(levels)
+        except OverflowError:
+            return False
 
-    def level_up(self):
-        # type: () -> None
-        self.level += 1
-        self.attack_power *= mpf("10") ** self.level
-        self.critical_damage += mpf("0.1") * self.level
-        self.level_up_coin_cost *= mpf("10") ** self.level
+    def get_affordable_levels(self, coins):
+        # type: (Number) -> int
+        """
+        Returns the largest number of levels this fishing rod can be levelled up by with the given coins.
+        """
+        if coins < self.level_up_coin_cost:
+            return 0
+
+        # The coin cost of k levels is slightly more than level_up_coin_cost * 10 ** S(k - 1) (see
+        # get_fishing_rod_upgrade_factors), so k - 1 is estimated with the quadratic formula like in Player.level_up and
+        # then corrected with exact comparisons.
+        backend = get_numeric_backend()
+        exponent_difference: float = backend.log10(check_finite(coins)) - backend.log10(self.level_up_coin_cost)
+        b: float = 2 * self.level + 1
+        levels: int = 1 + max(0, math.floor((-b + math.sqrt(b * b + 8 * max(exponent_difference, 0.0))) / 2))
+        while levels > 1 and not self.can_afford_upgrade(coins, levels):
+            levels -= 1
+        while self.can_afford_upgrade(coins, levels + 1):
+            levels += 1
+        return levels
 
     def __str__(self):
         # type: () -> str
@@ -270,38 +826,370 @@ class FishingRod:
 
     def clone(self):
         # type: () -> FishingRod
-        return copy.deepcopy(self)
+        return copy_attributes(self)
+
+
+class FishingRodInventory(Sequence):
+    """
+    This class contains attributes of the fishing rods owned by a player.
+    Every entry of the inventory is a fishing rod with an ID which is unique within the inventory, so that fishing
+    rods are found and removed by ID in constant time. Identical fishing rods which were never upgraded are stacked in
+    one entry with a count, and a stacked fishing rod only gets an entry of its own when it is taken out of its stack,
+    e.g. to be equipped. As a sequence, the inventory lists every fishing rod owned, repeating stacked ones.
+    """
+
+    def __init__(self, fishing_rods=None):
+        # type: (list) -> None
+        self.__fishing_rods: dict = {}  # Fishing rod ID -> fishing rod
+        self.__counts: dict = {}  # Fishing rod ID -> number of fishing rods in the entry
+        self.__stacks: dict = {}  # Stack key (see FishingRod.get_stack_key) -> fishing rod ID of the stack
+        self.__shared: bool = False  # Whether the dictionaries are shared with a clone
+        self.__next_fishing_rod_id: int = 1
+        self.__size: int = 0
+        if fishing_rods is not None:
+            for fishing_rod in fishing_rods:
+                self.add(fishing_rod)
+
+    def __len__(self):
+        # type: () -> int
+        return self.__size
+
+    def __contains__(self, fishing_rod):
+        # type: (object) -> bool
+        return isinstance(fishing_rod, FishingRod) and \
+            self.__fishing_rods.get(fishing_rod.fishing_rod_id) is fishing_rod
+
+    def __iter__(self):
+        for fishing_rod_id, fishing_rod in list(self.__fishing_rods.items()):
+            for i in range(self.__counts[fishing_rod_id]):
+                yield fishing_rod
+
+    def __getitem__(self, index):
+        # type: (int) -> FishingRod
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.__size))]
+
+        if index < 0:
+            index += self.__size
+        if index < 0 or index >= self.__size:
+            raise IndexError("Fishing rod index out of range")
+
+        # Searching from the end for indices in the second half, e.g. for the fishing rod bought last
+        if index < self.__size // 2:
+            for fishing_rod_id, fishing_rod in self.__fishing_rods.items():
+                if index < self.__counts[fishing_rod_id]:
+                    return fishing_rod
+                index -= self.__counts[fishing_rod_id]
+        else:
+            index = self.__size - 1 - index
+            for fishing_rod_id in reversed(self.__fishing_rods):
+                if index < self.__counts[fishing_rod_id]:
+                    return self.__fishing_rods[fishing_rod_id]
+                index -= self.__counts[fishing_rod_id]
+
+        raise IndexError("Fishing rod index out of range")
+
+    def get(self, fishing_rod_id):
+        # type: (int) -> FishingRod or None
+        return self.__fishing_rods.get(fishing_rod_id)
+
+    def get_stack(self, fishing_rod):
+        # type: (FishingRod) -> FishingRod or None
+        """
+        Returns the stack of fishing rods identical to the given one if it was never upgraded, e.g. the stack a
+        fishing rod bought from the shop was added to.
+        """
+        stack_key: tuple or None = fishing_rod.get_stack_key()
+        return self.__fishing_rods[self.__stacks[stack_key]] if stack_key in self.__stacks else None
+
+    def get_count(self, fishing_rod):
+        # type: (FishingRod) -> int
+        return self.__counts[fishing_rod.fishing_rod_id] if fishing_rod in self else 0
+
+    def get_entries(self):
+        # type: () -> list
+        """
+        Returns a list of (fishing rod, count) pairs, one per entry of this inventory.
+        """
+        return [(fishing_rod, self.__counts[fishing_rod_id]) for fishing_rod_id, fishing_rod in
+                self.__fishing_rods.items()]
+
+    def __unshare(self):
+        # type: () -> None
+        if self.__shared:
+            self.__fishing_rods = dict(self.__fishing_rods)
+            self.__counts = dict(self.__counts)
+            self.__stacks = dict(self.__stacks)
+            self.__shared = False
+
+    def __add_entry(self, fishing_rod, count):
+        # type: (FishingRod, int) -> None
+        fishing_rod.fishing_rod_id = self.__next_fishing_rod_id
+        self.__next_fishing_rod_id += 1
+        self.__fishing_rods[fishing_rod.fishing_rod_id] = fishing_rod
+        self.__counts[fishing_rod.fishing_rod_id] = count
+
+    def add(self, fishing_rod, count=1):
+        # type: (FishingRod, int) -> FishingRod
+        """
+        Adds count fishing rods like the given one and returns the fishing rod of their entry. The given fishing rod
+        becomes the entry unless it is stacked onto an identical fishing rod, so it must not be shared with anything
+        else, e.g. with a shop.
+        """
+        self.__unshare()
+        self.__size += count
+        if fishing_rod in self:
+            self.__counts[fishing_rod.fishing_rod_id] += count
+            return fishing_rod
+
+        stack_key: tuple or None = fishing_rod.get_stack_key()
+        if stack_key is not None and stack_key in self.__stacks:
+            stack_id: int = self.__stacks[stack_key]
+            self.__counts[stack_id] += count
+            return self.__fishing_rods[stack_id]
+
+        self.__add_entry(fishing_rod, count)
+        if stack_key is not None:
+            self.__stacks[stack_key] = fishing_rod.fishing_rod_id
+        return fishing_rod
+
+    def add_entry(self, fishing_rod, count, is_stack):
+        # type: (FishingRod, int, bool) -> FishingRod
+        """
+        Adds an entry of count fishing rods like the given one without stacking it onto an identical fishing rod, e.g.
+        to rebuild an inventory from saved game data. Fishing rods added later are only stacked onto it if is_stack
+        is True.
+        """
+        self.__unshare()
+        self.__size += count
+        self.__add_entry(fishing_rod, count)
+        stack_key: tuple or None = fishing_rod.get_stack_key()
+        if is_stack and stack_key is not None:
+            self.__stacks[stack_key] = fishing_rod.fishing_rod_id
+        return fishing_rod
+
+    def remove(self, fishing_rod):
+        # type: (FishingRod) -> bool
+        """
+        Removes one fishing rod from the entry of the given fishing rod.
+        """
+        if fishing_rod not in self:
+            return False
+
+        self.__unshare()
+        fishing_rod_id: int = fishing_rod.fishing_rod_id
+        self.__size -= 1
+        self.__counts[fishing_rod_id] -= 1
+        if self.__counts[fishing_rod_id] == 0:
+            del self.__fishing_rods[fishing_rod_id]
+            del self.__counts[fishing_rod_id]
+            stack_key: tuple or None = fishing_rod.get_stack_key()
+            if stack_key is not None and self.__stacks.get(stack_key) == fishing_rod_id:
+                del self.__stacks[stack_key]
+        return True
+
+    def take(self, fishing_rod):
+        # type: (FishingRod) -> FishingRod
+        """
+        Returns a fishing rod with an entry of its own for one of the fishing rods in the entry of the given fishing
+        rod, which can be changed (e.g. upgraded) without changing any other fishing rod. A fishing rod which is not
+        in this inventory is returned as it is.
+        """
+        if fishing_rod not in self:
+            return fishing_rod
+
+        self.__unshare()
+        fishing_rod_id: int = fishing_rod.fishing_rod_id
+        if self.__counts[fishing_rod_id] == 1:
+            stack_key: tuple or None = fishing_rod.get_stack_key()
+            if stack_key is not None and self.__stacks.get(stack_key) == fishing_rod_id:
+                del self.__stacks[stack_key]
+            return fishing_rod
+
+        self.__counts[fishing_rod_id] -= 1
+        taken_fishing_rod: FishingRod = fishing_rod.clone()
+        self.__add_entry(taken_fishing_rod, 1)
+        return taken_fishing_rod
+
+    def replace(self, fishing_rod, new_fishing_rod):
+        # type: (FishingRod, FishingRod) -> None
+        """
+        Replaces the given fishing rod with a copy of it (which has the same ID), e.g. before changing a fishing rod
+        which is shared with a clone of this inventory.
+        """
+        if fishing_rod in self:
+            self.__unshare()
+            self.__fishing_rods[fishing_rod.fishing_rod_id] = new_fishing_rod
+            stack_key: tuple or None = fishing_rod.get_stack_key()
+            if stack_key is not None and self.__stacks.get(stack_key) == fishing_rod.fishing_rod_id:
+                del self.__stacks[stack_key]
+
+    def iter_lines(self):
+        # type: () -> iter
+        for fishing_rod, count in self.get_entries():
+            yield str(fishing_rod) + ("Number owned: " + str(count) + "\n" if count > 1 else "") + "\n"
+
+    def clone(self):
+        # type: () -> FishingRodInventory
+        # The fishing rods and the dictionaries are shared until either inventory changes them.
+        self.__shared = True
+        return copy_attributes(self)
+
+
+class SpawnTable:
+    """
+    This class contains attributes of a table to draw random indices with given weights in constant time, using the
+    alias method: an index is drawn uniformly, and then kept with its probability or replaced with its alias.
+    If all weights are equal, every probability is 1, so a single uniform index is drawn.
+    """
+
+    def __init__(self, weights):
+        # type: (list) -> None
+        if len(weights) == 0 or any(weight < 0 for weight in weights) or sum(weights) <= 0:
+            raise ValueError("Spawn weights must be non-negative and add up to more than 0.")
+
+        size: int = len(weights)
+        self.probabilities: list = [1.0] * size
+        self.aliases: list = list(range(size))
+        if any(weight != weights[0] for weight in weights):
+            total: float = float(sum(weights))
+            scaled_weights: list = [weight * size / total for weight in weights]
+            small: list = [index for index, weight in enumerate(scaled_weights) if weight < 1]
+            large: list = [index for index, weight in enumerate(scaled_weights) if weight >= 1]
+            while small and large:
+                small_index: int = small.pop()
+                large_index: int = large.pop()
+                self.probabilities[small_index] = scaled_weights[small_index]
+                self.aliases[small_index] = large_index
+                scaled_weights[large_index] += scaled_weights[small_index] - 1
+                (small if scaled_weights[large_index] < 1 else large).append(large_index)
+            # Whatever is left only differs from 1 by rounding errors, so its probability stays 1.
+
+    def __len__(self):
+        # type: () -> int
+        return len(self.probabilities)
+
+    def sample(self, rng):
+        # type: (random.Random) -> int
+        index: int = rng.randrange(len(self.probabilities))
+        probability: float = self.probabilities[index]
+        if probability >= 1 or rng.random() < probability:
+            return index
+        return self.aliases[index]
 
 
 class BodyOfWater:
     """
     This class contains attributes of a body of water.
+    Sea creatures are spawned with the given spawn weights (or with equal chances if there are none) using a spawn
+    table, which is created the first time a sea creature is spawned and only created again when the sea creatures
+    which can be caught here are changed with set_potential_sea_creatures(). The sea creatures and spawn weights are
+    kept in tuples, so that they cannot be changed in any other way.
     """
 
-    def __init__(self, name, minimum_player_level, potential_sea_creatures):
-        # type: (str, int, list) -> None
+    def __init__(self, name, minimum_player_level, potential_sea_creatures, spawn_weights=None):
+        # type: (str, int, list, list or None) -> None
         self.name: str = name
         self.minimum_player_level: int = minimum_player_level
-        self.__potential_sea_creatures: list = potential_sea_creatures
+        self.__potential_sea_creatures: tuple = tuple(potential_sea_creatures)
+        self.__spawn_weights: tuple or None = tuple(spawn_weights) if spawn_weights is not None else None
+        self.__spawn_table: SpawnTable or None = None  # initial value
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        self.__dict__.update(state)
+        # Saved game data from older versions keeps the sea creatures in a list and has no spawn weights.
+        self.__potential_sea_creatures = tuple(self.__potential_sea_creatures)
+        if "_BodyOfWater__spawn_weights" not in state:
+            self.__spawn_weights = None
+        self.__spawn_table = None
 
     def __str__(self):
         # type: () -> str
-        res: str = ""  # initial value
-        res += "Name: " + str(self.name) + "\n"
-        res += "Minimum Player Level to fish here: " + str(self.minimum_player_level) + "\n"
-        res += "Below is a list of sea creatures which can be caught here:\n"
-        for sea_creature in self.__potential_sea_creatures:
-            res += str(sea_creature) + "\n"
-
-        return res
+        return "".join(self.iter_lines())
+
+    def iter_lines(self):
+        # type: () -> iter
+        yield "Name: " + str(self.name) + "\n"
+        yield "Minimum Player Level to fish here: " + str(self.minimum_player_level) + "\n"
+        yield "Below is a list of sea creatures which can be caught here:\n"
+        total_spawn_weight: float = sum(self.__spawn_weights) if self.__spawn_weights is not None else 0
+        for i, sea_creature in enumerate(self.__potential_sea_creatures):
+            if self.__spawn_weights is not None:
+                yield str(sea_creature) + "Spawn chance: " + \
+                    str(round(self.__spawn_weights[i] / total_spawn_weight * 100, 2)) + "%\n\n"
+            else:
+                yield str(sea_creature) + "\n"
 
     def get_potential_sea_creatures(self):
-        # type: () -> list
+        # type: () -> tuple
         return self.__potential_sea_creatures
 
+    def get_spawn_weights(self):
+        # type: () -> tuple or None
+        return self.__spawn_weights
+
+    def set_potential_sea_creatures(self, potential_sea_creatures, spawn_weights=None):
+        # type: (list, list or None) -> None
+        if spawn_weights is not None and len(spawn_weights) != len(potential_sea_creatures):
+            raise ValueError("Every sea creature needs exactly one spawn weight.")
+        self.__potential_sea_creatures = tuple(potential_sea_creatures)
+        self.__spawn_weights = tuple(spawn_weights) if spawn_weights is not None else None
+        self.__spawn_table = None
+
+    def get_spawn_table(self):
+        # type: () -> SpawnTable
+        if self.__spawn_table is None:
+            self.__spawn_table = SpawnTable(self.__spawn_weights if self.__spawn_weights is not None else
+                                            [1] * len(self.__potential_sea_creatures))
+        return self.__spawn_table
+
+    def spawn_sea_creature(self, rng):
+        # type: (random.Random) -> SeaCreature
+        """
+        Returns a new wild sea creature drawn from the sea creatures which can be caught here.
+        """
+        return self.__potential_sea_creatures[self.get_spawn_table().sample(rng)].clone()
+
     def clone(self):
         # type: () -> BodyOfWater
-        return copy.deepcopy(self)
+        # The sea creatures which can be caught here are shared templates, and neither their tuple nor spawn tables
+        # are ever changed, so everything is shared.
+        return copy_attributes(self)
+
+
+class BodyOfWaterIndex:
+    """
+    This class contains attributes of an index of bodies of water sorted by minimum player level, which finds the
+    bodies of water unlocked at a level without checking every body of water.
+    """
+
+    def __init__(self, bodies_of_water):
+        # type: (list) -> None
+        # Bodies of water with the same minimum player level keep their order.
+        self.__indices: list = sorted(range(len(bodies_of_water)),
+                                      key=lambda index: bodies_of_water[index].minimum_player_level)
+        self.__levels: list = [bodies_of_water[index].minimum_player_level for index in self.__indices]
+
+    def count_unlocked(self, player_level):
+        # type: (int) -> int
+        return bisect_right(self.__levels, player_level)
+
+    def get_unlocked_indices(self, player_level):
+        # type: (int) -> list
+        """
+        Returns the indices of the bodies of water unlocked at the given level, sorted by minimum player level.
+        """
+        return self.__indices[:self.count_unlocked(player_level)]
+
+    def get_next_unlock_level(self, player_level):
+        # type: (int) -> int or None
+        """
+        Returns the lowest level above the given level which unlocks another body of water, or None if every body of
+        water is unlocked.
+        """
+        count: int = self.count_unlocked(player_level)
+        return self.__levels[count] if count < len(self.__levels) else None
 
 
 class Shop:
@@ -320,86 +1208,384 @@ class Shop:
 
     def clone(self):
         # type: () -> Shop
-        return copy.deepcopy(self)
+        new_shop: Shop = copy_attributes(self)
+        new_shop.__fishing_rods_sold = [fishing_rod.clone() for fishing_rod in self.__fishing_rods_sold]
+        return new_shop
+
+
+class GameRandom(random.Random):
+    """
+    This class contains attributes of the random number generator of a game.
+    The generator counts the 32 bit words it has drawn since it was seeded, so that its state can be saved as the
+    seed and that count, together with the second normal value which gauss() computes and keeps for its next call.
+    After GAME_RANDOM_RESEED_WORDS words, it reseeds itself with a number it draws, so that restoring the state never
+    draws more than that many words. Every number drawn is recorded in the event log if there is one.
+    """
+
+    def __init__(self, seed=None, words_drawn=0, gauss_next=None):
+        # type: (int or None, int, float or None) -> None
+        self.initial_seed: int = 0  # initial value
+        self.words_drawn: int = 0  # initial value
+        self.event_log: object or None = None  # initial value
+        super(GameRandom, self).__init__(seed)
+        self.advance(words_drawn)
+        self.gauss_next: float or None = gauss_next
+
+    def seed(self, a=None, version=2):
+        # type: (int or None, int) -> None
+        if a is None:
+            a = random.getrandbits(64)
+        super(GameRandom, self).seed(a, version)
+        self.initial_seed = a
+        self.words_drawn = 0
+
+    def advance(self, words):
+        # type: (int) -> None
+        """
+        Skips the given number of 32 bit words without recording them.
+        """
+        self.words_drawn += words
+        while words > 0:
+            chunk_words: int = min(words, 4096)
+            super(GameRandom, self).getrandbits(32 * chunk_words)
+            words -= chunk_words
+
+    def __count_words(self, words):
+        # type: (int) -> None
+        self.words_drawn += words
+        if self.words_drawn >= GAME_RANDOM_RESEED_WORDS:
+            self.seed(super(GameRandom, self).getrandbits(64))
+
+    def random(self):
+        # type: () -> float
+        res: float = super(GameRandom, self).random()
+        self.__count_words(2)
+        if self.event_log is not None:
+            self.event_log.record_draw(res)
+        return res
+
+    def getrandbits(self, k):
+        # type: (int) -> int
+        res: int = super(GameRandom, self).getrandbits(k)
+        self.__count_words((k + 31) // 32)
+        if self.event_log is not None:
+            self.event_log.record_draw(res, k)
+        return res
+
+    def __reduce__(self):
+        # type: () -> tuple
+        return GameRandom, (self.initial_seed, self.words_drawn, self.gauss_next)
+
+    def clone(self):
+        # type: () -> GameRandom
+        res: GameRandom = GameRandom(self.initial_seed)
+        res.setstate(self.getstate())
+        res.words_drawn = self.words_drawn
+        return res
 
 
 class Game:
     """
     This class contains attributes of saved game data.
+    Everything random in the game is drawn from the game's own random number generator, so that a game can be
+    replayed exactly from saved game data and the commands applied to it (see event_log.py).
     """
 
-    def __init__(self, player, bodies_of_water, shop):
-        # type: (Player, list, Shop) -> None
+    def __init__(self, player, bodies_of_water, shop, seed=None):
+        # type: (Player, list, Shop, int or None) -> None
         self.player: Player = player
         self.__bodies_of_water: list = bodies_of_water
         self.shop: Shop = shop
+        self.last_played_time: datetime or None = None  # initial value
+        self.rng: GameRandom = GameRandom(seed)
+        self.event_log: object or None = None  # initial value
+        self.__body_of_water_index: BodyOfWaterIndex or None = None  # initial value
+
+    def __getstate__(self):
+        # type: () -> dict
+        # The shared catalog is left out when the game is pickled or copied, and restored by __setstate__().
+        import catalog
+        state: dict = dict(self.__dict__)
+        state.pop("event_log", None)
+        state.pop("_Game__body_of_water_index", None)
+        shared_catalog: catalog.Catalog = catalog.get_catalog()
+        if self.__bodies_of_water is shared_catalog.bodies_of_water and self.shop is shared_catalog.shop:
+            del state["_Game__bodies_of_water"]
+            del state["shop"]
+        return state
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        self.__dict__.update(state)
+        if "shop" not in state:
+            import catalog
+            shared_catalog: catalog.Catalog = catalog.get_catalog()
+            self.__bodies_of_water = shared_catalog.bodies_of_water
+            self.shop = shared_catalog.shop
+        if "last_played_time" not in state:
+            # Saved game data from older versions does not store when the game was last played.
+            self.last_played_time = None
+        if "rng" not in state:
+            self.rng = GameRandom()
+        self.event_log = None
+        self.__body_of_water_index = None
 
     def get_bodies_of_water(self):
         # type: () -> list
         return self.__bodies_of_water
 
+    def get_body_of_water_index(self):
+        # type: () -> BodyOfWaterIndex
+        if self.__body_of_water_index is None:
+            self.__body_of_water_index = BodyOfWaterIndex(self.__bodies_of_water)
+        return self.__body_of_water_index
+
+    def get_unlocked_body_of_water_indices(self):
+        # type: () -> list
+        return self.get_body_of_water_index().get_unlocked_indices(self.player.level)
+
+    def set_event_log(self, event_log):
+        # type: (object or None) -> None
+        """
+        Records the commands applied to this game, the random numbers drawn and the passive income granted in the
+        given event log (see event_log.EventLog), or stops recording them if event_log is None.
+        """
+        self.event_log = event_log
+        self.rng.event_log = event_log
+
+    def catch_up(self, now=None):
+        # type: (datetime or None) -> int
+        """
+        Grants the player EXP and coins for every whole second elapsed since the game was last played, including
+        the time when the game was closed. Returns the number of seconds credited.
+        """
+        if now is None:
+            now = datetime.now()
+
+        seconds: int = 0  # initial value
+        if self.last_played_time is not None:
+            seconds = int((now - self.last_played_time).total_seconds())
+
+        if seconds <= 0:
+            # Either nothing has been credited yet or the clock moved backwards.
+            if self.last_played_time is None or seconds < 0:
+                self.last_played_time = now
+            return 0
+
+        # Fractions of a second are kept for the next catch up instead of being dropped.
+        self.credit_passive_income(seconds, self.last_played_time + timedelta(seconds=seconds))
+        return seconds
+
+    def grant_passive_income(self, seconds):
+        # type: (int) -> None
+        self.player.gain_income_after_time(seconds)
+
+    def credit_passive_income(self, seconds, last_played_time):
+        # type: (int, datetime) -> None
+        """
+        Grants the passive income of the given number of seconds of real time, which ended at last_played_time.
+        Since it depends on the clock, it is recorded in the event log.
+        If the income is out of the range of the numeric backend, OverflowError is raised without granting it, but the
+        seconds are still credited, so that they are not granted again by the next catch up.
+        """
+        try:
+            self.grant_passive_income(seconds)
+        finally:
+            self.last_played_time = last_played_time
+            if self.event_log is not None:
+                self.event_log.record_income(seconds, last_played_time)
+
     def clone(self):
         # type: () -> Game
-        return copy.deepcopy(self)
+        """
+        Returns a copy of this game which can be changed without changing this game. The bodies of water and the shop
+        are never changed by playing, so they are shared with the copy.
+        """
+        new_game: Game = copy_attributes(self)
+        new_game.player = self.player.clone()
+        new_game.rng = self.rng.clone()
+        new_game.event_log = None
+        return new_game
+
+
+# Creating static functions to create the catalog of the game
+
+
+# The catalog is stored in catalog.py, which is imported here because it needs the classes in this file. These
+# functions create new copies of the catalog, while catalog.get_catalog() returns the copy shared by every game.
+
+
+def create_sea_creatures():
+    # type: () -> list
+    import catalog
+    return catalog.create_sea_creatures()
+
+
+def create_bodies_of_water(sea_creatures):
+    # type: (list) -> list
+    import catalog
+    return catalog.create_bodies_of_water(sea_creatures)
+
+
+def create_shop():
+    # type: () -> Shop
+    import catalog
+    return catalog.create_shop()
 
 
 # Creating main function used to run the game.
 
 
-def main():
+def main(argv=None):
     """
     This main function is used to run the game.
+    :param argv: list of command line arguments, defaults to sys.argv[1:]
     :return: None
     """
 
+    # The time each step of the startup took, reported by --startup-profile
+    startup_profile: list = [("Imports", import_end_time - import_start_time)]
+    step_start_time: float = time.perf_counter()
+
+    import argparse
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Fishing Tycoon")
+    parser.add_argument("--numeric-backend", choices=sorted(NUMERIC_BACKENDS), default="mpmath",
+                        help="numeric backend used for economy values: 'mpmath' is exact, 'float' is fastest but only "
+                             "supports values up to about 1e308, and 'bignumber' stores mantissa and exponent pairs "
+                             "for astronomically large values")
+    parser.add_argument("--autosave-interval", type=float, default=60.0,
+                        help="number of seconds between automatic saves of changed game data, 0 to disable")
+    parser.add_argument("--autosave-checkpoints", type=int, default=3,
+                        help="number of older saved game data files kept as checkpoints")
+    parser.add_argument("--income-tick-interval", type=float, default=1.0,
+                        help="number of seconds between grants of passive income while playing, 0 to only grant it "
+                             "before every action")
+    parser.add_argument("--page-size", type=int, default=40,
+                        help="number of lines shown at once when viewing stats, 0 to show everything at once")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="print how long importing, initialising and loading took before the first prompt")
+    parser.add_argument("--event-log", type=str, default=None,
+                        help="file to append a snapshot of the game and every action, random number and passive "
+                             "income of this session to, which can be replayed with event_log.py")
+    parser.add_argument("--profile", type=str, nargs="?", const="fishing_tycoon_profile", default=None,
+                        help="profile this session with cProfile and measure the actions and player methods, and "
+                             "write the statistics to PROFILE.prof and a summary of the measurements to PROFILE.json "
+                             "when the game quits (PROFILE defaults to 'fishing_tycoon_profile')")
+    args: argparse.Namespace = parser.parse_args(argv)
+    startup_profile.append(("Parsing arguments", time.perf_counter() - step_start_time))
+
+    # Measuring the session only if it is profiled, so that the game runs the original methods otherwise
+    metrics: object or None = None  # initial value
+    profiler: object or None = None  # initial value
+    if args.profile is not None:
+        import cProfile
+        from instrumentation import Metrics, enable_instrumentation
+        metrics = Metrics()
+        enable_instrumentation(metrics)
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    # The numeric backend (e.g. mpmath, which is slow to import) is set up in the background, so that new players can
+    # already enter their name in the meantime.
+    step_start_time = time.perf_counter()
+    numeric_backend_thread = set_numeric_backend_in_background(args.numeric_backend)
+    from autosave import Autosaver, get_save_file_names, load_newest_game_data
+    from income_ticker import IncomeTicker
+    from catalog import Catalog, get_catalog
+    from game_engine import CommandResult, GameEngine
+    file_name: str = "SAVED FISHING TYCOON GAME DATA"
+    save_file_names: list = get_save_file_names(file_name, args.autosave_checkpoints)
+    startup_profile.append(("Importing game modules", time.perf_counter() - step_start_time))
+
     print("Welcome to 'Fishing Tycoon' by 'DtjiSoftwareDeveloper'.")
     print("In this game, you will go fishing to catch sea creatures.")
 
-    sea_creatures: list = [
-        SeaCreature("Pegaklesk", mpf("1e4"), mpf("2e3"), mpf("1e3"), mpf("1e3"), 0),
-        SeaCreature("Sunup", mpf("1e5"), mpf("2e4"), mpf("1e4"), mpf("1e4"), 0.05),
-        SeaCreature("Siledraor", mpf("1e7"), mpf("2e6"), mpf("1e6"), mpf("1e6"), 0.1),
-        SeaCreature("Rutind", mpf("1e10"), mpf("2e9"), mpf("1e9"), mpf("1e9"), 0.15),
-        SeaCreature("Sirto", mpf("1e14"), mpf("2e13"), mpf("1e13"), mpf("1e13"), 0.2),
-        SeaCreature("Thotorog", mpf("1e19"), mpf("2e18"), mpf("1e18"), mpf("1e18"), 0.25),
-        SeaCreature("Erok", mpf("1e25"), mpf("2e24"), mpf("1e24"), mpf("1e24"), 0.3),
-        SeaCreature("Aket", mpf("1e32"), mpf("2e31"), mpf("1e31"), mpf("1e31"), 0.35),
-        SeaCreature("Tunaba", mpf("1e40"), mpf("2e39"), mpf("1e39"), mpf("1e39"), 0.4),
-        SeaCreature("Keoyhu", mpf("1e49"), mpf("2e48"), mpf("1e48"), mpf("1e48"), 0.45)
-    ]
-
-    bodies_of_water: list = [
-        BodyOfWater("Hampswell Gulf", 1, sea_creatures[0:5]),
-        BodyOfWater("Beauford Waters", 5, sea_creatures[5::])
-    ]
-
-    shop: Shop = Shop(
-        "Fishing Rod Shop",
-        [
-            FishingRod("Fishing Rod #1", mpf("1e3"), mpf("1e5")),
-            FishingRod("Fishing Rod #2", mpf("1e5"), mpf("1e8")),
-            FishingRod("Fishing Rod #3", mpf("1e8"), mpf("1e12")),
-            FishingRod("Fishing Rod #4", mpf("1e12"), mpf("1e17")),
-            FishingRod("Fishing Rod #5", mpf("1e17"), mpf("1e23")),
-            FishingRod("Fishing Rod #6", mpf("1e23"), mpf("1e30")),
-            FishingRod("Fishing Rod #7", mpf("1e30"), mpf("1e38")),
-            FishingRod("Fishing Rod #8", mpf("1e38"), mpf("1e47")),
-            FishingRod("Fishing Rod #9", mpf("1e47"), mpf("1e57")),
-            FishingRod("Fishing Rod #10", mpf("1e57"), mpf("1e68"))
-        ])
+    def print_startup_profile():
+        # type: () -> None
+        if args.startup_profile:
+            for step, seconds in startup_profile:
+                sys.stderr.write("{:<28}{:>10.2f} ms\n".format(step, seconds * 1000))
+            sys.stderr.write("{:<28}{:>10.2f} ms\n".format("Time to first prompt",
+                                                          (time.perf_counter() - import_start_time) * 1000))
+
+    name: str or None = None  # initial value
+    if len(save_file_names) == 0:
+        print_startup_profile()
+        name = input("Please enter your name: ")
+
+    step_start_time = time.perf_counter()
+    numeric_backend_thread.join()
+    startup_profile.append(("Waiting for numeric backend", time.perf_counter() - step_start_time))
+
+    # The catalog is shared by every game and not saved with the game data.
+    step_start_time = time.perf_counter()
+    catalog: Catalog = get_catalog()
+    startup_profile.append(("Catalog", time.perf_counter() - step_start_time))
 
     # Automatically load saved game data
-    file_name: str = "SAVED FISHING TYCOON GAME DATA"
-    new_game: Game
-    try:
-        new_game = load_game_data(file_name)
+    step_start_time = time.perf_counter()
+    # Falling back to the newest checkpoint if a saved game data file cannot be read
+    new_game, load_errors = load_newest_game_data(save_file_names)
+    for save_file_name, error in load_errors:
+        print("Could not load '" + str(save_file_name) + "': " + str(error))
+    startup_profile.append(("Loading saved game data", time.perf_counter() - step_start_time))
+
+    if new_game is not None:
+        print_startup_profile()
         print("Current game progress:\n", str(new_game))
-    except FileNotFoundError:
-        name: str = input("Please enter your name: ")
+        try:
+            offline_seconds: int = new_game.catch_up()
+            if offline_seconds > 0:
+                print("You have earned EXP and coins for " + str(timedelta(seconds=offline_seconds)) + " while away.")
+        except OverflowError as error:
+            print("Could not grant the EXP and coins earned while away: " + str(error))
+    else:
+        if name is None:
+            print_startup_profile()
+            name = input("Please enter your name: ")
         player: Player = Player(name)
-        new_game = Game(player, bodies_of_water, shop)
+        new_game = Game(player, catalog.bodies_of_water, catalog.shop)
+        new_game.catch_up()
+
+    # The actions of the player are applied by the headless engine, so that the session can be replayed from the
+    # event log.
+    engine: GameEngine = GameEngine(new_game)
+    event_log: object or None = None  # initial value
+    if args.event_log is not None:
+        from event_log import open_event_log
+        event_log = open_event_log(args.event_log, new_game)
+
+    # Saving changed game data in the background
+    autosaver: Autosaver = Autosaver(new_game, file_name, args.autosave_interval, args.autosave_checkpoints)
+    autosaver.start()
+
+    # Granting passive income while the player is deciding what to do
+    income_ticker: IncomeTicker = IncomeTicker(new_game, autosaver.lock, args.income_tick_interval)
+    income_ticker.start()
+
+    def quit_game():
+        # type: () -> None
+        # Saving game data and quitting the game
+        income_ticker.stop()
+        autosaver.stop()
+        if event_log is not None:
+            event_log.close()
+        if profiler is not None:
+            from instrumentation import write_profile
+            profiler.disable()
+            write_profile(profiler, metrics, args.profile)
+            sys.stderr.write("Profile written to '" + args.profile + ".prof' and '" + args.profile + ".json'.\n")
+        sys.exit()
+
+    def execute(command_line):
+        # type: (str) -> CommandResult
+        with autosaver.lock:
+            return engine.execute(command_line)
+
+    if metrics is not None:
+        from instrumentation import measure_actions
+        execute = measure_actions(execute, metrics)
 
-    old_now = datetime.now()
     print("Enter 'Y' for yes.")
     print("Enter anything else for no.")
     continue_playing: str = input("Do you want to continue playing 'Fishing Tycoon'? ")
@@ -407,13 +1593,10 @@ def main():
         # Clearing up the command line window
         clear()
 
-        # Updating the old now time and granting EXP and coins to the player
-        new_now = datetime.now()
-        time_difference = new_now - old_now
-        seconds: int = time_difference.seconds
-        old_now = new_now
-        new_game.player.gain_coins_after_time(seconds)
-        new_game.player.gain_exp_after_time(seconds)
+        # Granting EXP and coins to the player for the time elapsed since the last tick
+        income_ticker.credit()
+        if income_ticker.error is not None:
+            print("Could not grant passive income: " + income_ticker.error)
 
         # Asking the player what he/she wants to do inside the game.
         allowed: list = ["GO FISHING", "GO SHOPPING", "UPGRADE FISHING ROD", "SELL FISHING ROD", "EQUIP FISHING ROD",
@@ -428,9 +1611,7 @@ def main():
         print("Enter anything else to save game data and quit the game.")
         action: str = input("What do you want to do? ")
         if action not in allowed:
-            # Saving game data and quitting the game
-            save_game_data(new_game, file_name)
-            sys.exit()
+            quit_game()
         else:
             if action == "GO FISHING":
                 # Clearing up the command line window
@@ -440,44 +1621,38 @@ def main():
                 for body_of_water in new_game.get_bodies_of_water():
                     print(str(body_of_water) + "\n")
 
-                body_of_water_index: int = int(input("Please enter index of body of water you want to go to: "))
-                while body_of_water_index < 0 or body_of_water_index >= len(new_game.get_bodies_of_water()) or \
-                    (0 <= body_of_water_index < len(new_game.get_bodies_of_water()) and
-                     new_game.get_bodies_of_water()[body_of_water_index].minimum_player_level > new_game.player.level):
-                    body_of_water_index = int(input("Sorry, invalid input! "
-                                                    "Please enter index of body of water you want to go to: "))
-
-                selected_body_of_water: BodyOfWater = new_game.get_bodies_of_water()[body_of_water_index]
-                wild_sea_creature: SeaCreature = selected_body_of_water.get_potential_sea_creatures()[random.randint
-                (0, len(selected_body_of_water.get_potential_sea_creatures()) - 1)]
-                print("A wild " + str(wild_sea_creature.name) + " appeared!")
+                unlocked_indices: set = set(new_game.get_unlocked_body_of_water_indices())
+                body_of_water_index: int = input_index("Please enter index of body of water you want to go to: ")
+                while body_of_water_index not in unlocked_indices:
+                    body_of_water_index = input_index("Sorry, invalid input! "
+                                                      "Please enter index of body of water you want to go to: ")
+
+                print(execute("GO FISHING " + str(body_of_water_index)).message)
+                wild_sea_creature: SeaCreature = engine.wild_sea_creature
                 print("Enter 'Y' for yes.")
                 print("Enter anything else for no.")
                 catch: str = input("Do you want to catch " + str(wild_sea_creature.name) + "? ")
                 if catch == "Y":
-                    sea_creature_flees: bool = False  # initial value
-                    while wild_sea_creature.curr_hp > 0 and not sea_creature_flees:
+                    while engine.wild_sea_creature is not None:
                         # Asking the player whether he/she wants to attack the sea creature or flee
                         print("Enter 'ATTACK' to attack.")
+                        print("Enter 'AUTO' to keep attacking until the sea creature is caught or flees.")
                         print("Enter anything else to flee.")
                         action: str = input("What do you want to do with the sea creature? ")
-                        if action == "ATTACK":
-                            has_fishing_rod: bool = new_game.player.fishing_rod is not None
-                            if has_fishing_rod:
-                                is_crit: bool = random.random() <= 0.3
-                                damage: mpf = new_game.player.attack_power if not is_crit else \
-                                    new_game.player.attack_power * new_game.player.fishing_rod.critical_damage
-                                wild_sea_creature.curr_hp -= damage
+                        if action == "AUTO":
+                            battle_result: CommandResult = execute("AUTO")
+                            if battle_result.data["fled"]:
+                                print(str(wild_sea_creature.name) + " fled after " +
+                                      str(battle_result.data["turns"]) + " turns.")
                             else:
-                                wild_sea_creature.curr_hp -= new_game.player.attack_power
-
-                            sea_creature_flees = random.random() <= wild_sea_creature.flee_chance
+                                print(battle_result.message)
+                        elif action == "ATTACK":
+                            print(execute("ATTACK").message)
                         else:
                             break
 
-                    if wild_sea_creature.curr_hp <= 0:
-                        print("You have successfully caught " + str(wild_sea_creature.name) + "!")
-                        new_game.player.catch_sea_creature(wild_sea_creature)
+                if engine.wild_sea_creature is not None:
+                    execute("FLEE")
 
             elif action == "GO SHOPPING":
                 # Clearing up the command line window
@@ -487,23 +1662,33 @@ def main():
                 for fishing_rod in new_game.shop.get_fishing_rods_sold():
                     print(str(fishing_rod) + "\n")
 
-                fishing_rod_index: int = int(input("Please enter index of fishing rod you want to buy: "))
+                fishing_rod_index: int = input_index("Please enter index of fishing rod you want to buy: ")
                 while fishing_rod_index < 0 or fishing_rod_index >= len(new_game.shop.get_fishing_rods_sold()):
-                    fishing_rod_index = int(input("Sorry, invalid input! "
-                                                  "Please enter index of fishing rod you want to buy: "))
+                    fishing_rod_index = input_index("Sorry, invalid input! "
+                                                    "Please enter index of fishing rod you want to buy: ")
 
-                to_buy: FishingRod = new_game.shop.get_fishing_rods_sold()[fishing_rod_index]
-                new_game.player.buy_fishing_rod(to_buy)
+                buy_result: CommandResult = execute("GO SHOPPING " + str(fishing_rod_index))
+                if not buy_result.success:
+                    print(buy_result.message)
 
             elif action == "UPGRADE FISHING ROD":
                 # Clearing up the command line window
                 clear()
 
                 if isinstance(new_game.player.fishing_rod, FishingRod):
-                    if new_game.player.coins >= new_game.player.fishing_rod.level_up_coin_cost:
-                        new_game.player.fishing_rod.level_up()
-                    else:
-                        print("Sorry, you have insufficient coins!")
+                    print("Your fishing rod is at level " + str(new_game.player.fishing_rod.level) + ". Upgrading it "
+                          "by 1 level costs " + str(new_game.player.fishing_rod.level_up_coin_cost) + " coins, and "
+                          "you can afford " + str(new_game.player.get_affordable_fishing_rod_levels()) + " levels.")
+                    print("Enter 'MAX' to upgrade it by as many levels as you can afford.")
+                    levels: str = input("Please enter number of levels you want to upgrade your fishing rod by: ")
+                    while levels != "MAX" and not (levels.isdecimal() and int(levels) > 0):
+                        levels = input("Sorry, invalid input! "
+                                       "Please enter number of levels you want to upgrade your fishing rod by: ")
+
+                    upgrade_result: CommandResult = execute("UPGRADE FISHING ROD MAX" if levels == "MAX" else
+                                                            "UPGRADE FISHING ROD LEVELS " + levels)
+                    if not upgrade_result.success:
+                        print(upgrade_result.message)
                 else:
                     pass  # Do nothing
 
@@ -518,13 +1703,12 @@ def main():
                     for fishing_rod in new_game.player.get_fishing_rods_owned():
                         print(str(fishing_rod) + "\n")
 
-                    fishing_rod_index: int = int(input("Please enter index of fishing rod you want to sell: "))
+                    fishing_rod_index: int = input_index("Please enter index of fishing rod you want to sell: ")
                     while fishing_rod_index < 0 or fishing_rod_index >= len(new_game.player.get_fishing_rods_owned()):
-                        fishing_rod_index = int(input("Sorry, invalid input! "
-                                                      "Please enter index of fishing rod you want to sell: "))
+                        fishing_rod_index = input_index("Sorry, invalid input! "
+                                                        "Please enter index of fishing rod you want to sell: ")
 
-                    to_sell: FishingRod = new_game.player.get_fishing_rods_owned()[fishing_rod_index]
-                    new_game.player.sell_fishing_rod(to_sell)
+                    execute("SELL FISHING ROD " + str(fishing_rod_index))
 
             elif action == "EQUIP FISHING ROD":
                 # Clearing up the command line window
@@ -537,20 +1721,19 @@ def main():
                     for fishing_rod in new_game.player.get_fishing_rods_owned():
                         print(str(fishing_rod) + "\n")
 
-                    fishing_rod_index: int = int(input("Please enter index of fishing rod you want to equip: "))
+                    fishing_rod_index: int = input_index("Please enter index of fishing rod you want to equip: ")
                     while fishing_rod_index < 0 or fishing_rod_index >= len(new_game.player.get_fishing_rods_owned()):
-                        fishing_rod_index = int(input("Sorry, invalid input! "
-                                                      "Please enter index of fishing rod you want to equip: "))
+                        fishing_rod_index = input_index("Sorry, invalid input! "
+                                                        "Please enter index of fishing rod you want to equip: ")
 
-                    to_equip: FishingRod = new_game.player.get_fishing_rods_owned()[fishing_rod_index]
-                    new_game.player.add_fishing_rod(to_equip)
+                    execute("EQUIP FISHING ROD " + str(fishing_rod_index))
 
             elif action == "UNEQUIP FISHING ROD":
                 # Clearing up the command line window
                 clear()
 
                 if isinstance(new_game.player.fishing_rod, FishingRod):
-                    new_game.player.remove_fishing_rod()
+                    execute("UNEQUIP FISHING ROD")
                 else:
                     pass  # Do nothing
 
@@ -558,15 +1741,28 @@ def main():
                 # Clearing up the command line window
                 clear()
 
-                print(str(new_game.player))
+                income_ticker.credit()
+                print("Enter 'ALL' to list every sea creature in your aquarium.")
+                print("Enter anything else to view a summary of your aquarium.")
+                view: str = input("How do you want to view your aquarium? ")
+
+                # The values changed by passive income in the background are copied under the lock, so that they are
+                # all from the same tick. The rest of the stats is written without holding the lock while waiting for
+                # the next page, since only this loop changes the fishing rods and the aquarium of the player.
+                view_stats_start_time: float = time.perf_counter()
+                with autosaver.lock:
+                    header_lines: list = new_game.player.get_header_lines()
+                write_lines(new_game.player.iter_lines(view != "ALL", header_lines), page_size=args.page_size)
+                if metrics is not None:
+                    # Including the time spent waiting for the next page
+                    metrics.record_latency("Action VIEW STATS", time.perf_counter() - view_stats_start_time)
+                    metrics.count("Action VIEW STATS")
 
         print("Enter 'Y' for yes.")
         print("Enter anything else for no.")
         continue_playing = input("Do you want to continue playing 'Fishing Tycoon'? ")
 
-    # Saving game data and quitting the game
-    save_game_data(new_game, file_name)
-    sys.exit()
+    quit_game()
 
 
 if __name__ == '__main__':
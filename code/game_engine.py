@@ -0,0 +1,394 @@
+"""
+This file contains the headless engine of the game "Fishing Tycoon".
+The engine applies a stream of text commands (e.g. "GO FISHING 0", "ATTACK", "GO SHOPPING 3") to a game without
+clearing the screen or asking for input, and returns a structured result for every command. It is used to script the
+game for automated testing and load generation.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import json
+import random
+import sys
+import time
+from auto_battle import CRITICAL_HIT_CHANCE, BattleResult, resolve_battle
+from income_ticker import IncomeTicker
+from numeric import NUMERIC_BACKENDS, set_numeric_backend
+from catalog import Catalog, get_catalog
+from fishing_tycoon import Game, Player, FishingRod, BodyOfWater, SeaCreature, load_game_data, save_game_data
+
+
+# Creating static functions to be used throughout this file
+
+
+def parse_command(command_line):
+    # type: (str) -> tuple
+    """
+    Splits a command line into the upper case command name and its list of integer arguments, which are the
+    trailing words of the command line, e.g. "go fishing 1" becomes ("GO FISHING", [1]).
+    """
+    words: list = command_line.split()
+    arguments: list = []
+    while words:
+        try:
+            arguments.append(int(words[-1]))
+        except ValueError:
+            break
+        words.pop()
+
+    arguments.reverse()
+    return " ".join(words).upper(), arguments
+
+
+# Creating necessary classes
+
+
+class CommandResult:
+    """
+    This class contains attributes of the outcome of a command applied by the game engine.
+    """
+
+    def __init__(self, command, success, message, data=None):
+        # type: (str, bool, str, dict or None) -> None
+        self.command: str = command
+        self.success: bool = success
+        self.message: str = message
+        self.data: dict = data if data is not None else {}
+
+    def to_dict(self):
+        # type: () -> dict
+        return {"command": self.command, "success": self.success, "message": self.message, "data": self.data}
+
+    def to_json(self):
+        # type: () -> str
+        return json.dumps(self.to_dict())
+
+    def __str__(self):
+        # type: () -> str
+        return self.message
+
+
+class GameEngine:
+    """
+    This class contains attributes of a game played through text commands.
+    The sea creature the player is currently fighting is kept between commands, so that a battle can be fought with
+    one "ATTACK" command per turn. Passive income is only granted by "WAIT" commands, unless real_time is True, in
+    which case the player is granted EXP and coins for the real time elapsed before every command, including the time
+    since the game was last played.
+    Random numbers are drawn from the game's random number generator unless another one is given, and the commands
+    are recorded in the game's event log, so that the game can be replayed (see event_log.py).
+    """
+
+    def __init__(self, game, rng=None, real_time=False):
+        # type: (Game, random.Random or None, bool) -> None
+        self.game: Game = game
+        self.rng: random.Random = rng if rng is not None else game.rng
+        self.income_ticker: IncomeTicker or None = None  # initial value
+        if real_time:
+            catch_up_error: str or None = None  # initial value
+            try:
+                game.catch_up()
+            except OverflowError as error:
+                # The time away was credited without the income (see Game.catch_up()), so the game can go on.
+                catch_up_error = str(error)
+            self.income_ticker = IncomeTicker(game, tick_interval=0)
+            self.income_ticker.error = catch_up_error
+        self.wild_sea_creature: SeaCreature or None = None  # initial value
+        # Command name -> (method applying the command, number of integer arguments)
+        self.__command_handlers: dict = {
+            "GO FISHING": (self.go_fishing, 1),
+            "ATTACK": (self.attack, 0),
+            "AUTO": (self.auto, 0),
+            "FLEE": (self.flee, 0),
+            "GO SHOPPING": (self.go_shopping, 1),
+            "UPGRADE FISHING ROD": (self.upgrade_fishing_rod, 0),
+            "UPGRADE FISHING ROD LEVELS": (self.upgrade_fishing_rod_levels, 1),
+            "UPGRADE FISHING ROD MAX": (self.upgrade_fishing_rod_max, 0),
+            "SELL FISHING ROD": (self.sell_fishing_rod, 1),
+            "EQUIP FISHING ROD": (self.equip_fishing_rod, 1),
+            "UNEQUIP FISHING ROD": (self.unequip_fishing_rod, 0),
+            "VIEW STATS": (self.view_stats, 0),
+            "WAIT": (self.wait, 1)
+        }
+
+    def get_command_names(self):
+        # type: () -> list
+        return list(self.__command_handlers)
+
+    def execute(self, command_line):
+        # type: (str) -> CommandResult
+        """
+        Applies one command to the game. Invalid commands and arguments, and values out of the range of the numeric
+        backend (which are not changed, see Player.get_level_up()), are reported in the result instead of raising
+        exceptions.
+        """
+        command, arguments = parse_command(command_line)
+        handler_and_argument_count: tuple or None = self.__command_handlers.get(command)
+        if handler_and_argument_count is None:
+            return CommandResult(command, False, "Unknown command '" + command_line.strip() + "'.")
+        handler, argument_count = handler_and_argument_count
+        if len(arguments) != argument_count:
+            return CommandResult(command, False, "'" + command + "' takes " + str(argument_count) + " argument(s).")
+
+        if self.income_ticker is not None:
+            self.income_ticker.credit()
+        if self.game.event_log is not None:
+            self.game.event_log.record_command(command_line.strip())
+        try:
+            return handler(command, *arguments)
+        except OverflowError as error:
+            return CommandResult(command, False, str(error))
+
+    def run(self, command_lines):
+        # type: (iter) -> iter
+        """
+        Applies every command in command_lines and yields their results. Empty lines and lines starting with '#' are
+        skipped.
+        """
+        for command_line in command_lines:
+            stripped: str = command_line.strip()
+            if stripped == "" or stripped.startswith("#"):
+                continue
+            yield self.execute(stripped)
+
+    def __get_sea_creature_data(self):
+        # type: () -> dict
+        return {"sea_creature": self.wild_sea_creature.name, "hp": str(self.wild_sea_creature.curr_hp)}
+
+    def __finish_battle(self, command, data):
+        # type: (str, dict) -> CommandResult
+        sea_creature: SeaCreature = self.wild_sea_creature
+        if sea_creature.curr_hp <= 0:
+            self.wild_sea_creature = None
+            self.game.player.catch_sea_creature(sea_creature)
+            data["caught"] = True
+            return CommandResult(command, True, "You have successfully caught " + str(sea_creature.name) + "!", data)
+        data["caught"] = False
+        if data.get("fled", False):
+            self.wild_sea_creature = None
+            return CommandResult(command, True, str(sea_creature.name) + " fled.", data)
+        return CommandResult(command, True, str(sea_creature.name) + " has " + str(sea_creature.curr_hp) +
+                             " HP left.", data)
+
+    def go_fishing(self, command, body_of_water_index):
+        # type: (str, int) -> CommandResult
+        bodies_of_water: list = self.game.get_bodies_of_water()
+        if body_of_water_index < 0 or body_of_water_index >= len(bodies_of_water):
+            return CommandResult(command, False, "Invalid body of water index " + str(body_of_water_index) + ".")
+        selected_body_of_water: BodyOfWater = bodies_of_water[body_of_water_index]
+        if selected_body_of_water.minimum_player_level > self.game.player.level:
+            return CommandResult(command, False, "You need to be at least level " +
+                                 str(selected_body_of_water.minimum_player_level) + " to fish in " +
+                                 str(selected_body_of_water.name) + ".")
+
+        # A battle which is still going on is abandoned.
+        self.wild_sea_creature = selected_body_of_water.spawn_sea_creature(self.rng)
+        return CommandResult(command, True, "A wild " + str(self.wild_sea_creature.name) + " appeared!",
+                             self.__get_sea_creature_data())
+
+    def attack(self, command):
+        # type: (str) -> CommandResult
+        if self.wild_sea_creature is None:
+            return CommandResult(command, False, "There is no sea creature to attack.")
+
+        player: Player = self.game.player
+        is_crit: bool = False  # initial value
+        if player.fishing_rod is not None:
+            is_crit = self.rng.random() <= CRITICAL_HIT_CHANCE
+            self.wild_sea_creature.curr_hp -= player.attack_power if not is_crit else \
+                player.attack_power * player.fishing_rod.critical_damage
+        else:
+            self.wild_sea_creature.curr_hp -= player.attack_power
+
+        data: dict = self.__get_sea_creature_data()
+        data["critical_hit"] = is_crit
+        data["fled"] = self.rng.random() <= self.wild_sea_creature.flee_chance and self.wild_sea_creature.curr_hp > 0
+        return self.__finish_battle(command, data)
+
+    def auto(self, command):
+        # type: (str) -> CommandResult
+        if self.wild_sea_creature is None:
+            return CommandResult(command, False, "There is no sea creature to attack.")
+
+        player: Player = self.game.player
+        battle_result: BattleResult = resolve_battle(
+            player.attack_power, player.fishing_rod.critical_damage if player.fishing_rod is not None else None,
+            self.wild_sea_creature, self.rng)
+        data: dict = self.__get_sea_creature_data()
+        data["turns"] = battle_result.turns
+        data["critical_hits"] = battle_result.critical_hits
+        data["fled"] = battle_result.fled
+        return self.__finish_battle(command, data)
+
+    def flee(self, command):
+        # type: (str) -> CommandResult
+        if self.wild_sea_creature is None:
+            return CommandResult(command, False, "There is no sea creature to flee from.")
+        self.wild_sea_creature = None
+        return CommandResult(command, True, "You fled.")
+
+    def __get_fishing_rod(self, command, fishing_rods, fishing_rod_index):
+        # type: (str, list, int) -> FishingRod or CommandResult
+        if fishing_rod_index < 0 or fishing_rod_index >= len(fishing_rods):
+            return CommandResult(command, False, "Invalid fishing rod index " + str(fishing_rod_index) + ".")
+        return fishing_rods[fishing_rod_index]
+
+    def go_shopping(self, command, fishing_rod_index):
+        # type: (str, int) -> CommandResult
+        to_buy: FishingRod or CommandResult = self.__get_fishing_rod(
+            command, self.game.shop.get_fishing_rods_sold(), fishing_rod_index)
+        if isinstance(to_buy, CommandResult):
+            return to_buy
+        if not self.game.player.buy_fishing_rod(to_buy):
+            return CommandResult(command, False, "Sorry, you have insufficient coins!",
+                                 {"coins": str(self.game.player.coins)})
+        return CommandResult(command, True, "You have bought " + str(to_buy.name) + ".",
+                             {"fishing_rod": to_buy.name, "coins": str(self.game.player.coins)})
+
+    def upgrade_fishing_rod(self, command):
+        # type: (str) -> CommandResult
+        return self.upgrade_fishing_rod_levels(command, 1)
+
+    def upgrade_fishing_rod_levels(self, command, levels):
+        # type: (str, int) -> CommandResult
+        player: Player = self.game.player
+        if player.fishing_rod is None:
+            return CommandResult(command, False, "You have no fishing rod equipped.")
+        if levels < 1:
+            return CommandResult(command, False, "Cannot upgrade a fishing rod by less than 1 level.")
+        if not player.level_up_fishing_rod(levels):
+            return CommandResult(command, False, "Sorry, you have insufficient coins!", {"coins": str(player.coins)})
+        return CommandResult(command, True, "You have upgraded " + str(player.fishing_rod.name) + " to level " +
+                             str(player.fishing_rod.level) + ".",
+                             {"fishing_rod": player.fishing_rod.name, "level": player.fishing_rod.level,
+                              "levels": levels, "coins": str(player.coins)})
+
+    def upgrade_fishing_rod_max(self, command):
+        # type: (str) -> CommandResult
+        # Upgrading by as many levels as the player can afford, or failing like a single level upgrade if none
+        return self.upgrade_fishing_rod_levels(command, max(1, self.game.player.get_affordable_fishing_rod_levels()))
+
+    def sell_fishing_rod(self, command, fishing_rod_index):
+        # type: (str, int) -> CommandResult
+        to_sell: FishingRod or CommandResult = self.__get_fishing_rod(
+            command, self.game.player.get_fishing_rods_owned(), fishing_rod_index)
+        if isinstance(to_sell, CommandResult):
+            return to_sell
+        self.game.player.sell_fishing_rod(to_sell)
+        return CommandResult(command, True, "You have sold " + str(to_sell.name) + ".",
+                             {"fishing_rod": to_sell.name, "coins": str(self.game.player.coins)})
+
+    def equip_fishing_rod(self, command, fishing_rod_index):
+        # type: (str, int) -> CommandResult
+        to_equip: FishingRod or CommandResult = self.__get_fishing_rod(
+            command, self.game.player.get_fishing_rods_owned(), fishing_rod_index)
+        if isinstance(to_equip, CommandResult):
+            return to_equip
+        self.game.player.add_fishing_rod(to_equip)
+        return CommandResult(command, True, "You have equipped " + str(to_equip.name) + ".",
+                             {"fishing_rod": to_equip.name, "attack_power": str(self.game.player.attack_power)})
+
+    def unequip_fishing_rod(self, command):
+        # type: (str) -> CommandResult
+        if not self.game.player.remove_fishing_rod():
+            return CommandResult(command, False, "You have no fishing rod equipped.")
+        return CommandResult(command, True, "You have unequipped your fishing rod.",
+                             {"attack_power": str(self.game.player.attack_power)})
+
+    def view_stats(self, command):
+        # type: (str) -> CommandResult
+        player: Player = self.game.player
+        return CommandResult(command, True, "Stats of " + str(player.name) + ".", {
+            "name": player.name,
+            "level": player.level,
+            "exp": str(player.exp),
+            "required_exp": str(player.required_exp),
+            "coins": str(player.coins),
+            "attack_power": str(player.attack_power),
+            "fishing_rod": player.fishing_rod.name if player.fishing_rod is not None else None,
+            "fishing_rods_owned": len(player.get_fishing_rods_owned()),
+            "sea_creatures": len(player.aquarium)
+        })
+
+    def wait(self, command, seconds):
+        # type: (str, int) -> CommandResult
+        if seconds < 0:
+            return CommandResult(command, False, "Cannot wait for a negative number of seconds.")
+        player: Player = self.game.player
+        player.gain_income_after_time(seconds)
+        return CommandResult(command, True, "You waited for " + str(seconds) + " seconds.",
+                             {"level": player.level, "coins": str(player.coins)})
+
+
+def main(argv=None):
+    """
+    This main function runs commands from a file or the standard input on a game and writes one result per line.
+    :param argv: list of command line arguments, defaults to sys.argv[1:]
+    :return: None
+    """
+
+    import argparse
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Fishing Tycoon headless engine")
+    parser.add_argument("input", nargs="?", default="-",
+                        help="file with one command per line, '-' (the default) to read the standard input")
+    parser.add_argument("--save-file", type=str, default=None,
+                        help="saved game data to load before and to save after running the commands")
+    parser.add_argument("--name", type=str, default="Player", help="name of the player if a new game is created")
+    parser.add_argument("--format", choices=["json", "text"], default="json",
+                        help="'json' writes one JSON object per result, 'text' writes the messages")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="random seed, which replaces the state of the random number generator of loaded games")
+    parser.add_argument("--event-log", type=str, default=None,
+                        help="file to append the snapshot of the game and the events of this run to")
+    parser.add_argument("--real-time", action="store_true",
+                        help="grant passive income for the real time elapsed instead of only for WAIT commands")
+    parser.add_argument("--numeric-backend", choices=sorted(NUMERIC_BACKENDS), default="mpmath",
+                        help="numeric backend used for economy values")
+    parser.add_argument("--summary", action="store_true",
+                        help="write the number of commands run per second to the standard error")
+    args: argparse.Namespace = parser.parse_args(argv)
+    set_numeric_backend(args.numeric_backend)
+
+    game: Game or None = None  # initial value
+    if args.save_file is not None:
+        try:
+            game = load_game_data(args.save_file)
+        except FileNotFoundError:
+            pass
+    if game is None:
+        catalog: Catalog = get_catalog()
+        game = Game(Player(args.name), catalog.bodies_of_water, catalog.shop, args.seed)
+    elif args.seed is not None:
+        game.rng.seed(args.seed)
+
+    engine: GameEngine = GameEngine(game, real_time=args.real_time)
+    event_log: object or None = None  # initial value
+    if args.event_log is not None:
+        from event_log import open_event_log
+        event_log = open_event_log(args.event_log, game)
+    input_file = sys.stdin if args.input == "-" else open(args.input, "r")
+    write = sys.stdout.write
+    commands: int = 0  # initial value
+    start: float = time.perf_counter()
+    try:
+        for result in engine.run(input_file):
+            commands += 1
+            write((result.to_json() if args.format == "json" else result.message) + "\n")
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if event_log is not None:
+            event_log.close()
+    elapsed: float = time.perf_counter() - start
+
+    if args.save_file is not None:
+        save_game_data(game, args.save_file)
+    if args.summary:
+        sys.stderr.write("Ran " + str(commands) + " commands in " + str(round(elapsed, 3)) + " seconds (" +
+                         str(round(commands / elapsed if elapsed > 0 else 0)) + " commands per second).\n")
+
+
+if __name__ == '__main__':
+    main()
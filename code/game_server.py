@@ -0,0 +1,298 @@
+"""
+This file contains the multiplayer server of the game "Fishing Tycoon".
+Every TCP connection is a session playing its own game with the commands of the headless engine, one command per
+line, and every result is sent back as one line of JSON. All sessions are served by one asyncio event loop, passive
+income is only calculated when a session sends a command, and changed games are saved to one file per player.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import re
+import signal
+from autosave import write_file_atomically
+from event_log import EventLog, open_event_log
+from game_engine import CommandResult, GameEngine, parse_command
+from numeric import NUMERIC_BACKENDS, set_numeric_backend
+from save_format import encode_game_data
+from catalog import Catalog, get_catalog
+from fishing_tycoon import Game, Player, load_game_data
+
+
+# Creating constants used throughout this file
+
+
+PLAYER_NAME_PATTERN: re.Pattern = re.compile(r"[A-Za-z0-9_-]{1,32}")  # Player names are also used as file names
+logger: logging.Logger = logging.getLogger("game_server")
+
+
+# Creating necessary classes
+
+
+class Session:
+    """
+    This class contains attributes of a player connected to the server.
+    """
+
+    def __init__(self, name, engine, file_name, event_log=None):
+        # type: (str, GameEngine, str, EventLog or None) -> None
+        self.name: str = name
+        self.engine: GameEngine = engine
+        self.file_name: str = file_name
+        self.event_log: EventLog or None = event_log
+        self.saved_change_count: int = engine.game.player.change_count
+        self.save_lock: asyncio.Lock = asyncio.Lock()
+
+    def is_dirty(self):
+        # type: () -> bool
+        return self.engine.game.player.change_count != self.saved_change_count
+
+
+class GameServer:
+    """
+    This class contains attributes of a server hosting the games of many players.
+    """
+
+    def __init__(self, save_directory, flush_interval=30.0, seed=None, event_log_directory=None):
+        # type: (str, float, int or None, str or None) -> None
+        self.save_directory: str = save_directory
+        self.flush_interval: float = flush_interval
+        self.event_log_directory: str or None = event_log_directory  # Where the sessions are recorded, if anywhere
+        self.sessions: dict = {}  # Player name -> Session of the connected player
+        # Player name -> task saving the game of a player who left, which a new login of the player waits for
+        self.leaving_sessions: dict = {}
+        self.commands: int = 0  # Number of commands processed since the server started
+        self.__rng: random.Random = random.Random(seed)
+        self.__server: asyncio.AbstractServer or None = None  # initial value
+        self.__flush_task: asyncio.Task or None = None  # initial value
+
+    def get_file_name(self, name):
+        # type: (str) -> str
+        return os.path.join(self.save_directory, name + ".save")
+
+    async def start(self, host, port):
+        # type: (str, int) -> None
+        os.makedirs(self.save_directory, exist_ok=True)
+        if self.event_log_directory is not None:
+            os.makedirs(self.event_log_directory, exist_ok=True)
+        self.__server = await asyncio.start_server(self.handle_connection, host, port, backlog=4096)
+        if self.flush_interval > 0:
+            self.__flush_task = asyncio.create_task(self.__flush_periodically())
+
+    def get_port(self):
+        # type: () -> int
+        return self.__server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        # type: () -> None
+        await self.__server.serve_forever()
+
+    async def close(self):
+        # type: () -> None
+        """
+        Stops accepting connections and saves every changed game.
+        """
+        if self.__flush_task is not None:
+            self.__flush_task.cancel()
+        if self.__server is not None:
+            self.__server.close()
+        await self.flush_sessions()
+        await asyncio.gather(*list(self.leaving_sessions.values()), return_exceptions=True)
+        for session in self.sessions.values():
+            if session.event_log is not None:
+                session.event_log.close()
+
+    async def __flush_periodically(self):
+        # type: () -> None
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush_sessions()
+
+    async def flush_sessions(self):
+        # type: () -> None
+        await asyncio.gather(*[self.save_session(session) for session in list(self.sessions.values())])
+
+    async def save_session(self, session):
+        # type: (Session) -> None
+        async with session.save_lock:
+            if not session.is_dirty():
+                return
+            # The game is encoded in the event loop, so no command can change it halfway. Only the slow disk write
+            # is moved to a worker thread.
+            change_count: int = session.engine.game.player.change_count
+            data: bytes = encode_game_data(session.engine.game)
+            await asyncio.get_running_loop().run_in_executor(None, write_file_atomically, session.file_name, data)
+            session.saved_change_count = change_count
+
+    async def end_session(self, session):
+        # type: (Session) -> None
+        """
+        Saves the game of a player who left and closes their event log. The player stays connected until then, so
+        that logging in again on another connection cannot load older saved game data.
+        """
+        try:
+            await self.save_session(session)
+        finally:
+            if session.event_log is not None:
+                session.event_log.close()
+            del self.sessions[session.name]
+            del self.leaving_sessions[session.name]
+
+    async def login(self, name):
+        # type: (str) -> Session or CommandResult
+        if PLAYER_NAME_PATTERN.fullmatch(name) is None:
+            return CommandResult("LOGIN", False, "Player names consist of 1 to 32 letters, digits, '_' and '-'.")
+        if name in self.leaving_sessions:
+            # The player left on another connection, whose game is still being saved.
+            await asyncio.wait([self.leaving_sessions[name]])
+        if name in self.sessions:
+            return CommandResult("LOGIN", False, "Player '" + name + "' is already connected.")
+
+        file_name: str = self.get_file_name(name)
+        game: Game or None = None  # initial value
+        try:
+            game = await asyncio.get_running_loop().run_in_executor(None, load_game_data, file_name)
+        except FileNotFoundError:
+            pass
+        except (ValueError, EOFError):
+            return CommandResult("LOGIN", False, "The saved game data of '" + name + "' could not be loaded.")
+        if name in self.sessions:
+            # The same player logged in on another connection while the saved game data was loaded.
+            return CommandResult("LOGIN", False, "Player '" + name + "' is already connected.")
+        if game is None:
+            catalog: Catalog = get_catalog()
+            game = Game(Player(name), catalog.bodies_of_water, catalog.shop, self.__rng.getrandbits(64))
+
+        engine: GameEngine = GameEngine(game, real_time=True)
+        if engine.income_ticker.error is not None:
+            # The time away was credited without the income, so the player can keep playing.
+            logger.warning("Could not grant the passive income of '" + name + "' while away: " +
+                           engine.income_ticker.error)
+        event_log: EventLog or None = None  # initial value
+        if self.event_log_directory is not None:
+            # Every session of the player is appended to the same event log, starting with a snapshot.
+            event_log = open_event_log(os.path.join(self.event_log_directory, name + ".log"), game)
+        session: Session = Session(name, engine, file_name, event_log)
+        self.sessions[name] = session
+        return session
+
+    async def handle_connection(self, reader, writer):
+        # type: (asyncio.StreamReader, asyncio.StreamWriter) -> None
+        session: Session or None = None  # initial value
+
+        def send(result):
+            # type: (CommandResult) -> None
+            writer.write((result.to_json() + "\n").encode())
+
+        send(CommandResult("CONNECT", True, "Welcome to 'Fishing Tycoon'. Enter 'LOGIN <name>' to start playing."))
+        try:
+            while True:
+                line: bytes = await reader.readline()
+                if not line:
+                    break
+                command_line: str = line.decode(errors="replace").strip()
+                if command_line == "":
+                    continue
+                words: list = command_line.split()
+                command: str = words[0].upper()
+                if command == "QUIT":
+                    send(CommandResult("QUIT", True, "Goodbye!"))
+                    break
+                elif command == "LOGIN":
+                    if session is not None:
+                        send(CommandResult("LOGIN", False, "You are already logged in as '" + session.name + "'."))
+                    elif len(words) != 2:
+                        send(CommandResult("LOGIN", False, "Enter 'LOGIN <name>' to start playing."))
+                    else:
+                        login_result: Session or CommandResult = await self.login(words[1])
+                        if isinstance(login_result, CommandResult):
+                            send(login_result)
+                        else:
+                            session = login_result
+                            send(CommandResult("LOGIN", True, "Welcome, " + session.name + "!",
+                                               {"level": session.engine.game.player.level}))
+                elif session is None:
+                    send(CommandResult(parse_command(command_line)[0], False,
+                                       "Enter 'LOGIN <name>' to start playing."))
+                else:
+                    self.commands += 1
+                    send(session.engine.execute(command_line))
+
+                # Waiting for slow clients instead of buffering an unlimited number of results
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass  # The connection was lost or the client sent a line which is too long
+        finally:
+            try:
+                if session is not None:
+                    self.leaving_sessions[session.name] = asyncio.create_task(self.end_session(session))
+                    try:
+                        # The game is saved even if this connection is cancelled, e.g. when the server is closed.
+                        await asyncio.shield(self.leaving_sessions[session.name])
+                    except Exception:
+                        # e.g. OSError if the disk is full, which must not keep the connection open
+                        logger.exception("Could not save the game of '" + session.name + "'.")
+            finally:
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except ConnectionError:
+                    pass
+
+
+# Creating static functions to be used throughout this file
+
+
+async def run_server(host, port, save_directory, flush_interval, seed, event_log_directory):
+    # type: (str, int, str, float, int or None, str or None) -> None
+    server: GameServer = GameServer(save_directory, flush_interval, seed, event_log_directory)
+    await server.start(host, port)
+    print("Serving 'Fishing Tycoon' on " + str(host) + ":" + str(server.get_port()) + ".")
+    try:
+        # Stopping like on Ctrl+C when the server is terminated, so that every changed game is saved
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+    except NotImplementedError:
+        pass  # Signal handlers are not supported on Windows
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    """
+    This main function is used to run the multiplayer server.
+    :param argv: list of command line arguments, defaults to sys.argv[1:]
+    :return: None
+    """
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Fishing Tycoon multiplayer server")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=7777, help="port to listen on")
+    parser.add_argument("--save-directory", type=str, default="saves",
+                        help="directory where the saved game data of every player is stored")
+    parser.add_argument("--flush-interval", type=float, default=30.0,
+                        help="number of seconds between saves of changed games, 0 to only save when players leave")
+    parser.add_argument("--seed", type=int, default=None, help="random seed of new games")
+    parser.add_argument("--event-log-directory", type=str, default=None,
+                        help="directory to record the sessions of every player in, which can be replayed with "
+                             "event_log.py")
+    parser.add_argument("--numeric-backend", choices=sorted(NUMERIC_BACKENDS), default="mpmath",
+                        help="numeric backend used for economy values")
+    args: argparse.Namespace = parser.parse_args(argv)
+    set_numeric_backend(args.numeric_backend)
+
+    try:
+        asyncio.run(run_server(args.host, args.port, args.save_directory, args.flush_interval, args.seed,
+                                args.event_log_directory))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+
+
+if __name__ == '__main__':
+    main()
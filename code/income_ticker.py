@@ -0,0 +1,83 @@
+"""
+This file contains the passive income ticker of the game "Fishing Tycoon".
+The ticker grants the player EXP and coins from their aquarium for the time elapsed while the game is running, either
+from a background thread on a fixed tick or whenever the game is about to be read or changed.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import threading
+import time
+from datetime import datetime, timedelta
+from fishing_tycoon import Game
+
+
+# Creating necessary classes
+
+
+class IncomeTicker:
+    """
+    This class contains attributes of the passive income ticker of a game.
+    Time is measured with a monotonic clock, so changes of the system clock while the game is running neither grant
+    nor take away income. Only whole seconds are granted, and the remaining fraction of a second is kept for the next
+    credit. Every credit costs the same no matter how many seconds it grants, since the income of the aquarium is a
+    running total, so a late tick simply grants several seconds at once.
+    The game is assumed to have been caught up (see Game.catch_up()) when the ticker is created.
+    """
+
+    def __init__(self, game, lock=None, tick_interval=1.0, clock=time.monotonic):
+        # type: (Game, threading.RLock or None, float, callable) -> None
+        self.game: Game = game
+        self.lock: threading.RLock = lock if lock is not None else threading.RLock()
+        self.tick_interval: float = tick_interval
+        self.__clock: callable = clock
+        self.__credited_time: float = clock()  # Time up to which the player has been granted income
+        self.__stop_event: threading.Event = threading.Event()
+        self.__thread: threading.Thread or None = None  # initial value
+        # Message of the last credit whose income was out of the range of the numeric backend, or None
+        self.error: str or None = None  # initial value
+
+    def credit(self):
+        # type: () -> int
+        """
+        Grants the player EXP and coins for the whole seconds elapsed since the last credit.
+        Returns the number of seconds credited. Income out of the range of the numeric backend is not granted, and the
+        error is kept in self.error instead of being raised, so that the background thread keeps running.
+        """
+        with self.lock:
+            elapsed: float = self.__clock() - self.__credited_time
+            seconds: int = int(elapsed)
+            if seconds <= 0:
+                return 0
+
+            self.__credited_time += seconds
+            # Keeping the time of the last credit for the offline earnings when the game is loaded next time
+            try:
+                self.game.credit_passive_income(seconds, datetime.now() - timedelta(seconds=elapsed - seconds))
+                self.error = None
+            except OverflowError as error:
+                self.error = str(error)
+            return seconds
+
+    def start(self):
+        # type: () -> None
+        if self.tick_interval > 0 and self.__thread is None:
+            self.__thread = threading.Thread(target=self.__run, name="IncomeTicker", daemon=True)
+            self.__thread.start()
+
+    def __run(self):
+        # type: () -> None
+        while not self.__stop_event.wait(self.tick_interval):
+            self.credit()
+
+    def stop(self):
+        # type: () -> None
+        """
+        Stops the background thread and grants the income earned since the last tick.
+        """
+        self.__stop_event.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+        self.credit()
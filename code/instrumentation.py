@@ -0,0 +1,247 @@
+"""
+This file contains the instrumentation of the game "Fishing Tycoon", which measures how often the actions of the
+player and the methods of the Player class are called, how long they take and how large the player's state (e.g. the
+aquarium and the number of digits of coins) is after them.
+Nothing is measured unless instrumentation is enabled: the measured methods are only replaced with measuring wrappers
+by enable_instrumentation(), so a session without "--profile" runs the original methods without any overhead.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import functools
+import json
+import math
+import threading
+import time
+from numeric import Number, get_numeric_backend
+from fishing_tycoon import Player
+
+
+# Creating constants used throughout this file
+
+
+# Player methods measured by enable_instrumentation()
+PLAYER_METHODS: list = ["gain_income_after_time", "gain_exp_after_time", "gain_coins_after_time", "get_level_up",
+                        "catch_sea_creature", "buy_fishing_rod", "sell_fishing_rod"]
+LATENCY_BINS_PER_DECADE: int = 10
+LATENCY_MIN_SECONDS: float = 1e-7  # Upper edge of the first bin of latency histograms
+LATENCY_DECADES: int = 9  # Latency histograms cover up to 100 seconds
+PERCENTILES: list = [50, 90, 99]
+
+# Player methods replaced by enable_instrumentation() -> original methods
+original_player_methods: dict = {}
+
+
+# Creating necessary classes
+
+
+class LatencyHistogram:
+    """
+    This class contains a histogram of latencies in seconds with logarithmically spaced bins, which is used to
+    estimate percentiles without keeping every sample.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.counts: list = [0] * (LATENCY_BINS_PER_DECADE * LATENCY_DECADES + 1)
+        self.count: int = 0
+        self.total_seconds: float = 0.0
+        self.max_seconds: float = 0.0
+
+    def add(self, seconds):
+        # type: (float) -> None
+        index: int = 0  # initial value
+        if seconds > LATENCY_MIN_SECONDS:
+            index = min(len(self.counts) - 1,
+                        math.ceil(math.log10(seconds / LATENCY_MIN_SECONDS) * LATENCY_BINS_PER_DECADE))
+        self.counts[index] += 1
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def get_percentile(self, percentile):
+        # type: (float) -> float
+        """
+        Returns the upper edge of the bin containing the given percentile of the latencies.
+        """
+        rank: float = self.count * percentile / 100
+        seen: int = 0  # initial value
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count > 0 and seen >= rank:
+                return min(self.max_seconds, LATENCY_MIN_SECONDS * 10 ** (index / LATENCY_BINS_PER_DECADE))
+        return self.max_seconds
+
+    def to_dict(self):
+        # type: () -> dict
+        res: dict = {"count": self.count, "total_seconds": self.total_seconds,
+                     "mean_seconds": self.total_seconds / self.count if self.count > 0 else 0.0,
+                     "max_seconds": self.max_seconds}
+        for percentile in PERCENTILES:
+            res["p" + str(percentile) + "_seconds"] = self.get_percentile(percentile)
+        return res
+
+
+class SizeStatistics:
+    """
+    This class contains the count, minimum, maximum and mean of a size measured many times.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.count: int = 0
+        self.total: int = 0
+        self.minimum: int or None = None  # initial value
+        self.maximum: int or None = None  # initial value
+
+    def add(self, value):
+        # type: (int) -> None
+        self.count += 1
+        self.total += value
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+    def to_dict(self):
+        # type: () -> dict
+        return {"count": self.count, "min": self.minimum, "max": self.maximum,
+                "mean": self.total / self.count if self.count > 0 else 0.0}
+
+
+class Metrics:
+    """
+    This class contains the counters, latency histograms and size statistics measured during a session.
+    Metrics are recorded by the main thread and by the thread granting passive income, so they are changed under a
+    lock.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.counters: dict = {}  # Name -> number of times it was counted
+        self.latencies: dict = {}  # Name -> LatencyHistogram
+        self.sizes: dict = {}  # Name -> SizeStatistics
+        self.start_time: float = time.perf_counter()
+        self.__lock: threading.Lock = threading.Lock()
+
+    def count(self, name, amount=1):
+        # type: (str, int) -> None
+        with self.__lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record_latency(self, name, seconds):
+        # type: (str, float) -> None
+        with self.__lock:
+            if name not in self.latencies:
+                self.latencies[name] = LatencyHistogram()
+            self.latencies[name].add(seconds)
+
+    def record_size(self, name, value):
+        # type: (str, int) -> None
+        with self.__lock:
+            if name not in self.sizes:
+                self.sizes[name] = SizeStatistics()
+            self.sizes[name].add(value)
+
+    def to_dict(self):
+        # type: () -> dict
+        with self.__lock:
+            return {
+                "session_seconds": time.perf_counter() - self.start_time,
+                "counters": dict(sorted(self.counters.items())),
+                "latencies": {name: histogram.to_dict() for name, histogram in sorted(self.latencies.items())},
+                "sizes": {name: statistics.to_dict() for name, statistics in sorted(self.sizes.items())}
+            }
+
+    def write_json(self, file_name):
+        # type: (str) -> None
+        with open(file_name, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+
+# Creating static functions to be used throughout this file
+
+
+def get_digit_count(value):
+    # type: (Number) -> int
+    """
+    Returns the number of decimal digits before the decimal point of the absolute value of a number, which shows how
+    large (and how slow to calculate with) the economy values of a player have become.
+    """
+    value = abs(value)
+    if value < 1:
+        return 0
+    return math.floor(get_numeric_backend().log10(value)) + 1
+
+
+def record_player_sizes(metrics, player):
+    # type: (Metrics, Player) -> None
+    metrics.record_size("Aquarium size", len(player.aquarium))
+    metrics.record_size("Fishing rods owned", len(player.get_fishing_rods_owned()))
+    metrics.record_size("Coins digits", get_digit_count(player.coins))
+    metrics.record_size("EXP digits", get_digit_count(player.exp))
+    metrics.record_size("Attack power digits", get_digit_count(player.attack_power))
+
+
+def measure_player_method(method, metrics):
+    # type: (object, Metrics) -> object
+    name: str = "Player." + method.__name__
+
+    @functools.wraps(method)
+    def measured_method(player, *args, **kwargs):
+        start: float = time.perf_counter()
+        try:
+            return method(player, *args, **kwargs)
+        finally:
+            metrics.record_latency(name, time.perf_counter() - start)
+            metrics.count(name)
+            record_player_sizes(metrics, player)
+
+    return measured_method
+
+
+def measure_actions(execute, metrics):
+    # type: (object, Metrics) -> object
+    """
+    Returns a function which applies actions with the given execute function (e.g. GameEngine.execute) and measures
+    them per command, counting failed actions separately.
+    """
+
+    def measured_execute(command_line):
+        start: float = time.perf_counter()
+        result: object = execute(command_line)
+        name: str = "Action " + result.command
+        metrics.record_latency(name, time.perf_counter() - start)
+        metrics.count(name)
+        if not result.success:
+            metrics.count(name + " failed")
+        return result
+
+    return measured_execute
+
+
+def enable_instrumentation(metrics):
+    # type: (Metrics) -> None
+    """
+    Replaces the measured methods of the Player class with wrappers recording into the given metrics.
+    """
+    disable_instrumentation()
+    for method_name in PLAYER_METHODS:
+        original_player_methods[method_name] = getattr(Player, method_name)
+        setattr(Player, method_name, measure_player_method(original_player_methods[method_name], metrics))
+
+
+def disable_instrumentation():
+    # type: () -> None
+    for method_name, method in original_player_methods.items():
+        setattr(Player, method_name, method)
+    original_player_methods.clear()
+
+
+def write_profile(profiler, metrics, file_prefix):
+    # type: (object, Metrics, str) -> None
+    """
+    Writes the statistics of a cProfile profiler to <file_prefix>.prof, which can be read with pstats or snakeviz,
+    and the metrics to <file_prefix>.json.
+    """
+    profiler.dump_stats(file_prefix + ".prof")
+    metrics.write_json(file_prefix + ".json")
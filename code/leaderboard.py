@@ -0,0 +1,283 @@
+"""
+This file contains the leaderboards of the game "Fishing Tycoon", which rank the saved game data in a directory (e.g.
+the folder "saves" of the multiplayer server) by level, coins and number of sea creatures in the aquarium.
+Only the header of every saved game data file is read, in parallel across worker processes, and the ranking fields
+are kept in an SQLite index. The index remembers the modification time and size of every file, so that later runs
+only read the files which were added or changed since, and forget the files which were deleted.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import os
+import sqlite3
+import sys
+from numeric import NUMERIC_BACKENDS, get_numeric_backend, set_numeric_backend
+from save_format import MAGIC, SaveHeader, is_save_format, read_save_header
+from fishing_tycoon import Game, load_game_data
+
+
+# Creating constants used throughout this file
+
+
+SAVE_FILE_EXTENSION: str = ".save"
+INDEX_FILE_NAME: str = "leaderboard.sqlite3"  # Default name of the index, which is kept in the save directory
+# Leaderboard name -> (column of the index the leaderboard is ranked by, title of the leaderboard)
+LEADERBOARDS: dict = {
+    "level": ("level", "Level"),
+    "coins": ("coins_log10", "Coins"),
+    "aquarium": ("aquarium_size", "Sea Creatures")
+}
+INDEX_BATCH_SIZE: int = 1000  # Number of rows written to the index per transaction
+PARALLEL_SCAN_MIN_FILES: int = 256  # Fewer changed files than this are read without starting worker processes
+INDEX_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS saves (
+    file_name TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    player_id TEXT,
+    name TEXT,
+    level INTEGER,
+    coins TEXT,
+    coins_log10 REAL,
+    aquarium_size INTEGER,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS saves_by_level ON saves (level DESC, name);
+CREATE INDEX IF NOT EXISTS saves_by_coins ON saves (coins_log10 DESC, name);
+CREATE INDEX IF NOT EXISTS saves_by_aquarium_size ON saves (aquarium_size DESC, name);
+"""
+
+
+# Creating necessary classes
+
+
+class LeaderboardEntry:
+    """
+    This class contains attributes of a player ranked on a leaderboard.
+    """
+
+    def __init__(self, rank, file_name, player_id, name, level, coins, aquarium_size):
+        # type: (int, str, str, str, int, str, int) -> None
+        self.rank: int = rank
+        self.file_name: str = file_name
+        self.player_id: str = player_id
+        self.name: str = name
+        self.level: int = level
+        self.coins: str = coins  # Kept as text, since coins can be larger than any float
+        self.aquarium_size: int = aquarium_size
+
+    def __str__(self):
+        # type: () -> str
+        return "{:<6}{:<34}{:>8}{:>26}{:>16}".format(self.rank, self.name, self.level, self.coins,
+                                                     self.aquarium_size)
+
+
+class ScanResult:
+    """
+    This class contains attributes of the outcome of updating a leaderboard index.
+    """
+
+    def __init__(self, files, read, removed, unreadable):
+        # type: (int, int, int, int) -> None
+        self.files: int = files  # Number of saved game data files in the directory
+        self.read: int = read  # Number of files which were added or changed since the last update
+        self.removed: int = removed  # Number of files which were deleted since the last update
+        self.unreadable: int = unreadable  # Number of files read in this update which could not be ranked
+
+
+class LeaderboardIndex:
+    """
+    This class contains attributes of the SQLite index of the ranking fields of the saved game data in a directory.
+    Coins are ranked by their base 10 logarithm, since they can be larger than the numbers SQLite can store.
+    """
+
+    def __init__(self, file_name):
+        # type: (str) -> None
+        self.file_name: str = file_name
+        self.__connection: sqlite3.Connection = sqlite3.connect(file_name)
+        self.__connection.executescript(INDEX_SCHEMA)
+
+    def close(self):
+        # type: () -> None
+        self.__connection.close()
+
+    def __len__(self):
+        # type: () -> int
+        return self.__connection.execute("SELECT COUNT(*) FROM saves").fetchone()[0]
+
+    def get_file_states(self):
+        # type: () -> dict
+        """
+        Returns a dictionary from the name of every indexed file to its modification time and size when it was read.
+        """
+        return {file_name: (mtime_ns, size) for file_name, mtime_ns, size in
+                self.__connection.execute("SELECT file_name, mtime_ns, size FROM saves")}
+
+    def update(self, save_directory, workers=None, progress=None):
+        # type: (str, int or None, object) -> ScanResult
+        """
+        Reads the saved game data files in save_directory which were added or changed since the last update with the
+        given number of worker processes (one per CPU if None), and removes the files which were deleted from this
+        index. Rows are written in batches, so an interrupted update keeps the files read so far. progress is called
+        with the number of files read so far after every batch.
+        """
+        file_states: dict = self.get_file_states()
+        jobs: list = []
+        files: int = 0  # initial value
+        with os.scandir(save_directory) as directory_entries:
+            for directory_entry in directory_entries:
+                if not directory_entry.name.endswith(SAVE_FILE_EXTENSION) or not directory_entry.is_file():
+                    continue
+                files += 1
+                stat: os.stat_result = directory_entry.stat()
+                if file_states.pop(directory_entry.name, None) != (stat.st_mtime_ns, stat.st_size):
+                    jobs.append((directory_entry.name, directory_entry.path, stat.st_mtime_ns, stat.st_size))
+
+        # The files left in file_states were not found in the directory.
+        with self.__connection:
+            self.__connection.executemany("DELETE FROM saves WHERE file_name = ?",
+                                          ((file_name,) for file_name in file_states))
+
+        pool: object or None = None  # initial value
+        if workers == 1 or len(jobs) < PARALLEL_SCAN_MIN_FILES:
+            rows: iter = (read_index_row(job) for job in jobs)
+        else:
+            import multiprocessing
+            pool = multiprocessing.Pool(workers, initializer=set_numeric_backend,
+                                        initargs=(get_numeric_backend().name,))
+            rows = pool.imap_unordered(read_index_row, jobs, chunksize=64)
+
+        read: int = 0  # initial value
+        unreadable: int = 0  # initial value
+        batch: list = []
+        try:
+            for row in rows:
+                batch.append(row)
+                if row[-1] is not None:
+                    unreadable += 1
+                if len(batch) >= INDEX_BATCH_SIZE:
+                    read += self.__write_rows(batch)
+                    batch = []
+                    if progress is not None:
+                        progress(read)
+            read += self.__write_rows(batch)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        return ScanResult(files, read, len(file_states), unreadable)
+
+    def __write_rows(self, rows):
+        # type: (list) -> int
+        with self.__connection:
+            self.__connection.executemany("INSERT OR REPLACE INTO saves VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def get_unreadable_files(self):
+        # type: () -> list
+        return self.__connection.execute("SELECT file_name, error FROM saves WHERE error IS NOT NULL "
+                                         "ORDER BY file_name").fetchall()
+
+    def get_top(self, leaderboard, count=10):
+        # type: (str, int) -> list
+        """
+        Returns the LeaderboardEntry of the count best players on the given leaderboard. Players with the same value
+        are ranked by name, and players without coins are ranked last on the coins leaderboard.
+        """
+        if leaderboard not in LEADERBOARDS:
+            raise ValueError("Unknown leaderboard '" + str(leaderboard) + "'.")
+
+        column: str = LEADERBOARDS[leaderboard][0]
+        rows: list = self.__connection.execute(
+            "SELECT file_name, player_id, name, level, coins, aquarium_size FROM saves WHERE error IS NULL "
+            "ORDER BY " + column + " DESC, name LIMIT ?", (count,)).fetchall()
+        return [LeaderboardEntry(rank, *row) for rank, row in enumerate(rows, 1)]
+
+
+# Creating static functions to be used throughout this file
+
+
+def read_index_row(job):
+    # type: (tuple) -> tuple
+    """
+    Reads the ranking fields of one saved game data file and returns its row of the index. Files which cannot be
+    read get a row with the error, so that they are only read again once they change.
+    Worker processes can only call functions defined at module level.
+    """
+    file_name, path, mtime_ns, size = job
+    try:
+        try:
+            header: SaveHeader = read_save_header(path)
+            player_id, name, level, coins, aquarium_size = \
+                header.player_id, header.name, header.level, header.coins, header.aquarium_size
+        except ValueError:
+            with open(path, "rb") as file:
+                if is_save_format(file.read(len(MAGIC))):
+                    raise
+            # Saved game data from older versions of the game has no header, so the whole game is loaded.
+            game: Game = load_game_data(path)
+            player_id, name, level, coins, aquarium_size = \
+                game.player.player_id, game.player.name, game.player.level, game.player.coins, \
+                len(game.player.aquarium)
+    except (OSError, ValueError, EOFError, KeyError) as error:
+        return file_name, mtime_ns, size, None, None, None, None, None, None, str(error) or type(error).__name__
+
+    coins_log10: float or None = get_numeric_backend().log10(coins) if coins > 0 else None
+    return file_name, mtime_ns, size, player_id, name, level, str(coins), coins_log10, aquarium_size, None
+
+
+def main(argv=None):
+    """
+    This main function updates the leaderboard index of a directory of saved game data and prints the leaderboards.
+    :param argv: list of command line arguments, defaults to sys.argv[1:]
+    :return: None
+    """
+
+    import argparse
+    import time
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Fishing Tycoon leaderboards")
+    parser.add_argument("--save-directory", type=str, default="saves",
+                        help="directory of saved game data files ending with '" + SAVE_FILE_EXTENSION + "'")
+    parser.add_argument("--index", type=str, default=None,
+                        help="SQLite index file, defaults to '" + INDEX_FILE_NAME + "' in the save directory")
+    parser.add_argument("--leaderboard", choices=sorted(LEADERBOARDS) + ["all"], default="all",
+                        help="leaderboard to print")
+    parser.add_argument("--top", type=int, default=10, help="number of players per leaderboard")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes, defaults to CPUs")
+    parser.add_argument("--no-update", action="store_true",
+                        help="print the leaderboards from the index without reading changed files")
+    parser.add_argument("--numeric-backend", choices=sorted(NUMERIC_BACKENDS), default="bignumber",
+                        help="numeric backend used to read coins, the default one is the fastest which supports "
+                             "astronomically large values")
+    args: argparse.Namespace = parser.parse_args(argv)
+    set_numeric_backend(args.numeric_backend)
+
+    index: LeaderboardIndex = LeaderboardIndex(args.index if args.index is not None else
+                                               os.path.join(args.save_directory, INDEX_FILE_NAME))
+    try:
+        if not args.no_update:
+            start: float = time.perf_counter()
+            scan_result: ScanResult = index.update(
+                args.save_directory, args.workers,
+                progress=lambda read: sys.stderr.write("\rRead " + str(read) + " saved game data files"))
+            sys.stderr.write("\rIndexed " + str(scan_result.files) + " saved game data files in " +
+                             str(round(time.perf_counter() - start, 3)) + " seconds (" + str(scan_result.read) +
+                             " read, " + str(scan_result.removed) + " removed, " + str(scan_result.unreadable) +
+                             " unreadable).\n")
+
+        leaderboards: list = list(LEADERBOARDS) if args.leaderboard == "all" else [args.leaderboard]
+        for leaderboard in leaderboards:
+            print("Top " + str(args.top) + " by " + LEADERBOARDS[leaderboard][1])
+            print("{:<6}{:<34}{:>8}{:>26}{:>16}".format("Rank", "Name", "Level", "Coins", "Sea Creatures"))
+            for entry in index.get_top(leaderboard, args.top):
+                print(entry)
+            print()
+    finally:
+        index.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""
+This file contains a load generator for the multiplayer server of the game "Fishing Tycoon".
+It connects many simulated players to the server, some of which only stay connected while the others send random
+commands as fast as the server answers them, and reports throughput and latency percentiles.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+
+# Creating constants used throughout this file
+
+
+COMMANDS: list = ["GO FISHING 0", "ATTACK", "ATTACK", "AUTO", "FLEE", "GO SHOPPING 0", "EQUIP FISHING ROD 0",
+                  "UPGRADE FISHING ROD", "SELL FISHING ROD 0", "VIEW STATS"]
+
+
+# Creating static functions to be used throughout this file
+
+
+async def send_command(reader, writer, command_line):
+    # type: (asyncio.StreamReader, asyncio.StreamWriter, str) -> dict
+    writer.write((command_line + "\n").encode())
+    await writer.drain()
+    line: bytes = await reader.readline()
+    if not line:
+        raise ConnectionError("The server closed the connection.")
+    return json.loads(line)
+
+
+async def connect(host, port, name):
+    # type: (str, int, str) -> tuple
+    reader, writer = await asyncio.open_connection(host, port)
+    await reader.readline()  # Welcome message
+    result: dict = await send_command(reader, writer, "LOGIN " + name)
+    if not result["success"]:
+        raise ConnectionError(result["message"])
+    return reader, writer
+
+
+async def disconnect(reader, writer):
+    # type: (asyncio.StreamReader, asyncio.StreamWriter) -> None
+    await send_command(reader, writer, "QUIT")
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run_active_player(host, port, name, commands, rng, latencies):
+    # type: (str, int, str, int, random.Random, list) -> None
+    reader, writer = await connect(host, port, name)
+    for i in range(commands):
+        start: float = time.perf_counter()
+        await send_command(reader, writer, rng.choice(COMMANDS))
+        latencies.append(time.perf_counter() - start)
+    await disconnect(reader, writer)
+
+
+def get_percentile(sorted_values, percentile):
+    # type: (list, float) -> float
+    if len(sorted_values) == 0:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * percentile / 100))]
+
+
+async def generate_load(host, port, active_players, idle_players, commands, seed):
+    # type: (str, int, int, int, int, int or None) -> None
+    rng: random.Random = random.Random(seed)
+    idle_connections: list = []
+    for i in range(0, idle_players, 100):
+        # Connecting 100 idle players at a time, so that the server's backlog is not exceeded
+        idle_connections += await asyncio.gather(*[connect(host, port, "idle" + str(j))
+                                                   for j in range(i, min(i + 100, idle_players))])
+    print(str(len(idle_connections)) + " idle players connected.")
+
+    latencies: list = []
+    start: float = time.perf_counter()
+    await asyncio.gather(*[run_active_player(host, port, "active" + str(i), commands,
+                                             random.Random(rng.random()), latencies)
+                           for i in range(active_players)])
+    elapsed: float = time.perf_counter() - start
+
+    await asyncio.gather(*[disconnect(reader, writer) for reader, writer in idle_connections])
+
+    latencies.sort()
+    print("Sent " + str(len(latencies)) + " commands from " + str(active_players) + " players in " +
+          str(round(elapsed, 2)) + " seconds (" + str(round(len(latencies) / elapsed)) + " commands per second).")
+    print("Latency: p50 " + str(round(get_percentile(latencies, 50) * 1000, 2)) + " ms, p99 " +
+          str(round(get_percentile(latencies, 99) * 1000, 2)) + " ms, max " +
+          str(round(get_percentile(latencies, 100) * 1000, 2)) + " ms.")
+
+
+def main(argv=None):
+    """
+    This main function is used to run the load generator.
+    :param argv: list of command line arguments, defaults to sys.argv[1:]
+    :return: None
+    """
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Fishing Tycoon server load generator")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="address of the server")
+    parser.add_argument("--port", type=int, default=7777, help="port of the server")
+    parser.add_argument("--active-players", type=int, default=50, help="number of players sending commands")
+    parser.add_argument("--idle-players", type=int, default=1000,
+                        help="number of players staying connected without sending commands")
+    parser.add_argument("--commands", type=int, default=200, help="number of commands sent by every active player")
+    parser.add_argument("--seed", type=int, default=None, help="random seed")
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    asyncio.run(generate_load(args.host, args.port, args.active_players, args.idle_players, args.commands,
+                              args.seed))
+
+
+if __name__ == '__main__':
+    main()
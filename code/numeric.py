@@ -0,0 +1,448 @@
+"""
+This file contains the numeric backends used for economy values in the game "Fishing Tycoon".
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import math
+from abc import ABC, abstractmethod
+from decimal import Decimal, InvalidOperation
+
+
+# Economy values are mpf, float or BigNumber objects depending on the selected numeric backend.
+Number = object
+
+LOG10_2: float = math.log10(2)
+
+
+# Creating necessary classes
+
+
+class BigNumber:
+    """
+    This class contains a compact representation of a number as a mantissa and a base 10 exponent.
+    It is used for astronomically large values which do not fit into native floats.
+    """
+
+    __slots__ = ("mantissa", "exponent")
+
+    def __init__(self, mantissa=0.0, exponent=0):
+        # type: (float, int) -> None
+        self.mantissa: float = float(mantissa)
+        self.exponent: int = int(exponent)
+        self.__normalize()
+
+    def __normalize(self):
+        # type: () -> None
+        if self.mantissa == 0 or not math.isfinite(self.mantissa):
+            if not math.isfinite(self.mantissa):
+                raise OverflowError("BigNumber mantissa must be finite")
+            self.mantissa = 0.0
+            self.exponent = 0
+            return
+
+        shift: int = math.floor(math.log10(abs(self.mantissa)))
+        if shift != 0:
+            self.mantissa /= 10.0 ** shift
+            self.exponent += shift
+
+        # Correcting rounding errors made by log10
+        if abs(self.mantissa) >= 10:
+            self.mantissa /= 10
+            self.exponent += 1
+        elif abs(self.mantissa) < 1:
+            self.mantissa *= 10
+            self.exponent -= 1
+
+    @staticmethod
+    def from_value(value):
+        # type: (object) -> BigNumber
+        if isinstance(value, BigNumber):
+            return value
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                raise ValueError("Cannot convert " + str(value) + " to BigNumber")
+            return BigNumber(value)
+        if isinstance(value, int):
+            if abs(value) < 2 ** 53:
+                return BigNumber(float(value))
+            # Keeping the 17 leading digits, since converting very large integers (e.g. the factor attack power is
+            # multiplied by when gaining hundreds of levels at once) to strings is slow and limited to 4300 digits
+            shift: int = max(0, int(abs(value).bit_length() * LOG10_2) - 17)
+            return BigNumber(float(abs(value) // 10 ** shift) * (1 if value > 0 else -1), shift)
+        try:
+            decimal: Decimal = Decimal(str(value).strip())
+        except InvalidOperation:
+            raise ValueError("Cannot convert " + repr(value) + " to BigNumber")
+
+        if not decimal.is_finite():
+            raise ValueError("Cannot convert " + repr(value) + " to BigNumber")
+        if decimal == 0:
+            return BigNumber()
+
+        exponent: int = decimal.adjusted()
+        return BigNumber(float(decimal.scaleb(-exponent)), exponent)
+
+    def log10(self):
+        # type: () -> float
+        if self.mantissa <= 0:
+            raise ValueError("math domain error")
+        return math.log10(self.mantissa) + self.exponent
+
+    def __add__(self, other):
+        # type: (object) -> BigNumber
+        other = BigNumber.from_value(other)
+        if self.mantissa == 0:
+            return other
+        if other.mantissa == 0:
+            return self
+
+        larger, smaller = (self, other) if self.exponent >= other.exponent else (other, self)
+        difference: int = larger.exponent - smaller.exponent
+        if difference > 17:
+            return larger
+        return BigNumber(larger.mantissa + smaller.mantissa / 10.0 ** difference, larger.exponent)
+
+    def __radd__(self, other):
+        # type: (object) -> BigNumber
+        return self.__add__(other)
+
+    def __neg__(self):
+        # type: () -> BigNumber
+        return BigNumber(-self.mantissa, self.exponent)
+
+    def __pos__(self):
+        # type: () -> BigNumber
+        return self
+
+    def __abs__(self):
+        # type: () -> BigNumber
+        return BigNumber(abs(self.mantissa), self.exponent)
+
+    def __sub__(self, other):
+        # type: (object) -> BigNumber
+        return self.__add__(-BigNumber.from_value(other))
+
+    def __rsub__(self, other):
+        # type: (object) -> BigNumber
+        return BigNumber.from_value(other).__add__(-self)
+
+    def __mul__(self, other):
+        # type: (object) -> BigNumber
+        other = BigNumber.from_value(other)
+        return BigNumber(self.mantissa * other.mantissa, self.exponent + other.exponent)
+
+    def __rmul__(self, other):
+        # type: (object) -> BigNumber
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        # type: (object) -> BigNumber
+        other = BigNumber.from_value(other)
+        if other.mantissa == 0:
+            raise ZeroDivisionError("BigNumber division by zero")
+        return BigNumber(self.mantissa / other.mantissa, self.exponent - other.exponent)
+
+    def __rtruediv__(self, other):
+        # type: (object) -> BigNumber
+        return BigNumber.from_value(other).__truediv__(self)
+
+    def __pow__(self, power):
+        # type: (object) -> BigNumber
+        if self.mantissa == 0:
+            return BigNumber(0.0 ** float(power))
+
+        power = float(power)
+        if self.mantissa < 0 and not power.is_integer():
+            raise ValueError("math domain error")
+
+        log_result: float = math.log10(abs(self.mantissa)) * power + self.exponent * power
+        exponent: int = math.floor(log_result)
+        mantissa: float = 10.0 ** (log_result - exponent)
+        if self.mantissa < 0 and int(power) % 2 == 1:
+            mantissa = -mantissa
+        return BigNumber(mantissa, exponent)
+
+    def __compare(self, other):
+        # type: (object) -> int
+        other = BigNumber.from_value(other)
+        if self.mantissa == other.mantissa and self.exponent == other.exponent:
+            return 0
+        if (self.mantissa < 0) != (other.mantissa < 0) or self.mantissa == 0 or other.mantissa == 0:
+            return -1 if self.mantissa < other.mantissa else 1
+
+        sign: int = 1 if self.mantissa > 0 else -1
+        if self.exponent != other.exponent:
+            return sign if self.exponent > other.exponent else -sign
+        return 1 if self.mantissa > other.mantissa else -1
+
+    def __eq__(self, other):
+        # type: (object) -> bool
+        try:
+            return self.__compare(other) == 0
+        except (ValueError, TypeError):
+            return False
+
+    def __lt__(self, other):
+        # type: (object) -> bool
+        return self.__compare(other) < 0
+
+    def __le__(self, other):
+        # type: (object) -> bool
+        return self.__compare(other) <= 0
+
+    def __gt__(self, other):
+        # type: (object) -> bool
+        return self.__compare(other) > 0
+
+    def __ge__(self, other):
+        # type: (object) -> bool
+        return self.__compare(other) >= 0
+
+    def __hash__(self):
+        # type: () -> int
+        return hash((self.mantissa, self.exponent))
+
+    def __bool__(self):
+        # type: () -> bool
+        return self.mantissa != 0
+
+    def __float__(self):
+        # type: () -> float
+        try:
+            return self.mantissa * 10.0 ** self.exponent
+        except OverflowError:
+            return math.copysign(math.inf, self.mantissa) if self.exponent > 0 else 0.0
+
+    def __int__(self):
+        # type: () -> int
+        return int(Decimal(repr(self.mantissa)).scaleb(self.exponent))
+
+    def __str__(self):
+        # type: () -> str
+        if -5 <= self.exponent < 15:
+            return str(float(self))
+        return repr(self.mantissa) + "e" + ("+" if self.exponent > 0 else "") + str(self.exponent)
+
+    def __repr__(self):
+        # type: () -> str
+        return "BigNumber('" + str(self) + "')"
+
+
+class NumericBackend(ABC):
+    """
+    This class contains attributes of a numeric backend used to create economy values.
+    """
+
+    def __init__(self, name):
+        # type: (str) -> None
+        self.name: str = name
+
+    @abstractmethod
+    def number(self, value):
+        # type: (object) -> Number
+        pass
+
+    @abstractmethod
+    def is_native(self, value):
+        # type: (object) -> bool
+        pass
+
+    @abstractmethod
+    def log10(self, value):
+        # type: (Number) -> float
+        pass
+
+    @abstractmethod
+    def to_decimal(self, value):
+        # type: (Number) -> Decimal
+        """
+        Returns the value as a Decimal with enough significant digits to convert it back without losing precision.
+        """
+
+    def is_finite(self, value):
+        # type: (Number) -> bool
+        """
+        Returns whether the value is within the range of this numeric backend. Only backends with a limited range
+        (e.g. native floats) need to override this.
+        """
+        return True
+
+    def power_of_ten(self, exponent):
+        # type: (int) -> Number
+        return self.number("1e" + str(exponent))
+
+    def convert(self, value):
+        # type: (object) -> Number
+        if self.is_native(value):
+            return value
+        return self.number(str(value))
+
+
+class MpmathBackend(NumericBackend):
+    """
+    This class contains the exact arbitrary precision numeric backend using mpmath.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        super(MpmathBackend, self).__init__("mpmath")
+        import mpmath
+        mpmath.mp.pretty = True
+        self.__mpf = mpmath.mpf
+        self.__log10 = mpmath.log10
+        self.__nstr = mpmath.nstr
+
+    def number(self, value):
+        # type: (object) -> Number
+        return self.__mpf(value)
+
+    def is_native(self, value):
+        # type: (object) -> bool
+        return isinstance(value, self.__mpf)
+
+    def log10(self, value):
+        # type: (Number) -> float
+        return float(self.__log10(value))
+
+    def to_decimal(self, value):
+        # type: (Number) -> Decimal
+        # Using the shortest number of significant digits which converts back to the same value
+        for digits in (15, 16):
+            res: str = self.__nstr(value, digits)
+            if self.__mpf(res) == value:
+                return Decimal(res)
+        return Decimal(self.__nstr(value, 17))
+
+
+class FloatBackend(NumericBackend):
+    """
+    This class contains the fast numeric backend using native floats. It only supports values up to about 1e308, and
+    creating a larger value raises OverflowError instead of silently turning it into infinity.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        super(FloatBackend, self).__init__("float")
+
+    def number(self, value):
+        # type: (object) -> Number
+        res: float = float(value)
+        if not math.isfinite(res):
+            raise_out_of_range(self, value)
+        return res
+
+    def is_native(self, value):
+        # type: (object) -> bool
+        return isinstance(value, float)
+
+    def is_finite(self, value):
+        # type: (Number) -> bool
+        return math.isfinite(value)
+
+    def log10(self, value):
+        # type: (Number) -> float
+        return math.log10(value)
+
+    def to_decimal(self, value):
+        # type: (Number) -> Decimal
+        return Decimal(repr(value))
+
+
+class BigNumberBackend(NumericBackend):
+    """
+    This class contains the compact numeric backend using mantissa and base 10 exponent pairs.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        super(BigNumberBackend, self).__init__("bignumber")
+
+    def number(self, value):
+        # type: (object) -> Number
+        return BigNumber.from_value(value)
+
+    def is_native(self, value):
+        # type: (object) -> bool
+        return isinstance(value, BigNumber)
+
+    def log10(self, value):
+        # type: (Number) -> float
+        return BigNumber.from_value(value).log10()
+
+    def to_decimal(self, value):
+        # type: (Number) -> Decimal
+        return Decimal(repr(value.mantissa)).scaleb(value.exponent)
+
+
+# Creating static functions to select and use numeric backends
+
+
+NUMERIC_BACKENDS: dict = {
+    "mpmath": MpmathBackend,
+    "float": FloatBackend,
+    "bignumber": BigNumberBackend
+}
+
+numeric_backend: NumericBackend or None = None  # initial value
+
+
+def set_numeric_backend(name):
+    # type: (str) -> NumericBackend
+    global numeric_backend
+    if name not in NUMERIC_BACKENDS:
+        raise ValueError("Unknown numeric backend '" + str(name) + "'. Available numeric backends: " +
+                         ", ".join(sorted(NUMERIC_BACKENDS)))
+    numeric_backend = NUMERIC_BACKENDS[name]()
+    return numeric_backend
+
+
+def set_numeric_backend_in_background(name):
+    # type: (str) -> object
+    """
+    Sets the numeric backend in a background thread and returns the thread, so that slow imports (e.g. of mpmath)
+    can happen while the game waits for input. Numbers must not be created before the thread is joined.
+    """
+    if name not in NUMERIC_BACKENDS:
+        raise ValueError("Unknown numeric backend '" + str(name) + "'. Available numeric backends: " +
+                         ", ".join(sorted(NUMERIC_BACKENDS)))
+    import threading
+    thread: threading.Thread = threading.Thread(target=set_numeric_backend, args=(name,), name="NumericBackend",
+                                                daemon=True)
+    thread.start()
+    return thread
+
+
+def get_numeric_backend():
+    # type: () -> NumericBackend
+    if numeric_backend is None:
+        set_numeric_backend("mpmath")
+    return numeric_backend
+
+
+def raise_out_of_range(backend, value):
+    # type: (NumericBackend, object) -> None
+    raise OverflowError("The value " + str(value) + " is out of the range of the '" + backend.name + "' numeric "
+                        "backend. Use the 'bignumber' or 'mpmath' numeric backend for larger values.")
+
+
+def check_finite(value):
+    # type: (Number) -> Number
+    """
+    Returns the value, or raises OverflowError if arithmetic made it too large for the selected numeric backend (e.g.
+    a native float which overflowed to infinity).
+    """
+    if not get_numeric_backend().is_finite(value):
+        raise_out_of_range(get_numeric_backend(), value)
+    return value
+
+
+def num(value):
+    # type: (object) -> Number
+    return get_numeric_backend().number(value)
+
+
+def convert_number(value):
+    # type: (object) -> Number
+    return get_numeric_backend().convert(value)
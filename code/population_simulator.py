@@ -0,0 +1,350 @@
+"""
+This file contains a simulator of whole player careers in the game "Fishing Tycoon".
+Many scripted players are simulated in parallel across processes, each following a strategy which buys, equips and
+upgrades fishing rods, goes fishing and waits for passive income. Only aggregated statistics about how long the
+players need to reach progression milestones are sent back from the worker processes.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import argparse
+import math
+from abc import ABC, abstractmethod
+import multiprocessing
+import random
+import time
+from auto_battle import BattleResult, resolve_battle
+from numeric import NUMERIC_BACKENDS, set_numeric_backend
+from catalog import Catalog, get_catalog
+from fishing_tycoon import Player, FishingRod, SeaCreature, BodyOfWater, Game
+
+
+# Creating constants used throughout this file
+
+
+MILESTONES: list = ["Reach Beauford Waters", "Own Fishing Rod #10"]
+HISTOGRAM_BINS_PER_DECADE: int = 20
+HISTOGRAM_DECADES: int = 15  # Covers careers of up to 1e15 seconds
+
+
+# Creating necessary classes
+
+
+class Career:
+    """
+    This class contains attributes of a simulated player career, with a simulated clock.
+    """
+
+    def __init__(self, game, rng, seconds_per_turn, seconds_per_encounter):
+        # type: (Game, random.Random, float, float) -> None
+        self.game: Game = game
+        self.rng: random.Random = rng
+        self.seconds_per_turn: float = seconds_per_turn
+        self.seconds_per_encounter: float = seconds_per_encounter
+        self.seconds: int = 0
+        self.actions: int = 0
+
+    def pass_time(self, seconds):
+        # type: (int) -> None
+        if seconds > 0:
+            self.seconds += seconds
+            self.game.player.gain_coins_after_time(seconds)
+            self.game.player.gain_exp_after_time(seconds)
+
+    def go_fishing(self, body_of_water_index):
+        # type: (int) -> BattleResult
+        body_of_water: BodyOfWater = self.game.get_bodies_of_water()[body_of_water_index]
+        wild_sea_creature: SeaCreature = body_of_water.spawn_sea_creature(self.rng)
+        player: Player = self.game.player
+        critical_damage = player.fishing_rod.critical_damage if player.fishing_rod is not None else None
+        battle_result: BattleResult = resolve_battle(player.attack_power, critical_damage, wild_sea_creature,
+                                                     self.rng)
+        if battle_result.caught:
+            player.catch_sea_creature(wild_sea_creature)
+
+        self.actions += 1
+        self.pass_time(math.ceil(self.seconds_per_encounter + battle_result.turns * self.seconds_per_turn))
+        return battle_result
+
+    def buy_and_equip_fishing_rod(self, fishing_rod):
+        # type: (FishingRod) -> bool
+        """
+        Buys the fishing rod and equips it if it is stronger than the equipped fishing rod.
+        """
+        self.actions += 1
+        player: Player = self.game.player
+        if player.buy_fishing_rod(fishing_rod):
+            bought_fishing_rod: FishingRod = player.get_fishing_rods_owned().get_stack(fishing_rod)
+            if player.fishing_rod is None or bought_fishing_rod.attack_power > player.fishing_rod.attack_power:
+                player.add_fishing_rod(bought_fishing_rod)
+            return True
+        return False
+
+    def upgrade_fishing_rod(self):
+        # type: () -> bool
+        self.actions += 1
+        return self.game.player.level_up_fishing_rod()
+
+    def wait_for_coins(self, coins, max_seconds):
+        # type: (object, int) -> bool
+        """
+        Waits until the player has the given amount of coins if passive income makes it possible within max_seconds.
+        """
+        player: Player = self.game.player
+        if player.coins >= coins:
+            return True
+        if player.aquarium.coins_per_second <= 0:
+            return False
+
+        seconds: float = math.ceil(float((coins - player.coins) / player.aquarium.coins_per_second))
+        if seconds > max_seconds:
+            return False
+
+        self.actions += 1
+        self.pass_time(int(seconds))
+        return True
+
+    def get_best_body_of_water_index(self, max_turns=10):
+        # type: (int) -> int
+        """
+        Returns the index of the last unlocked body of water where the weakest sea creature can be caught within
+        max_turns attacks, or 0 if there is no such body of water.
+        """
+        player: Player = self.game.player
+        bodies_of_water: list = self.game.get_bodies_of_water()
+        res: int = 0  # initial value
+        for i in self.game.get_unlocked_body_of_water_indices():
+            potential_sea_creatures: list = bodies_of_water[i].get_potential_sea_creatures()
+            if i > res and min(sea_creature.max_hp for sea_creature in potential_sea_creatures) <= \
+                    player.attack_power * max_turns:
+                res = i
+        return res
+
+    def get_next_fishing_rod(self):
+        # type: () -> FishingRod or None
+        owned_names: set = {fishing_rod.name for fishing_rod in self.game.player.get_fishing_rods_owned()}
+        for fishing_rod in self.game.shop.get_fishing_rods_sold():
+            if fishing_rod.name not in owned_names:
+                return fishing_rod
+        return None
+
+
+class Strategy(ABC):
+    """
+    This class contains a policy deciding what a simulated player does next.
+    """
+
+    @abstractmethod
+    def play(self, career):
+        # type: (Career) -> None
+        pass
+
+
+class GreedyStrategy(Strategy):
+    """
+    This class contains a strategy which buys the next fishing rod as soon as it is affordable, upgrades the
+    equipped fishing rod when it is cheaper than the next one and goes fishing in the best body of water where it can
+    catch sea creatures otherwise.
+    """
+
+    def play(self, career):
+        # type: (Career) -> None
+        player: Player = career.game.player
+        next_fishing_rod: FishingRod or None = career.get_next_fishing_rod()
+        if next_fishing_rod is not None and player.coins >= next_fishing_rod.coin_cost:
+            career.buy_and_equip_fishing_rod(next_fishing_rod)
+        elif player.fishing_rod is not None and player.coins >= player.fishing_rod.level_up_coin_cost and \
+                (next_fishing_rod is None or player.fishing_rod.level_up_coin_cost < next_fishing_rod.coin_cost):
+            career.upgrade_fishing_rod()
+        else:
+            career.go_fishing(career.get_best_body_of_water_index())
+
+
+class PatientStrategy(GreedyStrategy):
+    """
+    This class contains a strategy like the greedy strategy, except that it stops fishing and waits for passive
+    income whenever the next fishing rod can be afforded within max_wait_seconds.
+    """
+
+    def __init__(self, max_wait_seconds=3600):
+        # type: (int) -> None
+        self.max_wait_seconds: int = max_wait_seconds
+
+    def play(self, career):
+        # type: (Career) -> None
+        next_fishing_rod: FishingRod or None = career.get_next_fishing_rod()
+        if next_fishing_rod is not None and career.wait_for_coins(next_fishing_rod.coin_cost, self.max_wait_seconds):
+            career.buy_and_equip_fishing_rod(next_fishing_rod)
+        else:
+            super(PatientStrategy, self).play(career)
+
+
+STRATEGIES: dict = {
+    "greedy": GreedyStrategy,
+    "patient": PatientStrategy
+}
+
+
+class LogHistogram:
+    """
+    This class contains a histogram of durations in seconds with logarithmically spaced bins, which can be merged
+    and used to estimate percentiles without keeping every sample.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.counts: list = [0] * (HISTOGRAM_BINS_PER_DECADE * HISTOGRAM_DECADES + 1)
+        self.not_reached: int = 0
+
+    def add(self, seconds):
+        # type: (float) -> None
+        if math.isinf(seconds):
+            self.not_reached += 1
+            return
+
+        index: int = 0 if seconds < 1 else math.ceil(math.log10(seconds) * HISTOGRAM_BINS_PER_DECADE)
+        self.counts[min(index, len(self.counts) - 1)] += 1
+
+    def merge(self, other):
+        # type: (LogHistogram) -> None
+        self.counts = [count + other_count for count, other_count in zip(self.counts, other.counts)]
+        self.not_reached += other.not_reached
+
+    def get_total(self):
+        # type: () -> int
+        return sum(self.counts) + self.not_reached
+
+    def get_percentile(self, percentile):
+        # type: (float) -> float
+        """
+        Returns the upper bound of the bin containing the given percentile, or infinity if the players in that
+        percentile did not reach the milestone.
+        """
+        rank: float = percentile / 100 * self.get_total()
+        cumulative_count: int = 0  # initial value
+        for index, count in enumerate(self.counts):
+            cumulative_count += count
+            if count > 0 and cumulative_count >= rank:
+                return 10 ** (index / HISTOGRAM_BINS_PER_DECADE)
+        return math.inf
+
+
+# Creating static functions to be used throughout this file
+
+
+def get_milestones_reached(game):
+    # type: (Game) -> list
+    player: Player = game.player
+    bodies_of_water: list = game.get_bodies_of_water()
+    return [
+        player.level >= bodies_of_water[-1].minimum_player_level,
+        any(fishing_rod.name == "Fishing Rod #10" for fishing_rod in player.get_fishing_rods_owned())
+    ]
+
+
+def simulate_chunk(task):
+    # type: (tuple) -> tuple
+    """
+    Simulates the careers of a chunk of players in a worker process and returns the number of players simulated with
+    a histogram of the number of seconds needed to reach every milestone. Chunks finish in any order, which does not
+    matter, since the results of all chunks are added up.
+    """
+    chunk_index, players, seed, strategy_name, max_seconds, max_actions, seconds_per_turn, seconds_per_encounter = \
+        task
+    # The seed only depends on the chunk, so results do not depend on how chunks are scheduled on the workers.
+    rng: random.Random = random.Random(seed * 1000003 + chunk_index)
+    strategy: Strategy = STRATEGIES[strategy_name]()
+    histograms: list = [LogHistogram() for milestone in MILESTONES]
+    catalog: Catalog = get_catalog()
+    for i in range(players):
+        game: Game = Game(Player("Player " + str(i)), catalog.bodies_of_water, catalog.shop)
+        career: Career = Career(game, rng, seconds_per_turn, seconds_per_encounter)
+        reached_seconds: list = [math.inf] * len(MILESTONES)
+        while career.seconds < max_seconds and career.actions < max_actions and math.inf in reached_seconds:
+            strategy.play(career)
+            for milestone_index, reached in enumerate(get_milestones_reached(game)):
+                if reached and math.isinf(reached_seconds[milestone_index]):
+                    reached_seconds[milestone_index] = career.seconds
+
+        for histogram, seconds in zip(histograms, reached_seconds):
+            histogram.add(seconds if seconds <= max_seconds else math.inf)
+
+    return players, histograms
+
+
+def run_population(players, strategy_name, workers=None, seed=0, chunk_size=50, max_seconds=10 ** 9,
+                   max_actions=5000, seconds_per_turn=2.0, seconds_per_encounter=5.0, numeric_backend="float",
+                   progress=None):
+    # type: (int, str, int or None, int, int, int, int, float, float, str, object) -> list
+    """
+    Simulates the careers of the given number of players across a process pool and returns one merged histogram
+    per milestone. progress is called with the number of players simulated so far whenever a chunk finishes.
+    """
+    tasks: list = []
+    for chunk_index, start in enumerate(range(0, players, chunk_size)):
+        tasks.append((chunk_index, min(chunk_size, players - start), seed, strategy_name, max_seconds, max_actions,
+                      seconds_per_turn, seconds_per_encounter))
+
+    histograms: list = [LogHistogram() for milestone in MILESTONES]
+    players_done: int = 0  # initial value
+    with multiprocessing.Pool(workers, initializer=set_numeric_backend, initargs=(numeric_backend,)) as pool:
+        for chunk_players, chunk_histograms in pool.imap_unordered(simulate_chunk, tasks):
+            for histogram, chunk_histogram in zip(histograms, chunk_histograms):
+                histogram.merge(chunk_histogram)
+            players_done += chunk_players
+            if progress is not None:
+                progress(players_done)
+
+    return histograms
+
+
+def format_seconds(seconds):
+    # type: (float) -> str
+    if math.isinf(seconds):
+        return "not reached"
+    if seconds < 86400:
+        return str(round(seconds / 3600, 1)) + " h"
+    return "{:.3g} d".format(seconds / 86400)
+
+
+def main(argv=None):
+    """
+    This main function is used to run the population simulator.
+    :param argv: list of command line arguments, defaults to sys.argv[1:]
+    :return: None
+    """
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Fishing Tycoon population simulator")
+    parser.add_argument("--players", type=int, default=1000, help="number of simulated players")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="patient",
+                        help="strategy followed by every simulated player")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes, defaults to CPUs")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--chunk-size", type=int, default=50, help="number of players per task")
+    parser.add_argument("--max-seconds", type=int, default=10 ** 9, help="maximum simulated seconds per player")
+    parser.add_argument("--max-actions", type=int, default=5000, help="maximum number of actions per player")
+    parser.add_argument("--numeric-backend", choices=sorted(NUMERIC_BACKENDS), default="float",
+                        help="numeric backend used by the simulated players")
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    start: float = time.perf_counter()
+    histograms: list = run_population(
+        args.players, args.strategy, args.workers, args.seed, args.chunk_size, args.max_seconds, args.max_actions,
+        numeric_backend=args.numeric_backend,
+        progress=lambda players_done: print("\rSimulated " + str(players_done) + "/" + str(args.players) +
+                                            " players", end="", flush=True))
+    print("\nFinished in " + str(round(time.perf_counter() - start, 2)) + " seconds.\n")
+
+    percentiles: list = [10, 50, 90, 99]
+    print("{:<24}{:>10}".format("Milestone", "Reached") +
+          "".join("{:>16}".format("p" + str(percentile)) for percentile in percentiles))
+    for milestone, histogram in zip(MILESTONES, histograms):
+        reached: float = 1 - histogram.not_reached / max(histogram.get_total(), 1)
+        print("{:<24}{:>10.1%}".format(milestone, reached) +
+              "".join("{:>16}".format(format_seconds(histogram.get_percentile(percentile)))
+                      for percentile in percentiles))
+
+
+if __name__ == '__main__':
+    main()
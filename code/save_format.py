@@ -0,0 +1,530 @@
+"""
+This file contains the compact versioned save format of the game "Fishing Tycoon".
+Only the state which the player can change is saved. Sea creatures and fishing rods from the catalog are referenced
+by their index in the catalog, and numbers are saved as a decimal coefficient and a base 10 exponent.
+
+The layout of a saved game data file is:
+    magic bytes b"FTSAVE", format version (1 byte),
+    header length (varint), header (player ID, name, level, coins and aquarium size),
+    body length (varint), body (the rest of the game state).
+The header can be read without decoding the body, which contains the aquarium.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+# Libraries which are only needed for older saved game data, the benchmark and main() are imported where they are
+# used, since saved game data is loaded while the game starts.
+
+import io
+import os
+import sys
+from datetime import datetime
+from decimal import Decimal
+from catalog import Catalog, get_catalog
+from numeric import Number, get_numeric_backend
+from fishing_tycoon import Player, Aquarium, SeaCreature, FishingRod, Game, GameRandom, create_sea_creatures, \
+    create_bodies_of_water, create_shop
+
+
+# Creating constants used throughout this file
+
+
+MAGIC: bytes = b"FTSAVE"
+# Version 2 adds the state of the random number generator of the game, including the normal value kept by
+# GameRandom.gauss(). Version 3 saves the owned fishing rods as stacks with a count instead of one entry per fishing
+# rod, and which stack further fishing rods are stacked onto, so that entries of identical fishing rods are not merged
+# when they are loaded.
+SAVE_FORMAT_VERSION: int = 3
+CATALOG_ENTRY: int = 0  # The entry is a reference to the catalog followed by its mutable state
+INLINE_ENTRY: int = 1  # The entry is not part of the catalog, so it is saved in full
+
+
+# Creating necessary classes
+
+
+class SaveHeader:
+    """
+    This class contains attributes of the header of saved game data.
+    """
+
+    def __init__(self, version, player_id, name, level, coins, aquarium_size):
+        # type: (int, str, str, int, Number, int) -> None
+        self.version: int = version
+        self.player_id: str = player_id
+        self.name: str = name
+        self.level: int = level
+        self.coins: Number = coins
+        self.aquarium_size: int = aquarium_size
+
+    def __str__(self):
+        # type: () -> str
+        res: str = ""  # initial value
+        res += "Save format version: " + str(self.version) + "\n"
+        res += "Player ID: " + str(self.player_id) + "\n"
+        res += "Name: " + str(self.name) + "\n"
+        res += "Level: " + str(self.level) + "\n"
+        res += "Coins: " + str(self.coins) + "\n"
+        res += "Number of sea creatures in aquarium: " + str(self.aquarium_size) + "\n"
+        return res
+
+
+class SaveWriter:
+    """
+    This class contains methods to write values of the save format into a byte buffer.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.buffer: bytearray = bytearray()
+
+    def write_varint(self, value):
+        # type: (int) -> None
+        if value < 0:
+            raise ValueError("Cannot write negative varint " + str(value))
+        while value >= 0x80:
+            self.buffer.append((value & 0x7F) | 0x80)
+            value >>= 7
+        self.buffer.append(value)
+
+    def write_signed_varint(self, value):
+        # type: (int) -> None
+        self.write_varint(value * 2 if value >= 0 else -value * 2 - 1)  # Zigzag encoding
+
+    def write_string(self, value):
+        # type: (str) -> None
+        encoded: bytes = value.encode("utf-8")
+        self.write_varint(len(encoded))
+        self.buffer += encoded
+
+    def write_number(self, value):
+        # type: (Number) -> None
+        decimal: Decimal = get_numeric_backend().to_decimal(value).normalize()
+        if not decimal.is_finite():
+            # The save format has no encoding for infinity and NaN, which would otherwise be saved as zero.
+            raise ValueError("Cannot save non-finite number " + str(value))
+        sign, digits, exponent = decimal.as_tuple()
+        coefficient: int = int("".join(str(digit) for digit in digits)) if digits else 0
+        self.write_signed_varint(-coefficient if sign else coefficient)
+        self.write_signed_varint(exponent if coefficient != 0 else 0)
+
+    def write_float(self, value):
+        # type: (float) -> None
+        self.write_string(repr(value))
+
+    def write_bytes(self, value):
+        # type: (bytes) -> None
+        self.write_varint(len(value))
+        self.buffer += value
+
+
+class SaveReader:
+    """
+    This class contains methods to read values of the save format from bytes.
+    """
+
+    def __init__(self, data):
+        # type: (bytes) -> None
+        self.data: bytes = data
+        self.position: int = 0
+
+    def read_varint(self):
+        # type: () -> int
+        res: int = 0  # initial value
+        shift: int = 0  # initial value
+        while True:
+            if self.position >= len(self.data):
+                raise ValueError("Saved game data is truncated")
+            byte: int = self.data[self.position]
+            self.position += 1
+            res |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return res
+            shift += 7
+
+    def read_signed_varint(self):
+        # type: () -> int
+        value: int = self.read_varint()
+        return value // 2 if value % 2 == 0 else -(value + 1) // 2
+
+    def read_bytes(self):
+        # type: () -> bytes
+        length: int = self.read_varint()
+        if self.position + length > len(self.data):
+            raise ValueError("Saved game data is truncated")
+        res: bytes = self.data[self.position:self.position + length]
+        self.position += length
+        return res
+
+    def read_string(self):
+        # type: () -> str
+        return self.read_bytes().decode("utf-8")
+
+    def read_number(self):
+        # type: () -> Number
+        coefficient: int = self.read_signed_varint()
+        exponent: int = self.read_signed_varint()
+        return get_numeric_backend().number(str(coefficient) + "e" + str(exponent))
+
+    def read_float(self):
+        # type: () -> float
+        return float(self.read_string())
+
+
+# Creating static functions to encode and decode saved game data
+
+
+def get_species_key(sea_creature):
+    # type: (SeaCreature) -> tuple
+    return (sea_creature.name, sea_creature.max_hp, sea_creature.catch_exp_reward, sea_creature.exp_per_second,
+            sea_creature.coins_per_second, sea_creature.flee_chance)
+
+
+def write_sea_creature(writer, sea_creature, catalog_sea_creatures):
+    # type: (SaveWriter, SeaCreature, list) -> None
+    key: tuple = get_species_key(sea_creature)
+    for i, catalog_sea_creature in enumerate(catalog_sea_creatures):
+        if get_species_key(catalog_sea_creature) == key:
+            writer.write_varint(CATALOG_ENTRY)
+            writer.write_varint(i)
+            return
+
+    writer.write_varint(INLINE_ENTRY)
+    writer.write_string(sea_creature.name)
+    writer.write_number(sea_creature.max_hp)
+    writer.write_number(sea_creature.catch_exp_reward)
+    writer.write_number(sea_creature.exp_per_second)
+    writer.write_number(sea_creature.coins_per_second)
+    writer.write_float(float(sea_creature.flee_chance))
+
+
+def read_sea_creature(reader, catalog_sea_creatures):
+    # type: (SaveReader, list) -> SeaCreature
+    entry_type: int = reader.read_varint()
+    if entry_type == CATALOG_ENTRY:
+        return catalog_sea_creatures[reader.read_varint()]
+    return SeaCreature(reader.read_string(), reader.read_number(), reader.read_number(), reader.read_number(),
+                       reader.read_number(), reader.read_float())
+
+
+def write_fishing_rod(writer, fishing_rod, catalog_fishing_rods):
+    # type: (SaveWriter, FishingRod, list) -> None
+    catalog_index: int or None = None  # initial value
+    for i, catalog_fishing_rod in enumerate(catalog_fishing_rods):
+        if catalog_fishing_rod.name == fishing_rod.name and catalog_fishing_rod.coin_cost == fishing_rod.coin_cost:
+            catalog_index = i
+            break
+
+    if catalog_index is not None:
+        writer.write_varint(CATALOG_ENTRY)
+        writer.write_varint(catalog_index)
+    else:
+        writer.write_varint(INLINE_ENTRY)
+        writer.write_string(fishing_rod.name)
+        writer.write_number(fishing_rod.coin_cost)
+
+    writer.write_varint(fishing_rod.level)
+    writer.write_number(fishing_rod.attack_power)
+    writer.write_number(fishing_rod.critical_damage)
+    writer.write_number(fishing_rod.level_up_coin_cost)
+
+
+def read_fishing_rod(reader, catalog_fishing_rods):
+    # type: (SaveReader, list) -> FishingRod
+    entry_type: int = reader.read_varint()
+    fishing_rod: FishingRod
+    if entry_type == CATALOG_ENTRY:
+        fishing_rod = catalog_fishing_rods[reader.read_varint()].clone()
+    else:
+        name: str = reader.read_string()
+        coin_cost: Number = reader.read_number()
+        fishing_rod = FishingRod(name, coin_cost, coin_cost)
+
+    fishing_rod.level = reader.read_varint()
+    fishing_rod.attack_power = reader.read_number()
+    fishing_rod.critical_damage = reader.read_number()
+    fishing_rod.level_up_coin_cost = reader.read_number()
+    return fishing_rod
+
+
+def encode_game_data(game_data):
+    # type: (Game) -> bytes
+    player: Player = game_data.player
+    catalog: Catalog = get_catalog()
+    catalog_sea_creatures: list = catalog.sea_creatures
+    catalog_fishing_rods: list = catalog.shop.get_fishing_rods_sold()
+
+    header: SaveWriter = SaveWriter()
+    header.write_string(player.player_id)
+    header.write_string(player.name)
+    header.write_varint(player.level)
+    header.write_number(player.coins)
+    header.write_varint(len(player.aquarium))
+
+    body: SaveWriter = SaveWriter()
+    body.write_number(player.attack_power)
+    body.write_number(player.exp)
+    body.write_number(player.required_exp)
+
+    # Fishing rods are saved once each (once per stack for stacked fishing rods), and the owned and equipped fishing
+    # rods refer to them by index.
+    fishing_rod_entries: list = player.get_fishing_rods_owned().get_entries()
+    fishing_rods: list = [fishing_rod for fishing_rod, count in fishing_rod_entries]
+    fishing_rod_indices: dict = {id(fishing_rod): i for i, fishing_rod in enumerate(fishing_rods)}
+    if player.fishing_rod is not None and id(player.fishing_rod) not in fishing_rod_indices:
+        fishing_rod_indices[id(player.fishing_rod)] = len(fishing_rods)
+        fishing_rods.append(player.fishing_rod)
+
+    body.write_varint(len(fishing_rods))
+    for fishing_rod in fishing_rods:
+        write_fishing_rod(body, fishing_rod, catalog_fishing_rods)
+    body.write_varint(len(fishing_rod_entries))
+    for i, (fishing_rod, count) in enumerate(fishing_rod_entries):
+        body.write_varint(i)
+        body.write_varint(count)
+        body.write_varint(1 if player.get_fishing_rods_owned().get_stack(fishing_rod) is fishing_rod else 0)
+    body.write_signed_varint(fishing_rod_indices[id(player.fishing_rod)] if player.fishing_rod is not None else -1)
+
+    species_counts: dict = player.aquarium.get_species_counts()
+    body.write_varint(len(species_counts))
+    for template, count in species_counts.items():
+        write_sea_creature(body, template, catalog_sea_creatures)
+        body.write_varint(count)
+
+    if game_data.last_played_time is not None:
+        body.write_varint(1)
+        body.write_signed_varint(round(game_data.last_played_time.timestamp() * 10 ** 6))
+    else:
+        body.write_varint(0)
+
+    body.write_signed_varint(game_data.rng.initial_seed)
+    body.write_varint(game_data.rng.words_drawn)
+    if game_data.rng.gauss_next is not None:
+        body.write_varint(1)
+        body.write_float(game_data.rng.gauss_next)
+    else:
+        body.write_varint(0)
+
+    res: SaveWriter = SaveWriter()
+    res.buffer += MAGIC
+    res.buffer.append(SAVE_FORMAT_VERSION)
+    res.write_bytes(bytes(header.buffer))
+    res.write_bytes(bytes(body.buffer))
+    return bytes(res.buffer)
+
+
+def read_version(reader):
+    # type: (SaveReader) -> int
+    if reader.data[:len(MAGIC)] != MAGIC or len(reader.data) <= len(MAGIC):
+        raise ValueError("This is not saved game data of 'Fishing Tycoon'")
+    version: int = reader.data[len(MAGIC)]
+    if version > SAVE_FORMAT_VERSION:
+        raise ValueError("Saved game data has version " + str(version) + ", which is newer than this game "
+                         "supports (version " + str(SAVE_FORMAT_VERSION) + ")")
+    reader.position = len(MAGIC) + 1
+    return version
+
+
+def decode_header(data, version):
+    # type: (bytes, int) -> SaveHeader
+    header: SaveReader = SaveReader(data)
+    return SaveHeader(version, header.read_string(), header.read_string(), header.read_varint(),
+                      header.read_number(), header.read_varint())
+
+
+def decode_game_data(data):
+    # type: (bytes) -> Game
+    reader: SaveReader = SaveReader(data)
+    version: int = read_version(reader)
+    save_header: SaveHeader = decode_header(reader.read_bytes(), version)
+    body: SaveReader = SaveReader(reader.read_bytes())
+
+    catalog: Catalog = get_catalog()
+    catalog_sea_creatures: list = catalog.sea_creatures
+    catalog_fishing_rods: list = catalog.shop.get_fishing_rods_sold()
+    player: Player = Player(save_header.name)
+    player.player_id = save_header.player_id
+    player.level = save_header.level
+    player.coins = save_header.coins
+    player.attack_power = body.read_number()
+    player.exp = body.read_number()
+    player.required_exp = body.read_number()
+
+    fishing_rods: list = [read_fishing_rod(body, catalog_fishing_rods) for i in range(body.read_varint())]
+    # Index of a saved fishing rod -> the fishing rod it became in the inventory, which differs if it was stacked
+    owned_fishing_rods: dict = {}
+    for i in range(body.read_varint()):
+        index: int = body.read_varint()
+        if version >= 3:
+            count: int = body.read_varint()
+            owned_fishing_rods[index] = player.get_fishing_rods_owned().add_entry(fishing_rods[index], count,
+                                                                                 body.read_varint() == 1)
+        else:
+            # Before version 3, every owned fishing rod was saved separately.
+            owned_fishing_rods[index] = player.get_fishing_rods_owned().add(fishing_rods[index])
+    equipped_index: int = body.read_signed_varint()
+    player.fishing_rod = player.get_fishing_rods_owned().take(
+        owned_fishing_rods.get(equipped_index, fishing_rods[equipped_index])) if equipped_index >= 0 else None
+
+    player.aquarium = Aquarium()
+    for i in range(body.read_varint()):
+        sea_creature: SeaCreature = read_sea_creature(body, catalog_sea_creatures)
+        player.aquarium.add_sea_creature(sea_creature, body.read_varint())
+
+    game_data: Game = Game(player, catalog.bodies_of_water, catalog.shop)
+    if body.read_varint() == 1:
+        game_data.last_played_time = datetime.fromtimestamp(body.read_signed_varint() / 10 ** 6)
+    if version >= 2:
+        seed: int = body.read_signed_varint()
+        words_drawn: int = body.read_varint()
+        gauss_next: float or None = body.read_float() if body.read_varint() == 1 else None
+        game_data.rng = GameRandom(seed, words_drawn, gauss_next)
+    return game_data
+
+
+def is_save_format(data):
+    # type: (bytes) -> bool
+    return data[:len(MAGIC)] == MAGIC
+
+
+def load_pickled_game_data(data):
+    # type: (bytes) -> Game
+    """
+    Loads saved game data from older versions of the game, which pickled the whole game. The game classes were
+    pickled as part of '__main__' when the game was run as a script.
+    """
+    import pickle
+
+    class GameDataUnpickler(pickle.Unpickler):
+        def find_class(self, module, name):
+            if module == "__main__":
+                module = "fishing_tycoon"
+            return super(GameDataUnpickler, self).find_class(module, name)
+
+    try:
+        return GameDataUnpickler(io.BytesIO(data)).load()
+    except pickle.UnpicklingError as error:
+        raise ValueError("Invalid saved game data: " + str(error)) from error
+
+
+def read_save_header(file_name):
+    # type: (str) -> SaveHeader
+    """
+    Reads only the header of saved game data, without decoding the aquarium or the rest of the game state.
+    """
+    with open(file_name, "rb") as file:
+        prefix: bytes = file.read(len(MAGIC) + 1 + 10)  # Magic bytes, version and at most 10 bytes of header length
+        reader: SaveReader = SaveReader(prefix)
+        version: int = read_version(reader)
+        header_length: int = reader.read_varint()
+        header_start: int = reader.position
+        data: bytes = prefix[header_start:] + file.read(max(0, header_length - (len(prefix) - header_start)))
+
+    return decode_header(data[:header_length], version)
+
+
+def convert_pickled_save(source_file_name, destination_file_name):
+    # type: (str, str) -> Game
+    """
+    Converts saved game data from older versions of the game, which pickled the whole game, to the save format.
+    """
+    with open(source_file_name, "rb") as file:
+        game_data: Game = load_pickled_game_data(file.read())
+    with open(destination_file_name, "wb") as file:
+        file.write(encode_game_data(game_data))
+    return game_data
+
+
+def create_benchmark_game(aquarium_size, fishing_rods):
+    # type: (int, int) -> Game
+    sea_creatures: list = create_sea_creatures()
+    shop = create_shop()
+    player: Player = Player("Benchmark")
+    fishing_rods_sold: list = shop.get_fishing_rods_sold()
+    fishing_rod: FishingRod or None = None  # initial value
+    for i in range(fishing_rods):
+        fishing_rod = player.get_fishing_rods_owned().add(fishing_rods_sold[i % len(fishing_rods_sold)].clone())
+    if fishing_rod is not None:
+        player.add_fishing_rod(fishing_rod)
+    for i, sea_creature in enumerate(sea_creatures):
+        player.aquarium.add_sea_creature(sea_creature, aquarium_size // len(sea_creatures) +
+                                         (1 if i < aquarium_size % len(sea_creatures) else 0))
+    game_data: Game = Game(player, create_bodies_of_water(sea_creatures), shop)
+    game_data.last_played_time = datetime.now()
+    return game_data
+
+
+def benchmark(aquarium_sizes, fishing_rods, repetitions):
+    # type: (list, int, int) -> None
+    import pickle
+    import tempfile
+    import time
+    print("{:>14}{:>10}{:>14}{:>14}{:>14}{:>14}".format(
+        "Aquarium Size", "Format", "Size (bytes)", "Save (ms)", "Load (ms)", "Header (ms)"))
+    with tempfile.TemporaryDirectory() as directory:
+        file_name: str = os.path.join(directory, "benchmark save")
+        for aquarium_size in aquarium_sizes:
+            game_data: Game = create_benchmark_game(aquarium_size, fishing_rods)
+            formats: list = [
+                ("pickle", lambda: pickle.dumps(game_data), load_pickled_game_data, None),
+                ("compact", lambda: encode_game_data(game_data), decode_game_data,
+                 lambda: read_save_header(file_name))
+            ]
+            for format_name, save_function, load_function, header_function in formats:
+                start: float = time.perf_counter()
+                for i in range(repetitions):
+                    with open(file_name, "wb") as file:
+                        file.write(save_function())
+                save_time: float = (time.perf_counter() - start) / repetitions
+
+                start = time.perf_counter()
+                for i in range(repetitions):
+                    with open(file_name, "rb") as file:
+                        load_function(file.read())
+                load_time: float = (time.perf_counter() - start) / repetitions
+
+                header_time: str = "-"
+                if header_function is not None:
+                    start = time.perf_counter()
+                    for i in range(repetitions):
+                        header_function()
+                    header_time = "{:.3f}".format((time.perf_counter() - start) / repetitions * 1000)
+
+                print("{:>14}{:>10}{:>14}{:>14.3f}{:>14.3f}{:>14}".format(
+                    aquarium_size, format_name, os.path.getsize(file_name), save_time * 1000, load_time * 1000,
+                    header_time))
+
+
+def main(argv=None):
+    """
+    This main function is used to inspect, convert and benchmark saved game data.
+    :param argv: list of command line arguments, defaults to sys.argv[1:]
+    :return: None
+    """
+
+    import argparse
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Fishing Tycoon saved game data tool")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    header_parser = subparsers.add_parser("header", help="print the header of saved game data")
+    header_parser.add_argument("file_name")
+    convert_parser = subparsers.add_parser("convert", help="convert pickled saved game data to the save format")
+    convert_parser.add_argument("source_file_name")
+    convert_parser.add_argument("destination_file_name")
+    benchmark_parser = subparsers.add_parser("benchmark", help="compare the save format with pickle")
+    benchmark_parser.add_argument("--aquarium-sizes", default="1000,100000,10000000",
+                                  help="comma separated list of aquarium sizes")
+    benchmark_parser.add_argument("--fishing-rods", type=int, default=100, help="number of fishing rods owned")
+    benchmark_parser.add_argument("--repetitions", type=int, default=20, help="number of repetitions")
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    if args.command == "header":
+        print(read_save_header(args.file_name))
+    elif args.command == "convert":
+        convert_pickled_save(args.source_file_name, args.destination_file_name)
+        print("Converted '" + args.source_file_name + "' to '" + args.destination_file_name + "'.")
+    else:
+        benchmark([int(size) for size in args.aquarium_sizes.split(",")], args.fishing_rods, args.repetitions)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,37 @@
+"""
+This file contains the pytest configuration of the tests of the game "Fishing Tycoon".
+The modules of the game import each other by name, so the folder "code" is added to the module search path.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "code"))
+
+import pytest
+from numeric import get_numeric_backend, num, set_numeric_backend
+
+
+# Creating static functions to be used throughout the tests
+
+
+def is_close(value, expected):
+    # type: (object, object) -> bool
+    return abs(value - expected) <= abs(expected) * num("1e-9")
+
+
+# Creating fixtures
+
+
+@pytest.fixture(autouse=True)
+def restore_numeric_backend():
+    """
+    Restores the numeric backend selected before every test, since tests select the numeric backend they use with
+    set_numeric_backend(), which changes it for the whole process.
+    """
+    previous_numeric_backend: str = get_numeric_backend().name
+    yield
+    set_numeric_backend(previous_numeric_backend)
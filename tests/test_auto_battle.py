@@ -0,0 +1,52 @@
+"""
+This file contains the tests of the automatically resolved battles of the game "Fishing Tycoon".
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import math
+import random
+import pytest
+from numeric import set_numeric_backend
+from auto_battle import DIRECT_SIMULATION_TURNS, MAX_Z_SCORE, create_verification_scenarios, resolve_battle, \
+    verify_against_turn_by_turn
+
+
+# Creating constants used throughout this file
+
+
+TURNS_PER_SCENARIO: int = 1500000  # Turn by turn battles are given about this many turns in total per scenario
+MAX_TRIALS: int = 20000
+
+
+# Creating tests
+
+
+@pytest.fixture(autouse=True)
+def float_backend():
+    set_numeric_backend("float")  # Keeps the turn by turn battles fast enough to run many trials
+
+
+@pytest.mark.parametrize("scenario_index", range(len(create_verification_scenarios())))
+def test_resolve_battle_matches_turn_by_turn(scenario_index):
+    name, attack_power, critical_damage, sea_creature = create_verification_scenarios()[scenario_index]
+    # The battle must be long enough for resolve_battle() to sample it instead of simulating every turn.
+    assert math.ceil(sea_creature.max_hp / attack_power) > DIRECT_SIMULATION_TURNS
+
+    # Short battles get more trials, so that e.g. fleeing one turn late on average is detected.
+    expected_turns: float = min(math.ceil(sea_creature.max_hp / attack_power),
+                                1 / sea_creature.flee_chance if sea_creature.flee_chance > 0 else math.inf)
+    trials: int = min(MAX_TRIALS, int(TURNS_PER_SCENARIO / expected_turns))
+    z_scores: tuple = verify_against_turn_by_turn(attack_power, critical_damage, sea_creature, trials,
+                                                  random.Random(scenario_index))
+    assert all(abs(z_score) <= MAX_Z_SCORE for z_score in z_scores), (name, z_scores)
+
+
+def test_resolve_battle_catches_sea_creature_with_exact_damage():
+    name, attack_power, critical_damage, sea_creature = create_verification_scenarios()[1]
+    wild_sea_creature = sea_creature.clone()
+    result = resolve_battle(attack_power, critical_damage, wild_sea_creature, random.Random(0))
+    assert result.caught
+    assert result.turns == math.ceil(sea_creature.max_hp / attack_power)
+    assert wild_sea_creature.curr_hp <= 0
@@ -0,0 +1,104 @@
+"""
+This file contains the tests of the autosave system of "Fishing Tycoon": atomic writes, the rotation of checkpoints,
+saving only changed games and falling back to the newest readable checkpoint.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import os
+import pytest
+from numeric import num, set_numeric_backend
+from autosave import Autosaver, get_checkpoint_file_name, get_save_file_names, load_newest_game_data, \
+    rotate_checkpoints, write_file_atomically
+from catalog import Catalog, get_catalog
+from save_format import encode_game_data
+from fishing_tycoon import Game, Player
+
+
+# Creating static functions to be used throughout this file
+
+
+def create_game(coins):
+    # type: (str) -> Game
+    set_numeric_backend("mpmath")
+    catalog: Catalog = get_catalog()
+    player: Player = Player("Player")
+    player.coins = num(coins)
+    return Game(player, catalog.bodies_of_water, catalog.shop, 1)
+
+
+def read_file(file_name):
+    # type: (str) -> bytes
+    with open(file_name, "rb") as file:
+        return file.read()
+
+
+# Creating tests
+
+
+def test_failed_atomic_write_keeps_the_old_file(tmp_path):
+    file_name: str = str(tmp_path / "game.save")
+    write_file_atomically(file_name, b"old")
+    with pytest.raises(TypeError):
+        write_file_atomically(file_name, "not bytes")
+    assert read_file(file_name) == b"old"
+    # The temporary file was removed.
+    assert os.listdir(str(tmp_path)) == ["game.save"]
+
+    write_file_atomically(file_name, b"new")
+    assert read_file(file_name) == b"new"
+    assert os.listdir(str(tmp_path)) == ["game.save"]
+
+
+def test_checkpoints_are_rotated_from_newest_to_oldest(tmp_path):
+    file_name: str = str(tmp_path / "game.save")
+    for version in range(1, 5):
+        rotate_checkpoints(file_name, 2)
+        write_file_atomically(file_name, b"version " + str(version).encode())
+
+    assert read_file(file_name) == b"version 4"
+    assert read_file(get_checkpoint_file_name(file_name, 1)) == b"version 3"
+    assert read_file(get_checkpoint_file_name(file_name, 2)) == b"version 2"
+    assert not os.path.exists(get_checkpoint_file_name(file_name, 3))
+    assert get_save_file_names(file_name, 3) == [file_name, get_checkpoint_file_name(file_name, 1),
+                                                 get_checkpoint_file_name(file_name, 2)]
+
+
+def test_only_changed_games_are_saved(tmp_path):
+    file_name: str = str(tmp_path / "game.save")
+    game: Game = create_game("1e6")
+    autosaver: Autosaver = Autosaver(game, file_name, interval=0, checkpoints=1)
+    assert autosaver.save()
+    assert not autosaver.save()
+
+    # Passive income of an empty aquarium changes nothing.
+    game.credit_passive_income(60, game.last_played_time)
+    assert not autosaver.save()
+
+    assert game.player.buy_fishing_rod(game.shop.get_fishing_rods_sold()[0])
+    assert autosaver.is_dirty()
+    assert autosaver.save()
+    assert read_file(file_name) == encode_game_data(game)
+    assert os.path.exists(get_checkpoint_file_name(file_name, 1))
+
+    autosaver.stop()  # The final save is forced.
+    assert read_file(get_checkpoint_file_name(file_name, 1)) == encode_game_data(game)
+
+
+def test_unreadable_save_falls_back_to_newest_readable_checkpoint(tmp_path):
+    file_name: str = str(tmp_path / "game.save")
+    for coins in ("1", "2", "3"):
+        rotate_checkpoints(file_name, 2)
+        write_file_atomically(file_name, encode_game_data(create_game(coins)))
+    # The newest file and the newest checkpoint were damaged, e.g. by a disk failure.
+    write_file_atomically(file_name, b"FTSAVE")
+    write_file_atomically(get_checkpoint_file_name(file_name, 1), b"")
+
+    game, errors = load_newest_game_data(get_save_file_names(file_name, 2))
+    assert game.player.coins == num("1")
+    assert [error_file_name for error_file_name, error in errors] == [file_name,
+                                                                      get_checkpoint_file_name(file_name, 1)]
+
+    game, errors = load_newest_game_data([file_name])
+    assert game is None and len(errors) == 1
@@ -0,0 +1,107 @@
+"""
+This file contains the tests of copies of games of "Fishing Tycoon", which share their aquarium and fishing rods with
+the game they were copied from until either of them changes them.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import pytest
+from numeric import num, set_numeric_backend
+from fishing_tycoon import Game, Player, SeaCreature
+from save_format import create_benchmark_game, encode_game_data
+
+
+# Creating static functions to be used throughout this file
+
+
+def create_game():
+    # type: () -> Game
+    game: Game = create_benchmark_game(100, 25)
+    game.player.coins = num("1e70")
+    assert game.player.level_up_fishing_rod(2)  # The equipped fishing rod is no longer shared with its stack
+    return game
+
+
+def catch(player, sea_creature):
+    # type: (Player, SeaCreature) -> None
+    wild_sea_creature: SeaCreature = sea_creature.clone()
+    wild_sea_creature.curr_hp *= 0
+    assert player.catch_sea_creature(wild_sea_creature)
+
+
+def play(game):
+    # type: (Game) -> None
+    """
+    Changes every part of the game which a copy shares.
+    """
+    player: Player = game.player
+    sea_creatures: list = game.get_bodies_of_water()[0].get_potential_sea_creatures()
+    catch(player, sea_creatures[0])
+    catch(player, SeaCreature("Unknown", num("1"), num("2"), num("3"), num("4"), 0.5))
+    assert player.aquarium.remove_sea_creature(sea_creatures[1])
+    assert player.level_up_fishing_rod(1)  # Upgrading the equipped fishing rod
+    assert player.buy_fishing_rod(game.shop.get_fishing_rods_sold()[9])
+    assert player.sell_fishing_rod(player.get_fishing_rods_owned()[0])
+    player.add_fishing_rod(player.get_fishing_rods_owned()[1])  # Equipping a stacked fishing rod
+    assert player.level_up_fishing_rod(3)
+    player.gain_coins_after_time(3600)
+    player.gain_exp_after_time(3600)
+    game.rng.gauss(0, 1)
+    game.rng.random()
+
+
+# Creating tests
+
+
+@pytest.fixture(autouse=True)
+def mpmath_backend():
+    set_numeric_backend("mpmath")
+
+
+@pytest.mark.parametrize("changed_side", ["original", "copy"])
+def test_changing_one_side_does_not_change_the_other(changed_side):
+    game: Game = create_game()
+    data: bytes = encode_game_data(game)
+    copy: Game = game.clone()
+    assert encode_game_data(copy) == data
+
+    changed, unchanged = (game, copy) if changed_side == "original" else (copy, game)
+    play(changed)
+    assert encode_game_data(changed) != data
+    assert encode_game_data(unchanged) == data
+
+    # The unchanged side can be played like the changed one, with the same outcome.
+    play(unchanged)
+    assert encode_game_data(unchanged) == encode_game_data(changed)
+
+
+def test_copies_of_copies_are_independent():
+    game: Game = create_game()
+    data: bytes = encode_game_data(game)
+    copies: list = [game]
+    for i in range(3):
+        copies.append(copies[-1].clone())
+
+    play(copies[2])
+    for i, copy in enumerate(copies):
+        if i != 2:
+            assert encode_game_data(copy) == data
+
+    played_data: bytes = encode_game_data(copies[2])
+    play(copies[0])
+    play(copies[3])
+    assert encode_game_data(copies[0]) == encode_game_data(copies[3])
+    assert encode_game_data(copies[1]) == data
+    assert encode_game_data(copies[2]) == played_data
+
+
+def test_equipped_fishing_rod_is_not_shared_after_upgrade():
+    game: Game = create_game()
+    copy: Game = game.clone()
+    attack_power = copy.player.fishing_rod.attack_power
+    assert game.player.level_up_fishing_rod(1)
+    assert game.player.fishing_rod is not copy.player.fishing_rod
+    assert copy.player.fishing_rod.attack_power == attack_power
+    assert copy.player.fishing_rod.level == 3
+    assert game.player.fishing_rod.level == 4
@@ -0,0 +1,108 @@
+"""
+This file contains the tests of the event log of "Fishing Tycoon", whose replay must rebuild exactly the game which
+was recorded.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import json
+import random
+from datetime import datetime, timedelta
+import pytest
+from numeric import NUMERIC_BACKENDS, set_numeric_backend
+from catalog import Catalog, get_catalog
+from event_log import open_event_log, read_events, replay_events, replay_file
+from game_engine import GameEngine
+from fishing_tycoon import Game, Player
+from save_format import encode_game_data
+
+
+# Creating constants used throughout this file
+
+
+COMMANDS: list = ["GO FISHING 0", "GO FISHING 1", "ATTACK", "ATTACK", "ATTACK", "AUTO", "FLEE", "GO SHOPPING 0",
+                  "GO SHOPPING 1", "UPGRADE FISHING ROD", "UPGRADE FISHING ROD LEVELS 2", "UPGRADE FISHING ROD MAX",
+                  "SELL FISHING ROD 0", "EQUIP FISHING ROD 0", "EQUIP FISHING ROD 1", "UNEQUIP FISHING ROD",
+                  "VIEW STATS", "WAIT 600"]
+
+
+# Creating static functions to be used throughout this file
+
+
+def create_game(seed):
+    # type: (int) -> Game
+    catalog: Catalog = get_catalog()
+    game: Game = Game(Player("Replay"), catalog.bodies_of_water, catalog.shop, seed)
+    game.last_played_time = datetime(2026, 1, 1)
+    return game
+
+
+def play_session(game, file_name, script_rng, commands):
+    # type: (Game, str, random.Random, int) -> None
+    """
+    Records a session of the given number of commands chosen by script_rng, with passive income granted by the
+    clock in between.
+    """
+    event_log = open_event_log(file_name, game)
+    engine: GameEngine = GameEngine(game)
+    try:
+        for i in range(commands):
+            engine.execute(script_rng.choice(COMMANDS))
+            if i % 25 == 0:
+                game.credit_passive_income(90, game.last_played_time + timedelta(seconds=90))
+    finally:
+        game.set_event_log(None)
+        event_log.close()
+
+
+# Creating tests
+
+
+@pytest.mark.parametrize("numeric_backend", sorted(NUMERIC_BACKENDS))
+def test_replay_rebuilds_identical_save(tmp_path, numeric_backend):
+    set_numeric_backend(numeric_backend)
+    file_name: str = str(tmp_path / "game.log")
+    game: Game = create_game(2026)
+    play_session(game, file_name, random.Random(1), 400)
+
+    result = replay_events(read_events(file_name))
+    assert result.error is None
+    assert result.commands == 400
+    assert result.draws > 0
+    assert encode_game_data(result.game) == encode_game_data(game)
+
+
+def test_replay_of_several_sessions_rebuilds_identical_save(tmp_path):
+    set_numeric_backend("mpmath")
+    file_name: str = str(tmp_path / "game.log")
+    game: Game = create_game(7)
+    play_session(game, file_name, random.Random(2), 200)
+    # The game is changed between the sessions (e.g. by a version which did not record it), so that the second
+    # session starts from its own snapshot, taken while gauss() keeps a normal value for its next call.
+    game.player.gain_exp_after_time(10)
+    game.rng.gauss(0, 1)
+    play_session(game, file_name, random.Random(3), 200)
+
+    result = replay_events(read_events(file_name))
+    assert result.error is None
+    assert result.commands == 400
+    assert encode_game_data(result.game) == encode_game_data(game)
+
+    output_directory = tmp_path / "replayed"
+    output_directory.mkdir()
+    summary: dict = replay_file(file_name, str(output_directory))
+    assert summary["error"] is None
+    assert (output_directory / "game.save").read_bytes() == encode_game_data(game)
+
+
+def test_replay_detects_changed_random_number(tmp_path):
+    set_numeric_backend("mpmath")
+    file_name: str = str(tmp_path / "game.log")
+    play_session(create_game(11), file_name, random.Random(4), 100)
+
+    events: list = list(read_events(file_name))
+    draw_index: int = [i for i, event in enumerate(events) if event["type"] == "draw"][5]
+    events[draw_index] = dict(events[draw_index], value=json.loads(json.dumps(events[draw_index]["value"])) + 1)
+    result = replay_events(iter(events))
+    assert result.error is not None
@@ -0,0 +1,102 @@
+"""
+This file contains the tests of upgrading fishing rods of "Fishing Tycoon" by many levels at once, which must give the
+same result and cost as upgrading them one level at a time like the original version of the game.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import pytest
+from conftest import is_close
+from numeric import NUMERIC_BACKENDS, get_numeric_backend, num, set_numeric_backend
+from fishing_tycoon import FishingRod, Player
+
+
+# Creating static functions to be used throughout this file
+
+
+def create_fishing_rod(level):
+    # type: (int) -> FishingRod
+    fishing_rod: FishingRod = FishingRod("Fishing Rod #1", num("1e3"), num("1e5"))
+    level_up_step_by_step(fishing_rod, level - 1)
+    return fishing_rod
+
+
+def level_up_step_by_step(fishing_rod, levels):
+    # type: (FishingRod, int) -> object
+    """
+    Levels up the fishing rod one level at a time and returns the total coin cost of the levels.
+    """
+    coin_cost = num("0")
+    for i in range(levels):
+        coin_cost += fishing_rod.level_up_coin_cost
+        fishing_rod.level += 1
+        fishing_rod.attack_power *= get_numeric_backend().power_of_ten(fishing_rod.level)
+        fishing_rod.critical_damage += num("0.1") * fishing_rod.level
+        fishing_rod.level_up_coin_cost *= get_numeric_backend().power_of_ten(fishing_rod.level)
+    return coin_cost
+
+
+# Creating tests
+
+
+@pytest.mark.parametrize("numeric_backend", sorted(NUMERIC_BACKENDS))
+@pytest.mark.parametrize("start_level", [1, 2, 4])
+@pytest.mark.parametrize("levels", [1, 2, 3, 5])
+def test_bulk_upgrade_matches_step_by_step(numeric_backend, start_level, levels):
+    set_numeric_backend(numeric_backend)
+    fishing_rod: FishingRod = create_fishing_rod(start_level)
+    expected: FishingRod = fishing_rod.clone()
+
+    coin_cost = fishing_rod.get_upgrade_coin_cost(levels)
+    fishing_rod.level_up(levels)
+    expected_coin_cost = level_up_step_by_step(expected, levels)
+    assert fishing_rod.level == expected.level == start_level + levels
+    assert is_close(coin_cost, expected_coin_cost)
+    assert is_close(fishing_rod.attack_power, expected.attack_power)
+    assert is_close(fishing_rod.critical_damage, expected.critical_damage)
+    assert is_close(fishing_rod.level_up_coin_cost, expected.level_up_coin_cost)
+
+
+@pytest.mark.parametrize("numeric_backend", sorted(NUMERIC_BACKENDS))
+@pytest.mark.parametrize("start_level", [1, 3])
+@pytest.mark.parametrize("levels", [1, 2, 4])
+def test_affordable_levels_at_boundaries(numeric_backend, start_level, levels):
+    set_numeric_backend(numeric_backend)
+    fishing_rod: FishingRod = create_fishing_rod(start_level)
+    coin_cost = fishing_rod.get_upgrade_coin_cost(levels)
+    assert fishing_rod.get_affordable_levels(coin_cost) == levels
+    assert fishing_rod.get_affordable_levels(coin_cost * num("0.999999999")) == levels - 1
+    assert fishing_rod.get_affordable_levels(num("0")) == 0
+
+
+def test_affordable_levels_of_many_levels():
+    set_numeric_backend("bignumber")
+    fishing_rod: FishingRod = create_fishing_rod(1)
+    for levels in (10, 100, 500):
+        coin_cost = fishing_rod.get_upgrade_coin_cost(levels)
+        assert fishing_rod.get_affordable_levels(coin_cost) == levels
+        assert fishing_rod.get_affordable_levels(coin_cost * num("0.999999999")) == levels - 1
+
+
+@pytest.mark.parametrize("numeric_backend", sorted(NUMERIC_BACKENDS))
+def test_player_pays_for_bulk_upgrade_of_equipped_fishing_rod(numeric_backend):
+    set_numeric_backend(numeric_backend)
+    player: Player = Player("Player")
+    player.coins = num("1e20")
+    assert player.buy_fishing_rod(create_fishing_rod(1))
+    player.add_fishing_rod(player.get_fishing_rods_owned()[0])
+    coins = player.coins
+    expected: FishingRod = player.fishing_rod.clone()
+    expected_coin_cost = level_up_step_by_step(expected, 4)
+
+    assert player.level_up_fishing_rod(4)
+    assert player.fishing_rod.level == 5
+    assert is_close(coins - player.coins, expected_coin_cost)
+    assert is_close(player.attack_power, num("500") + expected.attack_power)
+
+    # Upgrading by more levels than the player can afford changes nothing.
+    coins = player.coins
+    assert player.get_affordable_fishing_rod_levels() < 30
+    assert not player.level_up_fishing_rod(30)
+    assert (player.coins, player.fishing_rod.level) == (coins, 5)
@@ -0,0 +1,73 @@
+"""
+This file contains the tests of the headless engine and the passive income ticker of "Fishing Tycoon", which must
+report values out of the range of the numeric backend instead of raising them.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+from datetime import datetime, timedelta
+from numeric import num, set_numeric_backend
+from catalog import Catalog, get_catalog
+from game_engine import CommandResult, GameEngine
+from income_ticker import IncomeTicker
+from fishing_tycoon import Game, Player
+
+
+# Creating static functions to be used throughout this file
+
+
+def create_game(exp):
+    # type: (str) -> Game
+    set_numeric_backend("float")
+    catalog: Catalog = get_catalog()
+    player: Player = Player("Player")
+    player.exp = num(exp)
+    player.attack_power = num("1e9")  # Enough to catch every sea creature with one attack
+    return Game(player, catalog.bodies_of_water, catalog.shop, 1)
+
+
+# Creating tests
+
+
+def test_command_out_of_float_range_fails_without_raising():
+    game: Game = create_game("1e306")
+    engine: GameEngine = GameEngine(game)
+    assert engine.execute("GO FISHING 0").success
+
+    result: CommandResult = engine.execute("AUTO")
+    assert not result.success
+    assert "out of the range" in result.message
+    assert (game.player.level, game.player.exp, len(game.player.aquarium)) == (1, num("1e306"), 0)
+    assert engine.execute("VIEW STATS").success
+
+
+def test_income_ticker_keeps_the_error_instead_of_raising():
+    game: Game = create_game("1e306")
+    game.player.aquarium.add_sea_creature(get_catalog().sea_creatures[0])
+    now: list = [0.0]
+    income_ticker: IncomeTicker = IncomeTicker(game, tick_interval=0, clock=lambda: now[0])
+
+    now[0] = 10.5
+    assert income_ticker.credit() == 10
+    assert "out of the range" in income_ticker.error
+    assert game.player.exp == num("1e306")
+
+    # The seconds are not granted again by the next credit.
+    assert income_ticker.credit() == 0
+    game.player.exp = num("0")
+    now[0] = 11.5
+    assert income_ticker.credit() == 1
+    assert income_ticker.error is None
+    assert game.player.exp == num("1000")
+
+
+def test_real_time_engine_keeps_the_error_of_the_time_away():
+    game: Game = create_game("1e306")
+    game.player.aquarium.add_sea_creature(get_catalog().sea_creatures[0])
+    game.last_played_time = datetime.now() - timedelta(seconds=100)
+    engine: GameEngine = GameEngine(game, real_time=True)
+
+    assert "out of the range" in engine.income_ticker.error
+    assert game.player.exp == num("1e306")
+    assert engine.execute("VIEW STATS").success
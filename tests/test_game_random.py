@@ -0,0 +1,65 @@
+"""
+This file contains the tests of the random number generator of a game of "Fishing Tycoon", whose saved state must
+restore exactly the same sequence of random numbers.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import pickle
+import pytest
+from fishing_tycoon import GAME_RANDOM_RESEED_WORDS, GameRandom
+from save_format import create_benchmark_game, decode_game_data, encode_game_data
+
+
+# Creating static functions to be used throughout this file
+
+
+def draw(rng):
+    # type: (GameRandom) -> list
+    return [rng.random(), rng.gauss(0, 1), rng.gauss(0, 1), rng.gauss(0, 1), rng.getrandbits(70), rng.randrange(10)]
+
+
+def restore_with_save_format(rng):
+    # type: (GameRandom) -> GameRandom
+    game = create_benchmark_game(10, 3)
+    game.rng = rng
+    return decode_game_data(encode_game_data(game)).rng
+
+
+def restore_with_pickle(rng):
+    # type: (GameRandom) -> GameRandom
+    return pickle.loads(pickle.dumps(rng))
+
+
+def restore_with_state(rng):
+    # type: (GameRandom) -> GameRandom
+    return GameRandom(rng.initial_seed, rng.words_drawn, rng.gauss_next)
+
+
+# Creating tests
+
+
+@pytest.mark.parametrize("restore", [restore_with_save_format, restore_with_pickle, restore_with_state,
+                                     GameRandom.clone])
+@pytest.mark.parametrize("gauss_calls", [0, 1, 2])
+def test_restored_state_draws_identical_sequence(restore, gauss_calls):
+    rng: GameRandom = GameRandom(12345)
+    rng.random()
+    for i in range(gauss_calls):
+        rng.gauss(0, 1)
+    # After an odd number of calls, gauss() keeps the second value it computed for the next call.
+    assert (rng.gauss_next is not None) == (gauss_calls % 2 == 1)
+
+    restored: GameRandom = restore(rng)
+    assert draw(restored) == draw(rng)
+
+
+def test_restored_state_after_reseeding_draws_identical_sequence():
+    rng: GameRandom = GameRandom(1)
+    while rng.initial_seed == 1:
+        rng.getrandbits(32 * 1000)
+    assert rng.words_drawn < GAME_RANDOM_RESEED_WORDS
+
+    restored: GameRandom = restore_with_save_format(rng)
+    assert draw(restored) == draw(rng)
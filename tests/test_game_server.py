@@ -0,0 +1,91 @@
+"""
+This file contains the tests of the multiplayer server of "Fishing Tycoon", which must save the game of a player who
+leaves and close their connection even if saving fails.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import asyncio
+import json
+import logging
+import os
+import game_server
+from game_server import GameServer
+from numeric import num
+from catalog import Catalog, get_catalog
+from fishing_tycoon import Game, Player, save_game_data
+
+
+# Creating static functions to be used throughout this file
+
+
+def create_save(save_directory, name):
+    # type: (str, str) -> None
+    """
+    Saves the game of a player who can afford to buy a fishing rod, which changes the game.
+    """
+    catalog: Catalog = get_catalog()
+    player: Player = Player(name)
+    player.coins = num("1e6")
+    save_game_data(Game(player, catalog.bodies_of_water, catalog.shop, 1),
+                   os.path.join(save_directory, name + ".save"))
+
+
+async def play(server, commands):
+    # type: (GameServer, list) -> list
+    """
+    Sends the commands on a new connection, and returns the results received until the server closed it.
+    """
+    reader, writer = await asyncio.open_connection("127.0.0.1", server.get_port())
+    for command in commands:
+        writer.write((command + "\n").encode())
+    await writer.drain()
+    results: list = []
+    while True:
+        line: bytes = await asyncio.wait_for(reader.readline(), 10)
+        if not line:
+            break
+        results.append(json.loads(line))
+    writer.close()
+    return results
+
+
+async def run_session(save_directory, commands):
+    # type: (str, list) -> tuple
+    server: GameServer = GameServer(save_directory, flush_interval=0, seed=1)
+    await server.start("127.0.0.1", 0)
+    try:
+        results: list = await play(server, commands)
+        return results, dict(server.sessions), dict(server.leaving_sessions)
+    finally:
+        await server.close()
+
+
+# Creating tests
+
+
+def test_game_is_saved_when_the_player_leaves(tmp_path):
+    create_save(str(tmp_path), "Alice")
+    results, sessions, leaving_sessions = asyncio.run(
+        run_session(str(tmp_path), ["LOGIN Alice", "GO SHOPPING 0", "QUIT"]))
+    assert [result["success"] for result in results] == [True, True, True, True]
+    assert (sessions, leaving_sessions) == ({}, {})
+    results, sessions, leaving_sessions = asyncio.run(
+        run_session(str(tmp_path), ["LOGIN Alice", "VIEW STATS", "QUIT"]))
+    assert results[2]["data"]["fishing_rods_owned"] == 1
+
+
+def test_connection_is_closed_when_saving_fails(tmp_path, monkeypatch, caplog):
+    def fail_to_write(file_name, data):
+        raise OSError("No space left on device")
+
+    create_save(str(tmp_path), "Bob")
+    monkeypatch.setattr(game_server, "write_file_atomically", fail_to_write)
+    with caplog.at_level(logging.ERROR, logger="game_server"):
+        # The connection is closed by the server, so the results end instead of timing out.
+        results, sessions, leaving_sessions = asyncio.run(
+            run_session(str(tmp_path), ["LOGIN Bob", "GO SHOPPING 0", "QUIT"]))
+    assert results[-1]["command"] == "QUIT"
+    assert (sessions, leaving_sessions) == ({}, {})
+    assert "Could not save the game of 'Bob'." in caplog.text
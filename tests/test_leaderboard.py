@@ -0,0 +1,93 @@
+"""
+This file contains the tests of the leaderboards of "Fishing Tycoon", whose index must only read the saved game data
+files which were added or changed since the last update, forget deleted files and remember unreadable ones.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import os
+import pytest
+import leaderboard
+from numeric import num, set_numeric_backend
+from leaderboard import LeaderboardIndex, ScanResult
+from catalog import Catalog, get_catalog
+from fishing_tycoon import Game, Player, save_game_data
+
+
+# Creating static functions to be used throughout this file
+
+
+def save_player(save_directory, name, level, coins, aquarium_size):
+    # type: (str, str, int, str, int) -> str
+    catalog: Catalog = get_catalog()
+    player: Player = Player(name)
+    player.level = level
+    player.coins = num(coins)
+    player.aquarium.add_sea_creature(catalog.sea_creatures[0], aquarium_size)
+    file_name: str = os.path.join(save_directory, name + ".save")
+    save_game_data(Game(player, catalog.bodies_of_water, catalog.shop, 1), file_name)
+    return file_name
+
+
+def get_ranking(index, leaderboard_name):
+    # type: (LeaderboardIndex, str) -> list
+    return [entry.name for entry in index.get_top(leaderboard_name)]
+
+
+def get_counts(scan_result):
+    # type: (ScanResult) -> tuple
+    return scan_result.files, scan_result.read, scan_result.removed, scan_result.unreadable
+
+
+# Creating tests
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_update_only_reads_changed_files(tmp_path, monkeypatch, workers):
+    set_numeric_backend("bignumber")
+    # Scanning with worker processes even though there are only a few files
+    monkeypatch.setattr(leaderboard, "PARALLEL_SCAN_MIN_FILES", 0)
+    save_directory: str = str(tmp_path / "saves")
+    os.makedirs(save_directory)
+    file_names: dict = {name: save_player(save_directory, name, level, coins, aquarium_size) for
+                        name, level, coins, aquarium_size in [("Ann", 3, "1e10", 5), ("Ben", 7, "1e3", 1),
+                                                              ("Cid", 5, "1e300", 9), ("Dee", 1, "0", 2)]}
+    with open(os.path.join(save_directory, "notes.txt"), "w") as file:
+        file.write("Not a saved game data file")
+
+    index: LeaderboardIndex = LeaderboardIndex(str(tmp_path / "leaderboard.sqlite3"))
+    try:
+        assert get_counts(index.update(save_directory, workers)) == (4, 4, 0, 0)
+        assert get_ranking(index, "level") == ["Ben", "Cid", "Ann", "Dee"]
+        # Players without coins are ranked last.
+        assert get_ranking(index, "coins") == ["Cid", "Ann", "Ben", "Dee"]
+        assert get_ranking(index, "aquarium") == ["Cid", "Ann", "Dee", "Ben"]
+        assert get_counts(index.update(save_directory, workers)) == (4, 0, 0, 0)
+
+        # Ann is changed, Ben is deleted and Cid is corrupted.
+        save_player(save_directory, "Ann", 9, "1e400", 5)
+        stat: os.stat_result = os.stat(file_names["Ann"])
+        os.utime(file_names["Ann"], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        os.remove(file_names["Ben"])
+        with open(file_names["Cid"], "wb") as file:
+            file.write(b"FTSAVE\x05\x03")
+        assert get_counts(index.update(save_directory, workers)) == (3, 2, 1, 1)
+        assert get_ranking(index, "level") == ["Ann", "Dee"]
+        assert get_ranking(index, "coins") == ["Ann", "Dee"]
+        assert [file_name for file_name, error in index.get_unreadable_files()] == ["Cid.save"]
+        assert len(index) == 3
+
+        # The unreadable file is only read again once it changes.
+        assert get_counts(index.update(save_directory, workers)) == (3, 0, 0, 0)
+    finally:
+        index.close()
+
+
+def test_unknown_leaderboard_raises_value_error(tmp_path):
+    index: LeaderboardIndex = LeaderboardIndex(str(tmp_path / "leaderboard.sqlite3"))
+    try:
+        with pytest.raises(ValueError):
+            index.get_top("exp")
+    finally:
+        index.close()
@@ -0,0 +1,100 @@
+"""
+This file contains the tests of levelling up players of "Fishing Tycoon" in closed form, which must give the same
+result as levelling up one level at a time like the original version of the game.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import pytest
+from conftest import is_close
+from numeric import NUMERIC_BACKENDS, get_numeric_backend, num, set_numeric_backend
+from fishing_tycoon import Player, triangular
+
+
+# Creating static functions to be used throughout this file
+
+
+def create_player(level):
+    # type: (int) -> Player
+    """
+    Returns a player who reached the given level one level at a time.
+    """
+    player: Player = Player("Player")
+    while player.level < level:
+        player.exp = player.required_exp
+        level_up_step_by_step(player)
+    player.exp *= 0
+    return player
+
+
+def level_up_step_by_step(player):
+    # type: (Player) -> None
+    while player.exp >= player.required_exp:
+        player.level += 1
+        player.required_exp *= get_numeric_backend().power_of_ten(player.level)
+        player.attack_power *= triangular(player.level)
+
+
+def get_level_thresholds(player, levels):
+    # type: (Player, int) -> list
+    """
+    Returns the EXP needed to gain 1, 2, ..., levels levels from the player's current level.
+    """
+    res: list = [player.required_exp]
+    for level in range(player.level + 1, player.level + levels):
+        res.append(res[-1] * get_numeric_backend().power_of_ten(level))
+    return res
+
+
+# Creating tests
+
+
+@pytest.mark.parametrize("numeric_backend", sorted(NUMERIC_BACKENDS))
+@pytest.mark.parametrize("start_level", [1, 2, 5])
+@pytest.mark.parametrize("levels", [0, 1, 2, 3, 7])
+def test_closed_form_matches_step_by_step(numeric_backend, start_level, levels):
+    set_numeric_backend(numeric_backend)
+    player: Player = create_player(start_level)
+    if levels > 0:
+        # Three times the EXP needed for the levels, which is far from the EXP needed for one more level
+        player.exp = get_level_thresholds(player, levels)[-1] * 3
+    else:
+        player.exp = player.required_exp * num("0.5")
+    expected: Player = player.clone()
+
+    player.level_up()
+    level_up_step_by_step(expected)
+    assert player.level == expected.level == start_level + levels
+    assert is_close(player.required_exp, expected.required_exp)
+    assert is_close(player.attack_power, expected.attack_power)
+
+
+@pytest.mark.parametrize("start_level", [1, 3, 10, 40])
+@pytest.mark.parametrize("levels", [1, 2, 5, 20])
+def test_closed_form_matches_step_by_step_at_boundaries(start_level, levels):
+    # Powers of ten are exact BigNumber objects, so the EXP can be exactly at a boundary.
+    set_numeric_backend("bignumber")
+    player: Player = create_player(start_level)
+    threshold = get_level_thresholds(player, levels)[-1]
+    for exp, levels_gained in ((threshold, levels), (threshold * num("0.999999999"), levels - 1)):
+        at_boundary: Player = player.clone()
+        at_boundary.exp = exp
+        expected: Player = at_boundary.clone()
+        at_boundary.level_up()
+        level_up_step_by_step(expected)
+        assert at_boundary.level == expected.level == start_level + levels_gained
+        assert at_boundary.required_exp == expected.required_exp
+        assert is_close(at_boundary.attack_power, expected.attack_power)
+
+
+def test_level_up_across_many_levels_at_once():
+    set_numeric_backend("bignumber")
+    player: Player = create_player(1)
+    player.exp = get_level_thresholds(player, 1000)[-1]
+    expected: Player = player.clone()
+    player.level_up()
+    level_up_step_by_step(expected)
+    assert player.level == expected.level == 1001
+    assert player.required_exp == expected.required_exp
+    assert is_close(player.attack_power, expected.attack_power)
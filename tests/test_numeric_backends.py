@@ -0,0 +1,103 @@
+"""
+This file contains the tests of the numeric backends of "Fishing Tycoon" at the edge of the range of native floats,
+where an EXP or coin gain must either be granted completely or not at all.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+from datetime import datetime, timedelta
+import pytest
+from numeric import num, set_numeric_backend
+from catalog import Catalog, get_catalog
+from fishing_tycoon import Game, Player, SeaCreature, FishingRod
+
+
+# Creating static functions to be used throughout this file
+
+
+def create_game(exp):
+    # type: (str) -> Game
+    """
+    Returns a game of a level 5 player with a Pegaklesk (1000 EXP and 1000 coins per second) in their aquarium, who
+    needs 1e305 EXP for the next level, so that the EXP needed for the level after it (1e311) is out of the range of
+    native floats.
+    """
+    set_numeric_backend("float")
+    catalog: Catalog = get_catalog()
+    player: Player = Player("Player")
+    player.aquarium.add_sea_creature(catalog.sea_creatures[0])
+    player.level = 5
+    player.required_exp = num("1e305")
+    player.exp = num(exp)
+    player.coins = num("1e50")
+    game: Game = Game(player, catalog.bodies_of_water, catalog.shop, 1)
+    game.last_played_time = datetime(2026, 1, 1)
+    return game
+
+
+def get_economy_values(player):
+    # type: (Player) -> tuple
+    return player.level, player.exp, player.required_exp, player.coins, player.attack_power, len(player.aquarium)
+
+
+# Creating tests
+
+
+def test_income_below_the_next_level_is_granted():
+    game: Game = create_game("0")
+    assert game.catch_up(datetime(2026, 1, 1) + timedelta(seconds=100)) == 100
+    assert (game.player.level, game.player.exp, game.player.coins) == (5, num("1e5"), num("1e50") + num("1e5"))
+
+
+def test_income_out_of_float_range_is_neither_granted_nor_granted_again():
+    game: Game = create_game("1e305")
+    values: tuple = get_economy_values(game.player)
+    change_count: int = game.player.change_count
+    now: datetime = datetime(2026, 1, 1) + timedelta(seconds=100)
+
+    with pytest.raises(OverflowError):
+        game.catch_up(now)
+    assert get_economy_values(game.player) == values
+    assert game.player.change_count == change_count
+    # The seconds were credited, so catching up again neither raises nor grants them.
+    assert game.last_played_time == now
+    assert game.catch_up(now) == 0
+    assert get_economy_values(game.player) == values
+
+
+def test_catch_out_of_float_range_changes_nothing():
+    game: Game = create_game("1e305")
+    values: tuple = get_economy_values(game.player)
+    sea_creature: SeaCreature = get_catalog().sea_creatures[0].clone()
+    sea_creature.curr_hp = num("0")
+
+    with pytest.raises(OverflowError):
+        game.player.catch_sea_creature(sea_creature)
+    assert get_economy_values(game.player) == values
+
+
+def test_fishing_rod_upgrade_out_of_float_range_changes_nothing():
+    game: Game = create_game("0")
+    assert game.player.buy_fishing_rod(FishingRod("Fishing Rod #1", num("1e307"), num("1e3")))
+    game.player.add_fishing_rod(game.player.get_fishing_rods_owned()[0])
+    values: tuple = get_economy_values(game.player)
+    fishing_rod_values: tuple = (game.player.fishing_rod.level, game.player.fishing_rod.attack_power,
+                                 game.player.fishing_rod.level_up_coin_cost)
+
+    # Levelling up multiplies the attack power of the fishing rod by 100, which is out of the range of native floats.
+    with pytest.raises(OverflowError):
+        game.player.level_up_fishing_rod()
+    assert get_economy_values(game.player) == values
+    assert (game.player.fishing_rod.level, game.player.fishing_rod.attack_power,
+            game.player.fishing_rod.level_up_coin_cost) == fishing_rod_values
+
+
+def test_zero_income_does_not_mark_the_player_changed():
+    game: Game = create_game("0")
+    game.player.aquarium.remove_sea_creature(get_catalog().sea_creatures[0])
+    change_count: int = game.player.change_count
+    game.player.gain_income_after_time(100)
+    game.player.gain_exp_after_time(100)
+    game.player.gain_coins_after_time(100)
+    assert game.player.change_count == change_count
@@ -0,0 +1,168 @@
+"""
+This file contains the tests of the save format of the game "Fishing Tycoon" and of the migration of saved game data
+from older versions of the game.
+The files in the folder "data" were saved by older versions of the game: "legacy_pickled_save" is a game pickled by
+the original version, whose classes were defined in '__main__', and "save_format_version_2" was written before
+owned fishing rods were saved as stacks.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import os
+from datetime import datetime
+import pytest
+from numeric import NUMERIC_BACKENDS, num, set_numeric_backend
+from fishing_tycoon import Game, GameRandom, load_game_data, save_game_data
+from save_format import MAGIC, SAVE_FORMAT_VERSION, create_benchmark_game, decode_game_data, encode_game_data, \
+    read_save_header
+
+
+# Creating constants used throughout this file
+
+
+DATA_DIRECTORY: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+# Creating static functions to be used throughout this file
+
+
+def create_game():
+    # type: () -> Game
+    """
+    Returns a game using every part of the save format: stacked and upgraded fishing rods, an equipped fishing rod,
+    sea creatures, the time it was last played and a random number generator keeping a normal value.
+    """
+    game: Game = create_benchmark_game(1000, 25)
+    game.player.coins = num("1e30")
+    assert game.player.level_up_fishing_rod(3)
+    game.player.exp = num("123456789")
+    game.last_played_time = datetime(2026, 1, 1, 12, 0, 0, 250)
+    game.rng = GameRandom(7, 1000)
+    game.rng.gauss(0, 1)
+    return game
+
+
+def get_fishing_rod_entries(game):
+    # type: (Game) -> list
+    return [(fishing_rod.name, count, fishing_rod.level, str(fishing_rod.attack_power))
+            for fishing_rod, count in game.player.get_fishing_rods_owned().get_entries()]
+
+
+# Creating tests
+
+
+@pytest.fixture(autouse=True)
+def mpmath_backend():
+    set_numeric_backend("mpmath")
+
+
+@pytest.mark.parametrize("numeric_backend", sorted(NUMERIC_BACKENDS))
+def test_round_trip_is_identical(numeric_backend):
+    set_numeric_backend(numeric_backend)
+    game: Game = create_game()
+    data: bytes = encode_game_data(game)
+    loaded: Game = decode_game_data(data)
+
+    assert encode_game_data(loaded) == data
+    assert loaded.player.player_id == game.player.player_id
+    assert (loaded.player.level, loaded.player.coins, loaded.player.exp, loaded.player.attack_power) == \
+           (game.player.level, game.player.coins, game.player.exp, game.player.attack_power)
+    assert get_fishing_rod_entries(loaded) == get_fishing_rod_entries(game)
+    assert loaded.player.fishing_rod.level == 4
+    assert loaded.player.fishing_rod in loaded.player.get_fishing_rods_owned()
+    assert len(loaded.player.aquarium) == 1000
+    assert loaded.player.aquarium.exp_per_second == game.player.aquarium.exp_per_second
+    assert loaded.last_played_time == game.last_played_time
+    assert [loaded.rng.gauss(0, 1) for i in range(3)] == [game.rng.gauss(0, 1) for i in range(3)]
+
+
+def test_saved_file_header_is_read_without_body(tmp_path):
+    game: Game = create_game()
+    file_name: str = str(tmp_path / "game.save")
+    save_game_data(game, file_name)
+
+    header = read_save_header(file_name)
+    assert (header.version, header.player_id, header.name, header.level, header.coins, header.aquarium_size) == \
+           (SAVE_FORMAT_VERSION, game.player.player_id, game.player.name, game.player.level, game.player.coins, 1000)
+    assert encode_game_data(load_game_data(file_name)) == encode_game_data(game)
+
+
+def test_stacked_fishing_rods_are_saved_once_per_stack():
+    sizes: list = []
+    for fishing_rods in (1000, 100000):
+        game: Game = create_benchmark_game(10, fishing_rods)
+        game.rng = GameRandom(1)
+        sizes.append(len(encode_game_data(game)))
+    # Only the counts of the 10 stacks grow, by at most 2 bytes each.
+    assert sizes[1] - sizes[0] <= 20
+
+
+def test_identical_fishing_rods_in_separate_entries_are_not_merged():
+    game: Game = create_benchmark_game(10, 0)
+    fishing_rods_owned = game.player.get_fishing_rods_owned()
+    # The fishing rod taken out of its stack keeps an entry of its own after the rest of the stack is sold, and the
+    # fishing rod bought afterwards starts a new stack behind it.
+    fishing_rod = fishing_rods_owned.add(game.shop.get_fishing_rods_sold()[0].clone(), 2)
+    taken_fishing_rod = fishing_rods_owned.take(fishing_rod)
+    assert fishing_rods_owned.remove(fishing_rod)
+    fishing_rods_owned.add(game.shop.get_fishing_rods_sold()[0].clone())
+    entries: list = get_fishing_rod_entries(game)
+    assert len(entries) == 2 and entries[0] == entries[1]
+
+    loaded_game: Game = decode_game_data(encode_game_data(game))
+    loaded_fishing_rods_owned = loaded_game.player.get_fishing_rods_owned()
+    assert get_fishing_rod_entries(loaded_game) == entries
+    assert loaded_fishing_rods_owned.get_stack(loaded_fishing_rods_owned[1]) is loaded_fishing_rods_owned[1]
+    assert fishing_rods_owned.get_stack(taken_fishing_rod) is fishing_rods_owned[1]
+
+
+def test_non_finite_numbers_are_not_saved():
+    set_numeric_backend("float")
+    game: Game = create_benchmark_game(10, 1)
+    game.player.coins = float("inf")
+    with pytest.raises(ValueError):
+        encode_game_data(game)
+
+
+@pytest.mark.parametrize("length", [len(MAGIC), len(MAGIC) + 1, 20, -1])
+def test_truncated_data_raises_value_error(length):
+    data: bytes = encode_game_data(create_game())
+    with pytest.raises(ValueError):
+        decode_game_data(data[:length])
+
+
+def test_legacy_pickled_save_is_migrated():
+    game: Game = load_game_data(os.path.join(DATA_DIRECTORY, "legacy_pickled_save"))
+    player = game.player
+    assert (player.player_id, player.name, player.level) == ("00000000-0000-0000-0000-000000000001", "Legacy", 3)
+    assert (player.coins, player.exp, player.attack_power) == (num("799800000"), num("2000024000"), num("101500"))
+
+    # The original version equipped the owned fishing rod itself, which must not be stacked with the others.
+    assert get_fishing_rod_entries(game) == [("Fishing Rod #1", 2, 1, "1000.0"), ("Fishing Rod #2", 1, 2, "10000000.0")]
+    assert player.fishing_rod.name == "Fishing Rod #2"
+    assert player.fishing_rod in player.get_fishing_rods_owned()
+
+    species_counts: dict = {template.name: count for template, count in player.aquarium.get_species_counts().items()}
+    assert species_counts == {"Pegaklesk": 2, "Sunup": 1, "Rutind": 1}
+    assert player.aquarium.exp_per_second == num("1000012000")
+    assert len(game.get_bodies_of_water()) == 2
+
+    # The migrated game is saved in the current save format without losing anything.
+    data: bytes = encode_game_data(game)
+    assert encode_game_data(decode_game_data(data)) == data
+
+
+def test_save_format_version_2_is_migrated():
+    game: Game = load_game_data(os.path.join(DATA_DIRECTORY, "save_format_version_2"))
+    entries: list = get_fishing_rod_entries(game)
+    assert sum(count for name, count, level, attack_power in entries) == 25
+    assert entries[0] == ("Fishing Rod #1", 3, 1, "1000.0")
+    assert game.player.fishing_rod.name == "Fishing Rod #5"
+    assert game.player.fishing_rod.level == 4
+    assert (game.rng.initial_seed, game.rng.words_drawn, game.rng.gauss_next) == (7, 1000, None)
+    assert game.last_played_time == datetime(2026, 1, 1, 12, 0, 0)
+
+    data: bytes = encode_game_data(game)
+    assert data[len(MAGIC)] == SAVE_FORMAT_VERSION
+    assert encode_game_data(decode_game_data(data)) == data
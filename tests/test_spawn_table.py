@@ -0,0 +1,106 @@
+"""
+This file contains the tests of the spawn tables of "Fishing Tycoon", which must draw sea creatures as often as their
+spawn weights say, and of the index finding the bodies of water unlocked at a level.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import math
+import random
+import pytest
+from catalog import get_catalog
+from fishing_tycoon import BodyOfWater, BodyOfWaterIndex, SpawnTable
+
+
+# Creating constants used throughout this file
+
+
+SAMPLES: int = 200000
+MAX_Z_SCORE: float = 4.0  # Larger differences from the expected number of draws are practically impossible
+
+
+# Creating static functions to be used throughout this file
+
+
+def get_z_scores(spawn_table, weights, seed):
+    # type: (SpawnTable, list, int) -> list
+    """
+    Draws SAMPLES indices from the spawn table and returns, for every index, the difference between the number of
+    times it was drawn and the number of times it is expected to be drawn, in standard deviations.
+    """
+    rng: random.Random = random.Random(seed)
+    counts: list = [0] * len(weights)
+    for i in range(SAMPLES):
+        counts[spawn_table.sample(rng)] += 1
+
+    res: list = []
+    for count, weight in zip(counts, weights):
+        probability: float = weight / sum(weights)
+        standard_deviation: float = math.sqrt(SAMPLES * probability * (1 - probability))
+        # An index drawn never or every time must not differ from the expected number of draws at all.
+        res.append((count - SAMPLES * probability) / standard_deviation if standard_deviation > 0 else
+                   count - SAMPLES * probability)
+    return res
+
+
+def create_body_of_water(name, minimum_player_level):
+    # type: (str, int) -> BodyOfWater
+    return BodyOfWater(name, minimum_player_level, get_catalog().sea_creatures[:2])
+
+
+# Creating tests
+
+
+@pytest.mark.parametrize("weights", [[5, 0, 1, 3, 1], [0.1, 0.7, 0.2], [1, 1, 1, 1], [0, 2], [7]])
+def test_sampled_frequencies_match_weights(weights):
+    z_scores: list = get_z_scores(SpawnTable(weights), weights, 2026)
+    assert max(abs(z_score) for z_score in z_scores) <= MAX_Z_SCORE, z_scores
+
+
+def test_equal_weights_draw_one_uniform_index():
+    spawn_table: SpawnTable = SpawnTable([3, 3, 3])
+    assert spawn_table.probabilities == [1.0, 1.0, 1.0]
+    assert spawn_table.aliases == [0, 1, 2]
+
+
+@pytest.mark.parametrize("weights", [[], [0, 0], [1, -1]])
+def test_invalid_weights_raise_value_error(weights):
+    with pytest.raises(ValueError):
+        SpawnTable(weights)
+
+
+def test_changing_sea_creatures_rebuilds_spawn_table():
+    sea_creatures: list = get_catalog().sea_creatures
+    body_of_water: BodyOfWater = BodyOfWater("Lake", 1, sea_creatures[:2])
+    assert isinstance(body_of_water.get_potential_sea_creatures(), tuple)
+    assert len(body_of_water.get_spawn_table()) == 2
+
+    # Only the second of three sea creatures can be spawned.
+    body_of_water.set_potential_sea_creatures(sea_creatures[:3], [0, 1, 0])
+    assert len(body_of_water.get_spawn_table()) == 3
+    rng: random.Random = random.Random(1)
+    assert {body_of_water.spawn_sea_creature(rng).name for i in range(100)} == {sea_creatures[1].name}
+
+    with pytest.raises(ValueError):
+        body_of_water.set_potential_sea_creatures(sea_creatures[:3], [1, 1])
+
+
+@pytest.mark.parametrize("player_level, unlocked_indices, next_unlock_level", [
+    (0, [], 1),
+    (1, [0], 3),
+    (2, [0], 3),
+    (3, [0, 4], 5),
+    (5, [0, 4, 1, 2], 10),
+    (9, [0, 4, 1, 2], 10),
+    (10, [0, 4, 1, 2, 3], None),
+    (1000, [0, 4, 1, 2, 3], None)
+])
+def test_body_of_water_index_at_unlock_levels(player_level, unlocked_indices, next_unlock_level):
+    # Bodies of water unlocked at the same level keep their order.
+    index: BodyOfWaterIndex = BodyOfWaterIndex([create_body_of_water(name, minimum_player_level) for
+                                                name, minimum_player_level in
+                                                [("A", 1), ("B", 5), ("C", 5), ("D", 10), ("E", 3)]])
+    assert index.count_unlocked(player_level) == len(unlocked_indices)
+    assert index.get_unlocked_indices(player_level) == unlocked_indices
+    assert index.get_next_unlock_level(player_level) == next_unlock_level
@@ -0,0 +1,81 @@
+"""
+This file contains the tests of the stats of players of "Fishing Tycoon", which are generated one line at a time and
+written in pages, with the aquarium either listed in full or summarised per species.
+Author: DtjiSoftwareDeveloper
+"""
+
+# Importing necessary libraries
+
+import io
+from numeric import num, set_numeric_backend
+from catalog import get_catalog
+from fishing_tycoon import Player, write_lines
+
+
+# Creating static functions to be used throughout this file
+
+
+def create_player():
+    # type: () -> Player
+    set_numeric_backend("mpmath")
+    sea_creatures: list = get_catalog().sea_creatures
+    player: Player = Player("Player")
+    player.aquarium.add_sea_creature(sea_creatures[0], 3)
+    player.aquarium.add_sea_creature(sea_creatures[1], 2)
+    return player
+
+
+# Creating tests
+
+
+def test_write_lines_asks_after_every_page(monkeypatch):
+    answers: list = ["", "Q"]
+    prompts: list = []
+
+    def fake_input(prompt):
+        prompts.append(prompt)
+        return answers.pop(0)
+
+    monkeypatch.setattr("builtins.input", fake_input)
+    stream: io.StringIO = io.StringIO()
+    write_lines((str(i) + "\n" for i in range(10)), stream, page_size=3)
+    # The player continued after the first page and stopped after the second one.
+    assert stream.getvalue() == "".join(str(i) + "\n" for i in range(6))
+    assert len(prompts) == 2
+
+
+def test_write_lines_without_pages_writes_everything(monkeypatch):
+    monkeypatch.setattr("builtins.input", None)  # Asking would fail.
+    stream: io.StringIO = io.StringIO()
+    write_lines((str(i) + "\n" for i in range(100)), stream)
+    assert stream.getvalue().count("\n") == 100
+
+    # A page ending exactly with the last line does not ask either.
+    stream = io.StringIO()
+    write_lines((str(i) + "\n" for i in range(3)), stream, page_size=3)
+    assert stream.getvalue().count("\n") == 3
+
+
+def test_aquarium_is_listed_or_summarised_per_species():
+    player: Player = create_player()
+    sea_creatures: list = get_catalog().sea_creatures
+    listed: str = "".join(player.iter_lines())
+    assert listed == str(player)
+    assert listed.count("Name: " + sea_creatures[0].name + "\n") == 3
+
+    summary: list = list(player.aquarium.iter_summary_lines())
+    assert summary[0].startswith(sea_creatures[0].name + ": 3 (EXP per second: " +
+                                 str(sea_creatures[0].exp_per_second * 3))
+    assert summary[1].startswith(sea_creatures[1].name + ": 2 ")
+    assert summary[-1] == "Total: 5 (EXP per second: " + str(player.aquarium.exp_per_second) + \
+        ", Coins per second: " + str(player.aquarium.coins_per_second) + ")\n"
+    assert "".join(player.iter_lines(summarise_aquarium=True)).endswith("".join(summary))
+
+
+def test_stats_start_with_the_given_header_lines():
+    player: Player = create_player()
+    header_lines: list = player.get_header_lines()
+    player.coins = num("1e9")  # e.g. by passive income while the stats are written
+    lines: list = list(player.iter_lines(header_lines=header_lines))
+    assert lines[:len(header_lines)] == header_lines
+    assert "Coins: " + str(num("0")) + "\n" in lines